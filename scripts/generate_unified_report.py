@@ -17,8 +17,11 @@ from io import BytesIO
 import base64
 from matplotlib.patches import Circle
 
-# Add the current directory to Python path
+# Add the current directory and the analysis framework (src/) to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from utils.data_utils import StatisticalAnalyzer
 
 # Load and process SPSS data
 print("🔄 Loading SPSS data and recreating analysis variables...")
@@ -35,9 +38,17 @@ roi_to_customer = correlation_matrix.loc['ROISCORE', 'CUSTSCORE']
 customer_to_building = correlation_matrix.loc['CUSTSCORE', 'BLDGAGE'] 
 roi_to_building = correlation_matrix.loc['ROISCORE', 'BLDGAGE']
 
-# Calculate R² values for SEM
-r2_customer = roi_to_customer**2
-r2_building = roi_to_building**2
+# Path model: Building Age -> ROI, and Building Age + ROI -> Customer Satisfaction
+sem_results = StatisticalAnalyzer.path_analysis(
+    analysis_data, {'ROISCORE': ['BLDGAGE'], 'CUSTSCORE': ['BLDGAGE', 'ROISCORE']})
+sem_paths = sem_results['coefficients'].set_index(['predictor', 'outcome'])['beta']
+beta_roi_to_customer = sem_paths[('ROISCORE', 'CUSTSCORE')]
+beta_building_to_customer = sem_paths[('BLDGAGE', 'CUSTSCORE')]
+beta_building_to_roi = sem_paths[('BLDGAGE', 'ROISCORE')]
+
+# Calculate R² values for SEM (explained variance of each structural equation)
+r2_customer = sem_results['r_squared']['CUSTSCORE']
+r2_building = sem_results['r_squared']['ROISCORE']
 
 # Perform normality tests
 sw = {}
@@ -46,22 +57,31 @@ for var in ['CUSTSCORE', 'ROISCORE', 'BLDGAGE']:
     sw[var] = {'statistic': statistic, 'p_value': p_value}
 
 # Perform t-tests (recreate the groups)
-# Corporate vs Franchise comparison
-corporate_custscore = analysis_data[analysis_data['SETTING'] == 1]['CUSTSCORE']
-franchise_custscore = analysis_data[analysis_data['SETTING'] == 2]['CUSTSCORE']
-
-# Levene's test for equal variances
-levene_stat, levene_p = stats.levene(corporate_custscore, franchise_custscore)
-equal_var = levene_p > 0.05
+# Corporate vs Franchise comparison (OWNERSHIP: 0 = Corporate, 1 = Franchise)
+corporate_custscore = analysis_data[analysis_data['OWNERSHIP'] == 0]['CUSTSCORE']
+franchise_custscore = analysis_data[analysis_data['OWNERSHIP'] == 1]['CUSTSCORE']
 
-# Independent t-test
-t_stat1, p_value1 = stats.ttest_ind(corporate_custscore, franchise_custscore, equal_var=equal_var)
+# Additional group comparison (split by median)
+median_roi = analysis_data['ROISCORE'].median()
+group1_custscore = analysis_data[analysis_data['ROISCORE'] <= median_roi]['CUSTSCORE']
+group2_custscore = analysis_data[analysis_data['ROISCORE'] > median_roi]['CUSTSCORE']
+group1_name = "Lower ROI"
+group2_name = "Higher ROI"
 
-# Cohen's d effect size
-pooled_std = np.sqrt(((len(corporate_custscore)-1)*corporate_custscore.var() + 
-                     (len(franchise_custscore)-1)*franchise_custscore.var()) / 
-                    (len(corporate_custscore) + len(franchise_custscore) - 2))
-cohens_d1 = (corporate_custscore.mean() - franchise_custscore.mean()) / pooled_std
+# Levene's test, independent t-test (equal variances decided by Levene) and
+# Cohen's d for both comparisons in one pass
+comparison_data = analysis_data.assign(
+    ROI_GROUP=analysis_data['ROISCORE'].gt(median_roi).map({False: 1, True: 2})
+    .where(analysis_data['ROISCORE'].notna()))
+group_tests = StatisticalAnalyzer.compare_groups(
+    comparison_data, ['CUSTSCORE'], ['OWNERSHIP', 'ROI_GROUP']).set_index(['group', 'level_1', 'level_2'])
+ownership_test = group_tests.loc[('OWNERSHIP', 0, 1)]
+roi_test = group_tests.loc[('ROI_GROUP', 1, 2)]
+
+levene_stat, levene_p = ownership_test['levene_statistic'], ownership_test['levene_p_value']
+equal_var = ownership_test['equal_variance']
+t_stat1, p_value1 = ownership_test['t_statistic'], ownership_test['p_value']
+cohens_d1 = ownership_test['cohens_d']
 
 # Effect size interpretation
 if abs(cohens_d1) < 0.2:
@@ -73,23 +93,10 @@ elif abs(cohens_d1) < 0.8:
 else:
     significance = "Large"
 
-# Additional group comparison (split by median)
-median_roi = analysis_data['ROISCORE'].median()
-group1_custscore = analysis_data[analysis_data['ROISCORE'] <= median_roi]['CUSTSCORE']
-group2_custscore = analysis_data[analysis_data['ROISCORE'] > median_roi]['CUSTSCORE']
-group1_name = "Lower ROI"
-group2_name = "Higher ROI"
-
-# T-test for ROI groups
-levene_stat2, levene_p2 = stats.levene(group1_custscore, group2_custscore)
-equal_var2 = levene_p2 > 0.05
-t_stat2, p_value2 = stats.ttest_ind(group1_custscore, group2_custscore, equal_var=equal_var2)
-
-# Cohen's d for ROI groups
-pooled_std2 = np.sqrt(((len(group1_custscore)-1)*group1_custscore.var() + 
-                      (len(group2_custscore)-1)*group2_custscore.var()) / 
-                     (len(group1_custscore) + len(group2_custscore) - 2))
-cohens_d2 = (group1_custscore.mean() - group2_custscore.mean()) / pooled_std2
+levene_stat2, levene_p2 = roi_test['levene_statistic'], roi_test['levene_p_value']
+equal_var2 = roi_test['equal_variance']
+t_stat2, p_value2 = roi_test['t_statistic'], roi_test['p_value']
+cohens_d2 = roi_test['cohens_d']
 
 print("✅ All analysis variables recreated successfully!")
 print(f"📊 Correlation matrix shape: {correlation_matrix.shape}")
@@ -183,23 +190,23 @@ def generate_unified_comprehensive_report():
         ax.add_patch(circle)
         ax.text(x, y, node, ha='center', va='center', fontsize=10, fontweight='bold', wrap=True)
     
-    # Draw paths with correlations
+    # Draw paths with standardized path coefficients
     # Building Age -> Customer Satisfaction
     ax.annotate('', xy=(0.72, 0.5), xytext=(0.28, 0.5),
                 arrowprops=dict(arrowstyle='->', lw=2, color='green'))
-    ax.text(0.5, 0.45, f'r = {customer_to_building:.3f}', ha='center', fontsize=12, 
+    ax.text(0.5, 0.45, f'β = {beta_building_to_customer:.3f}', ha='center', fontsize=12, 
             bbox=dict(boxstyle="round,pad=0.3", facecolor='lightgreen'))
     
     # ROI -> Customer Satisfaction  
     ax.annotate('', xy=(0.72, 0.58), xytext=(0.58, 0.72),
                 arrowprops=dict(arrowstyle='->', lw=3, color='blue'))
-    ax.text(0.65, 0.7, f'r = {roi_to_customer:.3f}', ha='center', fontsize=12,
+    ax.text(0.65, 0.7, f'β = {beta_roi_to_customer:.3f}', ha='center', fontsize=12,
             bbox=dict(boxstyle="round,pad=0.3", facecolor='lightblue'))
     
     # Building Age -> ROI
     ax.annotate('', xy=(0.42, 0.72), xytext=(0.28, 0.58),
                 arrowprops=dict(arrowstyle='->', lw=2, color='red', linestyle='--'))
-    ax.text(0.3, 0.7, f'r = {roi_to_building:.3f}', ha='center', fontsize=12,
+    ax.text(0.3, 0.7, f'β = {beta_building_to_roi:.3f}', ha='center', fontsize=12,
             bbox=dict(boxstyle="round,pad=0.3", facecolor='lightcoral'))
     
     ax.set_xlim(0, 1)
@@ -336,9 +343,9 @@ This multi-dimensional dashboard provides:
 - **ROI R²:** {r2_building:.3f} (explaining {r2_building*100:.1f}% of variance)
 
 ### Path Coefficients
-- **ROI → Customer Satisfaction:** β = {roi_to_customer:.3f} (Primary pathway)
-- **Building Age → Customer Satisfaction:** β = {customer_to_building:.3f} (Infrastructure effect)
-- **Building Age → ROI:** β = {roi_to_building:.3f} (Facility-performance relationship)
+- **ROI → Customer Satisfaction:** β = {beta_roi_to_customer:.3f} (Primary pathway)
+- **Building Age → Customer Satisfaction:** β = {beta_building_to_customer:.3f} (Infrastructure effect)
+- **Building Age → ROI:** β = {beta_building_to_roi:.3f} (Facility-performance relationship)
 
 ---
 
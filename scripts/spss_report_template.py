@@ -48,6 +48,9 @@ KEY_INSIGHTS_TEMPLATE = [
 
 # Path setup for standalone execution
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from utils.data_utils import StatisticalAnalyzer
 
 print(f"🔄 Loading SPSS data for {DATASET_NAME}...")
 
@@ -114,18 +117,17 @@ if GROUPING_VARIABLE in analysis_data.columns and OUTCOME_VARIABLE in analysis_d
         group1_data = analysis_data[analysis_data[GROUPING_VARIABLE] == group1_value][OUTCOME_VARIABLE]
         group2_data = analysis_data[analysis_data[GROUPING_VARIABLE] == group2_value][OUTCOME_VARIABLE]
         
-        # Test assumptions
-        levene_stat, levene_p = stats.levene(group1_data, group2_data)
-        equal_var = levene_p > 0.05
-        
-        # Perform t-test
-        t_stat, p_value = stats.ttest_ind(group1_data, group2_data, equal_var=equal_var)
+        # Levene's test, t-test (equal variances decided by Levene) and Cohen's d
+        pair_data = analysis_data[analysis_data[GROUPING_VARIABLE].isin([group1_value, group2_value])]
+        comparison = StatisticalAnalyzer.compare_groups(
+            pair_data, [OUTCOME_VARIABLE], GROUPING_VARIABLE).iloc[0]
+        # Comparisons are reported as lower level minus higher level
+        direction = 1 if comparison['level_1'] == group1_value else -1
         
-        # Calculate Cohen's d
-        pooled_std = np.sqrt(((len(group1_data)-1)*group1_data.var() + 
-                             (len(group2_data)-1)*group2_data.var()) / 
-                            (len(group1_data) + len(group2_data) - 2))
-        cohens_d = (group1_data.mean() - group2_data.mean()) / pooled_std
+        levene_stat, levene_p = comparison['levene_statistic'], comparison['levene_p_value']
+        equal_var = comparison['equal_variance']
+        t_stat, p_value = direction * comparison['t_statistic'], comparison['p_value']
+        cohens_d = direction * comparison['cohens_d']
         
         # Effect size interpretation
         def interpret_cohens_d(d):
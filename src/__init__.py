@@ -11,6 +11,8 @@ A comprehensive enterprise-grade data analysis framework providing:
 Components:
 - DataLoader: Enterprise data ingestion with metadata preservation
 - StatisticalAnalyzer: Advanced statistical analysis and validation
+- StreamingAnomalyDetector: Bounded-memory anomaly detection for live feeds
+- IncrementalCorrelation: Correlation matrices refreshed batch by batch
 - EnterpriseVisualizer: Professional visualization and dashboard creation
 """
 
@@ -19,10 +21,14 @@ __author__ = "Enterprise Data Analysis Team"
 
 # Import core components for easy access
 from .utils.data_utils import DataLoader, StatisticalAnalyzer
+from .utils.anomaly import StreamingAnomalyDetector
+from .utils.correlation import IncrementalCorrelation
 from .visualization.plot_utils import EnterpriseVisualizer
 
 __all__ = [
     'DataLoader',
     'StatisticalAnalyzer', 
+    'StreamingAnomalyDetector',
+    'IncrementalCorrelation',
     'EnterpriseVisualizer'
 ]
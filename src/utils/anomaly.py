@@ -0,0 +1,401 @@
+"""
+Anomaly Detection Utilities
+Robust (median/MAD based) anomaly screening kernels used by StatisticalAnalyzer
+"""
+
+import warnings
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .segments import factorize_groups, segment_medians
+
+# Iglewicz & Hoaglin modified z-score: 0.6745 * (x - median) / MAD
+MODIFIED_Z_CONSTANT = 0.6745
+DEFAULT_THRESHOLD = 3.5
+
+
+def robust_center_scale(values: np.ndarray, axis: int = 0) -> tuple:
+    """
+    Median and median absolute deviation along an axis, ignoring NaNs
+
+    Args:
+        values: Array of observations (NaN marks missing values)
+        axis: Axis holding the observations
+
+    Returns:
+        Tuple of (median, MAD) arrays with `axis` reduced
+    """
+    with warnings.catch_warnings():
+        # All-NaN columns legitimately produce NaN statistics
+        warnings.simplefilter('ignore', RuntimeWarning)
+        median = np.nanmedian(values, axis=axis, keepdims=True)
+        mad = np.nanmedian(np.abs(values - median), axis=axis, keepdims=True)
+    return np.squeeze(median, axis=axis), np.squeeze(mad, axis=axis)
+
+
+def modified_z_scores(values: np.ndarray,
+                      median: Union[float, np.ndarray],
+                      mad: Union[float, np.ndarray]) -> np.ndarray:
+    """
+    Modified z-scores for values given (broadcastable) median and MAD
+
+    Positions with a zero MAD score 0, matching detect_anomalies; NaN inputs
+    stay NaN.
+    """
+    mad = np.asarray(mad, dtype=float)
+    safe_mad = np.where(mad == 0, 1.0, mad)
+    scores = MODIFIED_Z_CONSTANT * (values - median) / safe_mad
+    return np.where((mad == 0) & ~np.isnan(values), 0.0, scores)
+
+
+def grouped_modified_z_scores(values: np.ndarray, codes: np.ndarray, n_groups: int) -> np.ndarray:
+    """
+    Modified z-scores relative to each row's own group
+
+    Group medians and MADs of every column come from two sorted segment
+    passes, so the cost is one lexsort per pass regardless of the number of
+    groups or columns.
+
+    Args:
+        values: 1-D or (n, columns) observations (NaNs are ignored)
+        codes: Group code per row (rows with negative codes score NaN)
+        n_groups: Number of groups
+
+    Returns:
+        Array of modified z-scores aligned with `values` (all NaN when no
+        row belongs to a group)
+    """
+    values = np.asarray(values, dtype=float)
+    if n_groups == 0:
+        return np.full(values.shape, np.nan)
+    in_group = (codes >= 0).reshape((-1,) + (1,) * (values.ndim - 1))
+    safe_codes = np.where(codes >= 0, codes, 0)
+    medians = segment_medians(values, codes, n_groups)[safe_codes]
+    mads = segment_medians(np.abs(values - medians), codes, n_groups)[safe_codes]
+    scores = modified_z_scores(values, medians, mads)
+    return np.where(in_group, scores, np.nan)
+
+
+def detect_anomalies_frame(data: pd.DataFrame,
+                           threshold: float = DEFAULT_THRESHOLD,
+                           return_labels: bool = False,
+                           group_by: Optional[Union[pd.Series, np.ndarray]] = None) -> Union[pd.DataFrame, Dict[str, pd.Index]]:
+    """
+    Column-wise modified z-score screening of a whole DataFrame
+
+    Medians and MADs for every column come from one partition-based
+    np.nanmedian call each, so thousands of variables are screened as a
+    single array operation.
+
+    Args:
+        data: DataFrame of numeric columns (missing values are ignored)
+        threshold: Absolute modified z-score above which a value is anomalous
+        return_labels: Return original index labels per column instead of a mask
+        group_by: Optional group key per row; values are then judged against
+            their own group's median and MAD
+
+    Returns:
+        Boolean DataFrame aligned with `data` (missing values are never
+        flagged), or a dict mapping each column to the index labels of its
+        anomalies
+    """
+    values = data.to_numpy(dtype=float)
+    if group_by is None:
+        median, mad = robust_center_scale(values, axis=0)
+        scores = modified_z_scores(values, median, mad)
+    else:
+        codes, groups = factorize_groups(group_by)
+        scores = grouped_modified_z_scores(values, codes, len(groups))
+    with np.errstate(invalid='ignore'):
+        mask = np.abs(scores) > threshold
+
+    if return_labels:
+        return {column: data.index[mask[:, j]] for j, column in enumerate(data.columns)}
+    return pd.DataFrame(mask, index=data.index, columns=data.columns)
+
+
+def _kth_absolute_deviation(window: List[float], center: float, k: int) -> float:
+    """
+    k-th smallest |x - center| (0-based) over a sorted window in O(log w)
+
+    Deviations below the split point increase leftwards and those above it
+    increase rightwards, so this is a k-th-of-two-sorted-sequences search.
+    """
+    split = bisect_left(window, center)
+    n_left, n_right = split, len(window) - split
+
+    def left(i: int) -> float:
+        return center - window[split - 1 - i]
+
+    def right(j: int) -> float:
+        return window[split + j] - center
+
+    lo, hi = max(0, k + 1 - n_right), min(k + 1, n_left)
+    while lo < hi:
+        i = (lo + hi) // 2
+        if left(i) < right(k - i):
+            lo = i + 1
+        else:
+            hi = i
+    taken_right = k + 1 - lo
+    candidates = []
+    if lo > 0:
+        candidates.append(left(lo - 1))
+    if taken_right > 0:
+        candidates.append(right(taken_right - 1))
+    return max(candidates)
+
+
+def _rolling_series_median_mad(values: np.ndarray, window: int, min_periods: int,
+                               medians: np.ndarray, mads: np.ndarray) -> None:
+    """
+    Fill trailing-window medians and MADs of one series in place
+
+    The window is kept as a sorted list updated with bisect/insort, so each
+    step costs an O(log w) search (plus a memmove for the insert/delete) and
+    the MAD is read off the sorted window in O(log w) instead of re-sorting.
+    """
+    sorted_window: List[float] = []
+    series = values.tolist()
+    for t, value in enumerate(series):
+        if value == value:
+            insort(sorted_window, value)
+        if t >= window:
+            leaving = series[t - window]
+            if leaving == leaving:
+                del sorted_window[bisect_left(sorted_window, leaving)]
+
+        m = len(sorted_window)
+        if m < min_periods or m == 0:
+            continue
+        half = m // 2
+        if m % 2:
+            center = sorted_window[half]
+            spread = _kth_absolute_deviation(sorted_window, center, half)
+        else:
+            center = (sorted_window[half - 1] + sorted_window[half]) / 2
+            spread = (_kth_absolute_deviation(sorted_window, center, half - 1) +
+                      _kth_absolute_deviation(sorted_window, center, half)) / 2
+        medians[t] = center
+        mads[t] = spread
+
+
+def rolling_median_mad(values: np.ndarray, window: int,
+                       min_periods: Optional[int] = None) -> tuple:
+    """
+    Trailing-window median and MAD for one series or many series at once
+
+    Each series keeps its window as a sorted list, so every step is
+    O(log w) rather than a fresh median of the whole window; all columns of
+    a 2-D input are handled in one call.
+
+    Args:
+        values: 1-D series or 2-D (time, columns) array (NaNs are skipped)
+        window: Number of trailing observations in each window
+        min_periods: Minimum non-missing values required (defaults to window)
+
+    Returns:
+        Tuple of (median, MAD) arrays shaped like `values`, NaN where the
+        window holds fewer than `min_periods` observations
+    """
+    if window < 1:
+        raise ValueError("window must be a positive integer")
+    min_periods = window if min_periods is None else max(1, min_periods)
+    values = np.asarray(values, dtype=float)
+    series = values.reshape(values.shape[0], -1)
+    medians = np.full(series.shape, np.nan)
+    mads = np.full(series.shape, np.nan)
+    for j in range(series.shape[1]):
+        _rolling_series_median_mad(series[:, j], window, min_periods, medians[:, j], mads[:, j])
+    return medians.reshape(values.shape), mads.reshape(values.shape)
+
+
+def detect_anomalies_rolling(data: Union[pd.Series, pd.DataFrame],
+                             window: int,
+                             threshold: float = DEFAULT_THRESHOLD,
+                             min_periods: Optional[int] = None) -> Union[pd.Series, pd.DataFrame]:
+    """
+    Flag values that are anomalous relative to their trailing window
+
+    Args:
+        data: Series, or DataFrame whose columns are screened as separate series
+        window: Number of trailing observations (including the current one)
+        threshold: Absolute modified z-score above which a value is anomalous
+        min_periods: Minimum non-missing values required (defaults to window)
+
+    Returns:
+        Boolean Series/DataFrame aligned with `data`
+    """
+    frame = data.to_frame() if isinstance(data, pd.Series) else data
+    values = frame.to_numpy(dtype=float)
+    median, mad = rolling_median_mad(values, window, min_periods)
+    scores = modified_z_scores(values, median, mad)
+    with np.errstate(invalid='ignore'):
+        mask = np.abs(scores) > threshold
+
+    if isinstance(data, pd.Series):
+        return pd.Series(mask[:, 0], index=data.index, name=data.name)
+    return pd.DataFrame(mask, index=data.index, columns=data.columns)
+
+
+class _MergingDigest:
+    """
+    Bounded-memory, mergeable quantile sketch (merging t-digest)
+
+    Centroids are re-clustered in one vectorized pass using the arcsine scale
+    function, so the sketch never holds more than about `compression / 2`
+    centroids and is small near the tails where resolution matters most.
+    Until more than `compression` values have been seen, every value is kept
+    as its own centroid and the median and MAD are exact.
+    """
+
+    def __init__(self, compression: float = 500.0):
+        self.compression = float(compression)
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min = np.inf
+        self.max = -np.inf
+
+    @property
+    def count(self) -> float:
+        return float(self.weights.sum())
+
+    @property
+    def exact(self) -> bool:
+        """True while the centroids are still the raw observed values"""
+        return self.count <= self.compression
+
+    def add(self, values: np.ndarray) -> None:
+        """Fold a batch of finite values into the sketch"""
+        if values.size == 0:
+            return
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self._compress(np.concatenate([self.means, values]),
+                       np.concatenate([self.weights, np.ones(values.size)]))
+
+    def merge(self, other: '_MergingDigest') -> None:
+        """Fold another sketch's centroids into this one"""
+        if other.weights.size == 0:
+            return
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress(np.concatenate([self.means, other.means]),
+                       np.concatenate([self.weights, other.weights]))
+
+    def _compress(self, means: np.ndarray, weights: np.ndarray) -> None:
+        order = np.argsort(means, kind='stable')
+        means, weights = means[order], weights[order]
+        if weights.sum() <= self.compression:
+            self.means, self.weights = means, weights
+            return
+        cumulative = np.cumsum(weights)
+        q_center = (cumulative - weights / 2) / cumulative[-1]
+        # k1 scale function: each output centroid spans one unit of k
+        k = self.compression / (2 * np.pi) * np.arcsin(2 * q_center - 1)
+        bucket = np.floor(k - k[0]).astype(np.int64)
+        merged_weights = np.bincount(bucket, weights=weights)
+        merged_sums = np.bincount(bucket, weights=weights * means)
+        keep = merged_weights > 0
+        self.weights = merged_weights[keep]
+        self.means = merged_sums[keep] / self.weights
+
+    def _knots(self) -> tuple:
+        """Piecewise-linear CDF knots (value, cumulative weight)"""
+        cumulative = np.cumsum(self.weights) - self.weights / 2
+        x = np.concatenate([[self.min], self.means, [self.max]])
+        y = np.concatenate([[0.0], cumulative, [self.count]])
+        return x, y
+
+    def cdf(self, x: Union[float, np.ndarray]) -> np.ndarray:
+        knot_x, knot_y = self._knots()
+        return np.interp(x, knot_x, knot_y) / self.count
+
+    def quantile(self, q: float) -> float:
+        if self.exact:
+            return float(np.quantile(self.means, q))
+        knot_x, knot_y = self._knots()
+        return float(np.interp(q * self.count, knot_y, knot_x))
+
+    def median_absolute_deviation(self, center: float) -> float:
+        """Solve F(center + d) - F(center - d) = 0.5 on the sketch's CDF"""
+        if self.exact:
+            return float(np.median(np.abs(self.means - center)))
+        knot_x, _ = self._knots()
+        # The mass within +/- d is piecewise linear in d with breakpoints at
+        # the knot distances, so the root is found by exact interpolation
+        breaks = np.unique(np.abs(knot_x - center))
+        mass = self.cdf(center + breaks) - self.cdf(center - breaks)
+        return float(np.interp(0.5, mass, breaks))
+
+
+class StreamingAnomalyDetector:
+    """
+    Modified z-score anomaly detection for unbounded streams
+
+    The running median and MAD are estimated from a bounded-memory quantile
+    sketch instead of the full history, and detectors fed by different
+    workers can be combined with merge(). Streams of up to `compression`
+    values are held exactly, so they score like detect_anomalies.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, compression: float = 500.0):
+        """
+        Initialize an empty detector
+
+        Args:
+            threshold: Absolute modified z-score above which a value is anomalous
+            compression: Sketch size/accuracy trade-off (roughly compression / 2 centroids)
+        """
+        self.threshold = threshold
+        self._digest = _MergingDigest(compression)
+
+    @property
+    def count(self) -> int:
+        """Number of values observed so far"""
+        return int(round(self._digest.count))
+
+    @property
+    def median(self) -> float:
+        """Running median estimate"""
+        if self.count == 0:
+            return float('nan')
+        return self._digest.quantile(0.5)
+
+    @property
+    def mad(self) -> float:
+        """Running median absolute deviation estimate"""
+        if self.count == 0:
+            return float('nan')
+        return self._digest.median_absolute_deviation(self.median)
+
+    def observe(self, values: Union[float, np.ndarray, pd.Series]) -> tuple:
+        """
+        Add a batch to the running state and score it
+
+        The batch is folded into the sketch before scoring, so (as with
+        detect_anomalies) each value is judged against a distribution that
+        includes it.
+
+        Args:
+            values: Scalar or 1-D batch of observations (NaNs are ignored)
+
+        Returns:
+            Tuple of (modified z-scores, boolean anomaly flags) for the batch
+        """
+        batch = np.atleast_1d(np.asarray(values, dtype=float))
+        self._digest.add(batch[np.isfinite(batch)])
+        if self.count == 0:
+            return np.full(batch.shape, np.nan), np.zeros(batch.shape, dtype=bool)
+        scores = modified_z_scores(batch, self.median, self.mad)
+        with np.errstate(invalid='ignore'):
+            flags = np.abs(scores) > self.threshold
+        return scores, flags
+
+    def merge(self, other: 'StreamingAnomalyDetector') -> 'StreamingAnomalyDetector':
+        """Combine another detector's state into this one (returns self)"""
+        self._digest.merge(other._digest)
+        return self
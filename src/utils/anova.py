@@ -0,0 +1,251 @@
+"""
+Analysis of Variance Utilities
+One-way, Welch and Tukey HSD tests computed from per-group summary statistics
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .segments import factorize_groups
+
+
+def group_summaries(values: np.ndarray, codes: np.ndarray,
+                    n_groups: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-group counts, means and sample variances with bincount
+
+    Each outcome is shifted by its overall mean before its three weighted
+    bincounts (count, sum, sum of squares), which keeps the one-pass
+    variance formula accurate. Missing values are dropped per outcome.
+
+    Args:
+        values: Outcome matrix of shape (n, p)
+        codes: Group code per row (negative codes are ignored)
+        n_groups: Number of groups
+
+    Returns:
+        Tuple of (counts, means, variances), each of shape (p, groups)
+    """
+    shape = (values.shape[1], n_groups)
+    counts, means, variances = np.zeros(shape), np.full(shape, np.nan), np.full(shape, np.nan)
+    for j in range(values.shape[1]):
+        column = values[:, j]
+        valid = (codes >= 0) & ~np.isnan(column)
+        if not valid.any():
+            continue
+        group, column = codes[valid], column[valid]
+        shift = column.mean()
+        column = column - shift
+        counts[j] = np.bincount(group, minlength=n_groups)
+        sums = np.bincount(group, weights=column, minlength=n_groups)
+        squares = np.bincount(group, weights=column * column, minlength=n_groups)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            means[j] = sums / counts[j] + shift
+            variances[j] = np.maximum(squares - sums * sums / counts[j], 0.0) / (counts[j] - 1)
+    return counts, means, variances
+
+
+def anova_from_summary(counts: np.ndarray, means: np.ndarray,
+                       variances: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Classic and Welch one-way ANOVA from group summary statistics
+
+    Arguments are (..., groups) arrays; leading axes (e.g. outcomes) are
+    tested independently. Groups with no observations are ignored.
+
+    Returns:
+        Dictionary of arrays: F, df_between, df_within, p_value, eta_squared,
+        omega_squared, welch_F, welch_df1, welch_df2, welch_p_value, mse
+    """
+    from scipy.stats import f as f_dist
+
+    counts = np.asarray(counts, dtype=float)
+    present = counts > 0
+    means = np.where(present, means, 0.0)
+    variances = np.where(counts > 1, variances, 0.0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        n = counts.sum(axis=-1)
+        k = present.sum(axis=-1)
+        grand_mean = (counts * means).sum(axis=-1) / n
+        ss_between = (counts * (means - grand_mean[..., None]) ** 2).sum(axis=-1)
+        ss_within = ((counts - 1).clip(min=0) * variances).sum(axis=-1)
+        df_between, df_within = k - 1, n - k
+        mse = ss_within / df_within
+        f_stat = (ss_between / df_between) / mse
+        valid = (df_between > 0) & (df_within > 0)
+        f_stat = np.where(valid, f_stat, np.nan)
+        p_values = f_dist.sf(f_stat, df_between, df_within)
+        ss_total = ss_between + ss_within
+        eta_squared = ss_between / ss_total
+        omega_squared = (ss_between - df_between * mse) / (ss_total + mse)
+
+        # Welch's heteroscedastic F (groups need n >= 2 and positive variance)
+        usable = (counts > 1) & (variances > 0)
+        weights = np.where(usable, counts / variances, 0.0)
+        total_weight = weights.sum(axis=-1)
+        weighted_mean = (weights * means).sum(axis=-1) / total_weight
+        k_welch = usable.sum(axis=-1)
+        spread = (weights * (means - weighted_mean[..., None]) ** 2).sum(axis=-1) / (k_welch - 1)
+        lam = np.where(usable, (1 - weights / total_weight[..., None]) ** 2 / (counts - 1), 0.0).sum(axis=-1)
+        welch_f = spread / (1 + 2 * (k_welch - 2) / (k_welch ** 2 - 1) * lam)
+        welch_df2 = (k_welch ** 2 - 1) / (3 * lam)
+        welch_f = np.where(k_welch > 1, welch_f, np.nan)
+        welch_p = f_dist.sf(welch_f, k_welch - 1, welch_df2)
+
+    return {
+        'F': f_stat,
+        'df_between': df_between,
+        'df_within': df_within,
+        'p_value': p_values,
+        'eta_squared': eta_squared,
+        'omega_squared': omega_squared,
+        'welch_F': welch_f,
+        'welch_df1': k_welch - 1,
+        'welch_df2': welch_df2,
+        'welch_p_value': welch_p,
+        'mse': mse
+    }
+
+
+def tukey_hsd_from_summary(counts: np.ndarray, means: np.ndarray, mse: np.ndarray,
+                           df_within: np.ndarray, confidence_level: float = 0.95) -> Dict[str, np.ndarray]:
+    """
+    Tukey-Kramer HSD comparisons of every pair of groups
+
+    The studentized range p-value needs one numerical integration per
+    comparison, so this dominates the cost for many outcomes; critical
+    values are computed once per distinct (groups, df) combination.
+
+    Args:
+        counts: (p, groups) group sizes
+        means: (p, groups) group means
+        mse: (p,) ANOVA mean squared error
+        df_within: (p,) error degrees of freedom
+        confidence_level: Family-wise coverage of the simultaneous intervals
+
+    Returns:
+        Dictionary with 'first'/'second' group indices of each pair and (p, pairs)
+        arrays of mean differences, their standard errors, studentized range
+        q statistics, family-wise adjusted p-values and interval bounds
+    """
+    from scipy.stats import studentized_range
+
+    counts = np.asarray(counts, dtype=float)
+    first, second = np.triu_indices(counts.shape[-1], k=1)
+    k = (counts > 0).sum(axis=-1)[:, None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        difference = means[:, first] - means[:, second]
+        standard_error = np.sqrt(mse[:, None] / 2 * (1 / counts[:, first] + 1 / counts[:, second]))
+        q = np.abs(difference) / standard_error
+    df = np.broadcast_to(df_within[:, None], q.shape)
+    k = np.broadcast_to(k, q.shape)
+    testable = np.isfinite(q) & (k >= 2) & (df > 0)
+
+    p_values = np.full(q.shape, np.nan)
+    critical = np.full(q.shape, np.nan)
+    if testable.any():
+        p_values[testable] = studentized_range.sf(q[testable], k[testable], df[testable])
+        # Critical values only depend on (k, df), usually shared by all outcomes
+        pairs = np.stack([k[testable], df[testable]], axis=1)
+        unique, inverse = np.unique(pairs, axis=0, return_inverse=True)
+        quantiles = studentized_range.ppf(confidence_level, unique[:, 0], unique[:, 1])
+        critical[testable] = quantiles[inverse.ravel()]
+    margin = critical * standard_error
+    return {
+        'first': first,
+        'second': second,
+        'mean_difference': difference,
+        'standard_error': standard_error * np.sqrt(2),
+        'q_statistic': q,
+        'p_value': np.clip(p_values, 0.0, 1.0),
+        'ci_low': difference - margin,
+        'ci_high': difference + margin
+    }
+
+
+def one_way_anova(counts: np.ndarray, means: np.ndarray, variances: np.ndarray,
+                  outcomes: List, levels: pd.Index, post_hoc: bool = True,
+                  confidence_level: float = 0.95, alpha: float = 0.05) -> Dict[str, pd.DataFrame]:
+    """
+    ANOVA tables (and optional Tukey HSD) for many outcomes from summaries
+
+    Args:
+        counts, means, variances: (p, groups) summary statistics
+        outcomes: Outcome labels (length p)
+        levels: Group labels (length groups)
+        post_hoc: Also run Tukey HSD on every pair of groups
+        confidence_level: Coverage of the Tukey simultaneous intervals
+        alpha: Significance level for the decisions
+
+    Returns:
+        Dictionary with an 'anova' DataFrame indexed by outcome and, with
+        post_hoc, a long 'tukey_hsd' DataFrame
+    """
+    tables = anova_from_summary(counts, means, variances)
+    anova = pd.DataFrame({name: values for name, values in tables.items() if name != 'mse'},
+                         index=pd.Index(outcomes, name='outcome'))
+    anova['significant'] = anova['p_value'] < alpha
+    anova['welch_significant'] = anova['welch_p_value'] < alpha
+    results = {'anova': anova}
+
+    if post_hoc:
+        tukey = tukey_hsd_from_summary(counts, means, tables['mse'], tables['df_within'], confidence_level)
+        n_pairs = tukey['first'].size
+        results['tukey_hsd'] = pd.DataFrame({
+            'outcome': np.repeat(outcomes, n_pairs),
+            'level_1': np.tile(levels[tukey['first']], len(outcomes)),
+            'level_2': np.tile(levels[tukey['second']], len(outcomes)),
+            'mean_difference': tukey['mean_difference'].ravel(),
+            'standard_error': tukey['standard_error'].ravel(),
+            'q_statistic': tukey['q_statistic'].ravel(),
+            'p_value': tukey['p_value'].ravel(),
+            'ci_low': tukey['ci_low'].ravel(),
+            'ci_high': tukey['ci_high'].ravel(),
+            'significant': (tukey['p_value'] < alpha).ravel()
+        })
+    return results
+
+
+def one_way_anova_frame(data: pd.DataFrame, outcomes: List[str], group: str,
+                        post_hoc: bool = True, confidence_level: float = 0.95,
+                        alpha: float = 0.05) -> Dict[str, pd.DataFrame]:
+    """one_way_anova on raw data: factorize the group once, then bincount summaries"""
+    codes, levels = factorize_groups(data[group])
+    counts, means, variances = group_summaries(data[outcomes].to_numpy(dtype=float), codes, len(levels))
+    results = one_way_anova(counts, means, variances, outcomes, levels,
+                            post_hoc=post_hoc, confidence_level=confidence_level, alpha=alpha)
+    results['group_statistics'] = summary_frame(counts, means, variances, outcomes, levels)
+    return results
+
+
+def summary_frame(counts: np.ndarray, means: np.ndarray, variances: np.ndarray,
+                  outcomes: List, levels: pd.Index) -> pd.DataFrame:
+    """Long (outcome, level) table of count, mean and variance"""
+    index = pd.MultiIndex.from_product([outcomes, levels], names=['outcome', 'level'])
+    return pd.DataFrame({'count': counts.ravel().astype(np.int64),
+                         'mean': means.ravel(),
+                         'var': variances.ravel()}, index=index)
+
+
+def parse_summary(summary: pd.DataFrame,
+                  outcomes: Optional[List] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List, pd.Index]:
+    """
+    Arrays from a pre-aggregated (outcome, level) summary with count/mean/var columns
+
+    A summary indexed by level only is treated as a single outcome.
+    """
+    if not isinstance(summary.index, pd.MultiIndex):
+        summary = pd.concat({'value': summary}, names=['outcome'])
+    if outcomes is None:
+        outcomes = summary.index.get_level_values(0).unique().tolist()
+    levels = summary.index.get_level_values(1).unique().sort_values()
+    full = pd.MultiIndex.from_product([outcomes, levels])
+    summary = summary.reindex(full)
+    shape = (len(outcomes), len(levels))
+    counts = summary['count'].fillna(0).to_numpy(dtype=float).reshape(shape)
+    means = summary['mean'].to_numpy(dtype=float).reshape(shape)
+    variances = summary['var'].to_numpy(dtype=float).reshape(shape)
+    return counts, means, variances, outcomes, levels
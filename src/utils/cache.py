@@ -0,0 +1,237 @@
+"""
+Result Caching Utilities
+Opt-in memoization of analysis results keyed by a content fingerprint of the input data
+"""
+
+import copy
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+_MISSING = object()
+
+# Salt for every key; bump when the key layout or fingerprint changes
+KEY_FORMAT_VERSION = 1
+
+
+def fingerprint(data: Union[pd.DataFrame, pd.Series], columns: Optional[List] = None) -> str:
+    """
+    Content hash of a DataFrame (or selected columns of it)
+
+    Values are hashed row-wise with pd.util.hash_pandas_object, then combined
+    with the column names, dtypes and index into one digest, so renamed or
+    retyped columns never collide with the original.
+
+    Args:
+        data: DataFrame or Series to fingerprint
+        columns: Restrict the hash to these columns (default: all)
+
+    Returns:
+        Hex digest
+    """
+    if columns is not None and isinstance(data, pd.DataFrame):
+        data = data[[column for column in dict.fromkeys(columns) if column in data.columns]]
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(pd.util.hash_pandas_object(data, index=True).to_numpy()).tobytes())
+    if isinstance(data, pd.DataFrame):
+        digest.update(repr([(str(name), str(dtype)) for name, dtype in data.dtypes.items()]).encode())
+    else:
+        digest.update(repr((str(data.name), str(data.dtype))).encode())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Two-tier LRU cache of analysis results
+
+    Entries live in an in-memory LRU bounded by max_entries; with a
+    directory, every entry is also pickled to disk, so results survive
+    eviction and interpreter restarts. Values are deep-copied on the way in
+    and out, so callers can modify returned results freely.
+
+    The on-disk tier is read with pickle.load, which can execute arbitrary
+    code: only point it at a directory that no untrusted user can write to.
+    """
+
+    def __init__(self, max_entries: int = 128, directory: Optional[Union[str, Path]] = None):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries: Maximum number of results held in memory
+            directory: Optional directory for the on-disk tier (must be
+                trusted - its files are unpickled)
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.directory = Path(directory) if directory is not None else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pkl"
+
+    def get(self, key: str) -> Any:
+        """Cached value for key, or the module's _MISSING sentinel"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(self._entries[key])
+
+        if self.directory is not None:
+            try:
+                with open(self._path(key), 'rb') as handle:
+                    value = pickle.load(handle)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                value = _MISSING
+            if value is not _MISSING:
+                with self._lock:
+                    self.disk_hits += 1
+                    self._remember(key, value)
+                return copy.deepcopy(value)
+
+        with self._lock:
+            self.misses += 1
+        return _MISSING
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a value in memory and, when configured, on disk"""
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._remember(key, value)
+        if self.directory is not None:
+            # Write then rename, so readers never see a partial file
+            temporary = self._path(key).with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(temporary, 'wb') as handle:
+                pickle.dump(value, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, self._path(key))
+
+    def _remember(self, key: str, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self, disk: bool = True) -> None:
+        """Drop all entries (including the on-disk tier unless disk=False) and reset counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.disk_hits = self.misses = 0
+        if disk and self.directory is not None:
+            for path in self.directory.glob('*.pkl'):
+                path.unlink(missing_ok=True)
+
+    def info(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'directory': str(self.directory) if self.directory is not None else None
+            }
+
+
+_active_cache: Optional[ResultCache] = None
+
+
+def enable(max_entries: int = 128, directory: Optional[Union[str, Path]] = None) -> ResultCache:
+    """
+    Install a new process-wide cache for memoized functions
+
+    The directory, if given, must be trusted: its entries are unpickled.
+    """
+    global _active_cache
+    _active_cache = ResultCache(max_entries=max_entries, directory=directory)
+    return _active_cache
+
+
+def disable() -> None:
+    """Remove the process-wide cache; memoized functions compute every call again"""
+    global _active_cache
+    _active_cache = None
+
+
+def active_cache() -> Optional[ResultCache]:
+    return _active_cache
+
+
+def _key_value(value: Any, columns: Optional[List]) -> Any:
+    """Hashable stand-in for an argument: data frames are replaced by their fingerprint"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return ('frame', fingerprint(value, columns))
+    if isinstance(value, np.ndarray):
+        return ('array', value.dtype.str, value.shape, hashlib.blake2b(
+            np.ascontiguousarray(value).tobytes(), digest_size=16).hexdigest())
+    return value
+
+
+def memoized(columns: Optional[Callable[[Dict[str, Any]], Optional[List]]] = None,
+             skip: Optional[Callable[[Dict[str, Any]], bool]] = None,
+             version: Union[int, str] = 1) -> Callable:
+    """
+    Decorator that caches a function's results in the active ResultCache
+
+    Does nothing until enable() is called. The key combines the function
+    name and version, a fingerprint of every DataFrame argument and the
+    remaining arguments; calls whose arguments cannot be pickled are not
+    cached.
+
+    Args:
+        columns: Callable(bound arguments) returning the columns the call
+            reads, so unrelated columns do not affect the key (None: all)
+        skip: Callable(bound arguments) returning True for calls that must
+            not be cached (e.g. unseeded random resampling)
+        version: Bump whenever the function's results change, so entries
+            persisted on disk by earlier code are no longer returned
+    """
+    def decorator(function: Callable) -> Callable:
+        signature = inspect.signature(function)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            cache = _active_cache
+            if cache is None:
+                return function(*args, **kwargs)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+            if skip is not None and skip(arguments):
+                return function(*args, **kwargs)
+
+            used = columns(arguments) if columns is not None else None
+            parts = (KEY_FORMAT_VERSION, function.__module__, function.__qualname__, version,
+                     tuple((name, _key_value(value, used)) for name, value in arguments.items()))
+            try:
+                key = hashlib.blake2b(pickle.dumps(parts, protocol=4), digest_size=20).hexdigest()
+            except (pickle.PicklingError, TypeError, AttributeError):
+                return function(*args, **kwargs)
+
+            result = cache.get(key)
+            if result is _MISSING:
+                result = function(*args, **kwargs)
+                cache.put(key, result)
+            return result
+
+        return wrapper
+    return decorator
@@ -0,0 +1,251 @@
+"""
+Contingency Table Utilities
+Chi-square tests of independence built on factorized integer codes
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .segments import factorize_groups
+
+
+def contingency_table(codes1: np.ndarray, n1: int,
+                      codes2: np.ndarray, n2: int) -> np.ndarray:
+    """
+    Dense (n1, n2) table of pair counts with a single bincount
+
+    Rows where either code is missing (negative) are skipped.
+    """
+    valid = (codes1 >= 0) & (codes2 >= 0)
+    combined = codes1[valid] * n2 + codes2[valid]
+    return np.bincount(combined, minlength=n1 * n2).reshape(n1, n2)
+
+
+def chi_square_statistics(table: np.ndarray, yates: bool = True) -> Tuple[float, int, float]:
+    """
+    Pearson chi-square statistic of a two-way table
+
+    Empty rows and columns are dropped first, as pd.crosstab would never
+    create them. Yates' continuity correction is applied when dof = 1.
+
+    Returns:
+        Tuple of (chi2, dof, uncorrected chi2) - the last one feeds Cramer's V
+    """
+    table = table[table.sum(axis=1) > 0][:, table.sum(axis=0) > 0].astype(float)
+    rows, cols = table.shape
+    dof = (rows - 1) * (cols - 1)
+    if dof <= 0:
+        return 0.0, 0, 0.0
+    expected = np.outer(table.sum(axis=1), table.sum(axis=0)) / table.sum()
+    difference = table - expected
+    raw = float(np.sum(difference ** 2 / expected))
+    if yates and dof == 1:
+        difference = np.sign(difference) * np.maximum(np.abs(difference) - 0.5, 0.0)
+        return float(np.sum(difference ** 2 / expected)), dof, raw
+    return raw, dof, raw
+
+
+def cramers_v(chi2: np.ndarray, n: np.ndarray, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    """Cramer's V from the uncorrected chi-square and table dimensions"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.sqrt(chi2 / (n * (np.minimum(rows, cols) - 1)))
+
+
+class ExpectedFrequencies:
+    """
+    Expected cell counts under independence, computed on demand
+
+    Only the row and column totals are stored; cells are produced from their
+    outer product when indexed, and the full matrix is materialized only by
+    to_array()/to_frame() (or np.asarray).
+    """
+
+    def __init__(self, row_totals: np.ndarray, col_totals: np.ndarray,
+                 index: Optional[pd.Index] = None, columns: Optional[pd.Index] = None):
+        self.row_totals = np.asarray(row_totals, dtype=float)
+        self.col_totals = np.asarray(col_totals, dtype=float)
+        self.total = float(self.row_totals.sum())
+        self.index = index
+        self.columns = columns
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.row_totals.size, self.col_totals.size
+
+    def __getitem__(self, key):
+        rows, cols = key if isinstance(key, tuple) else (key, slice(None))
+        return np.multiply.outer(self.row_totals[rows], self.col_totals[cols]) / self.total
+
+    def to_array(self) -> np.ndarray:
+        return np.outer(self.row_totals, self.col_totals) / self.total
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.to_array(), index=self.index, columns=self.columns)
+
+    def __array__(self, dtype=None, copy=None):
+        array = self.to_array()
+        return array if dtype is None else array.astype(dtype)
+
+    def __repr__(self) -> str:
+        return f"ExpectedFrequencies(shape={self.shape}, total={self.total:g})"
+
+
+def sparse_contingency_table(codes1: np.ndarray, n1: int,
+                             codes2: np.ndarray, n2: int):
+    """
+    CSR table of pair counts; only observed combinations are stored
+
+    Rows where either code is missing (negative) are skipped.
+    """
+    from scipy import sparse
+
+    valid = (codes1 >= 0) & (codes2 >= 0)
+    ones = np.ones(int(valid.sum()))
+    return sparse.coo_matrix((ones, (codes1[valid], codes2[valid])), shape=(n1, n2)).tocsr()
+
+
+def sparse_chi_square(table, yates: bool = True,
+                      index: Optional[pd.Index] = None,
+                      columns: Optional[pd.Index] = None) -> Tuple[float, int, ExpectedFrequencies]:
+    """
+    Pearson chi-square of a sparse table from its non-zero cells and marginals
+
+    Uses sum((O - E)^2 / E) = sum(O^2 / E) - N, where only non-zero O
+    contribute to the first sum, so no dense (rows, cols) array is built.
+    Empty rows and columns are dropped, as pd.crosstab would never create them.
+
+    Returns:
+        Tuple of (chi2, dof, lazily evaluated expected frequencies)
+    """
+    row_totals = np.asarray(table.sum(axis=1)).ravel()
+    col_totals = np.asarray(table.sum(axis=0)).ravel()
+    kept_rows, kept_cols = np.flatnonzero(row_totals), np.flatnonzero(col_totals)
+    table = table[kept_rows][:, kept_cols].tocoo()
+    row_totals, col_totals = row_totals[kept_rows], col_totals[kept_cols]
+    expected = ExpectedFrequencies(row_totals, col_totals,
+                                   None if index is None else index[kept_rows],
+                                   None if columns is None else columns[kept_cols])
+
+    dof = (kept_rows.size - 1) * (kept_cols.size - 1)
+    if dof <= 0:
+        return 0.0, 0, expected
+    if dof == 1:
+        statistic, _, _ = chi_square_statistics(table.toarray(), yates)
+        return statistic, dof, expected
+    cell_expected = row_totals[table.row] * col_totals[table.col] / expected.total
+    return float(np.sum(table.data ** 2 / cell_expected) - expected.total), dof, expected
+
+
+def _chi_square_against(codes: np.ndarray, levels: int, partners: np.ndarray,
+                        partner_levels: np.ndarray, yates: bool) -> Tuple[np.ndarray, ...]:
+    """
+    Chi-square statistics of one factorized column against several others
+
+    All tables are stacked in one flat array: partner k owns the cells
+    offsets[k] + row * partner_levels[k] + col, so a single bincount fills
+    every table, and the marginals and per-table sums are further bincounts
+    over the same layout.
+
+    Args:
+        codes: (n,) codes of the column (negative = missing)
+        levels: Number of levels of the column
+        partners: (n, m) codes of the partner columns
+        partner_levels: (m,) number of levels of each partner
+        yates: Apply Yates' continuity correction to 2x2 tables
+
+    Returns:
+        Tuple of (chi2, dof, uncorrected chi2, n, rows, cols) arrays of
+        shape (m,); rows and cols count the non-empty levels of each table
+    """
+    m = partners.shape[1]
+    sizes = levels * partner_levels
+    offsets = np.concatenate([[0], np.cumsum(sizes)])
+    valid = (codes >= 0)[:, None] & (partners >= 0)
+    cells = (offsets[:-1] + codes[:, None] * partner_levels + partners)[valid]
+    observed = np.bincount(cells, minlength=offsets[-1]).astype(float)
+
+    table = np.repeat(np.arange(m), sizes)
+    position = np.arange(offsets[-1]) - offsets[table]
+    row = table * levels + position // np.maximum(partner_levels[table], 1)
+    col_offsets = np.concatenate([[0], np.cumsum(partner_levels)])
+    col = col_offsets[table] + position % np.maximum(partner_levels[table], 1)
+
+    row_totals = np.bincount(row, weights=observed, minlength=m * levels)
+    col_totals = np.bincount(col, weights=observed, minlength=col_offsets[-1])
+    n = np.bincount(table, weights=observed, minlength=m)
+    rows = np.count_nonzero(row_totals.reshape(m, levels) > 0, axis=1)
+    cols = np.bincount(np.repeat(np.arange(m), partner_levels), weights=col_totals > 0, minlength=m)
+    dof = np.where((rows > 1) & (cols > 1), (rows - 1) * (cols - 1), 0).astype(np.int64)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        expected = row_totals[row] * col_totals[col] / n[table]
+        difference = observed - expected
+        present = expected > 0
+        raw = np.bincount(table, weights=np.where(present, difference ** 2 / expected, 0.0), minlength=m)
+        corrected = np.maximum(np.abs(difference) - 0.5, 0.0)
+        continuity = np.bincount(table, weights=np.where(present, corrected ** 2 / expected, 0.0), minlength=m)
+    raw = np.where(dof > 0, raw, 0.0)
+    chi2 = np.where(yates & (dof == 1), continuity, raw)
+    return chi2, dof, raw, n.astype(np.int64), rows, cols
+
+
+def chi_square_matrix(data: pd.DataFrame,
+                      columns: List[str],
+                      yates: bool = True,
+                      max_block_elements: int = 2 ** 24) -> Dict[str, np.ndarray]:
+    """
+    Chi-square tests of independence for every pair of categorical columns
+
+    Every column is factorized once to dense codes. Each column is then
+    tested against all later columns at once: their tables are stacked with
+    per-pair offsets and filled by a single bincount, so the work per column
+    is a handful of array passes rather than one Python call per pair.
+
+    Args:
+        data: DataFrame containing the categorical columns
+        columns: Columns to test against each other
+        yates: Apply Yates' continuity correction to 2x2 tables
+        max_block_elements: Cap on rows x partner columns (and on stacked
+            table cells) processed per block
+
+    Returns:
+        Dictionary of (p, p) arrays: 'chi2', 'dof', 'p_value', 'cramers_v'
+        and 'n' (pairs observed together); diagonals hold NaN (V = 1)
+    """
+    from scipy.stats import chi2 as chi2_dist
+
+    encoded = [factorize_groups(data[column]) for column in columns]
+    p = len(columns)
+    codes = np.column_stack([code for code, _ in encoded]) if p else np.empty((len(data), 0), dtype=np.int64)
+    levels = np.array([len(labels) for _, labels in encoded], dtype=np.int64)
+
+    chi2 = np.full((p, p), np.nan)
+    dof = np.zeros((p, p), dtype=np.int64)
+    raw = np.full((p, p), np.nan)
+    n = np.zeros((p, p), dtype=np.int64)
+    rows = np.zeros((p, p))
+    cols = np.zeros((p, p))
+    for i in range(p):
+        start = i + 1
+        while start < p:
+            # Grow the block while rows x partners and the stacked cells fit the cap
+            cells = np.cumsum(levels[i] * levels[start:])
+            width = max(1, min(max_block_elements // max(len(data), 1),
+                               int(np.searchsorted(cells, max_block_elements, side='right'))))
+            stop = min(start + width, p)
+            results = _chi_square_against(codes[:, i], int(levels[i]), codes[:, start:stop],
+                                          levels[start:stop], yates)
+            for target, value in zip((chi2, dof, raw, n, rows, cols), results):
+                target[i, start:stop] = value
+                target[start:stop, i] = value
+            start = stop
+
+    p_values = np.where(dof > 0, chi2_dist.sf(chi2, np.maximum(dof, 1)), 1.0)
+    p_values[np.isnan(chi2)] = np.nan
+    v = np.where(dof > 0, cramers_v(raw, n, rows, cols), 0.0)
+    v[np.isnan(chi2)] = np.nan
+    np.fill_diagonal(v, 1.0)
+    np.fill_diagonal(n, np.count_nonzero(codes >= 0, axis=0))
+    return {'chi2': chi2, 'dof': dof, 'p_value': p_values, 'cramers_v': v, 'n': n}
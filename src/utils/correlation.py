@@ -0,0 +1,874 @@
+"""
+Correlation Utilities
+Pairwise-complete correlation kernels built on masked matrix products
+"""
+
+import heapq
+import os
+import tempfile
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+CORRELATION_METHODS = ['pearson', 'spearman', 'kendall']
+
+
+def _check_method(method: str) -> None:
+    if method not in CORRELATION_METHODS:
+        raise ValueError(f"method must be one of {CORRELATION_METHODS}")
+
+
+def prepare_masked(data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Column-centered, zero-filled values and the matching non-null mask
+
+    Centering by the column means keeps the sums of squares and cross
+    products small, so the single-pass moment formulas stay accurate.
+
+    Args:
+        data: DataFrame of numeric columns
+
+    Returns:
+        Tuple of (values, mask) float arrays of shape (n, p)
+    """
+    values = data.to_numpy(dtype=float)
+    mask = ~np.isnan(values)
+    counts = mask.sum(axis=0)
+    means = np.divide(np.where(mask, values, 0.0).sum(axis=0), counts,
+                      out=np.zeros(values.shape[1]), where=counts > 0)
+    values = np.where(mask, values - means, 0.0)
+    return values, mask.astype(float)
+
+
+def masked_moments(XI: np.ndarray, MI: np.ndarray,
+                   XJ: np.ndarray, MJ: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    Pairwise-complete moment sums between two column blocks
+
+    Every statistic is a single matrix product over zero-filled values and
+    their masks, so all pairs share the same BLAS calls.
+
+    Returns:
+        Tuple (N, SI, SJ, SII, SJJ, SIJ) of (a, b) matrices: pair counts, sums
+        of each side's values, sums of squares and cross products, all over
+        the rows where both columns of the pair are observed
+    """
+    return (
+        MI.T @ MJ,
+        XI.T @ MJ,
+        MI.T @ XJ,
+        (XI * XI).T @ MJ,
+        MI.T @ (XJ * XJ),
+        XI.T @ XJ,
+    )
+
+
+def moments_to_correlation(N: np.ndarray, SI: np.ndarray, SJ: np.ndarray,
+                           SII: np.ndarray, SJJ: np.ndarray, SIJ: np.ndarray) -> np.ndarray:
+    """Pearson correlations from pairwise-complete moment sums (NaN if undefined)"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        covariance = SIJ - SI * SJ / N
+        variance_i = SII - SI * SI / N
+        variance_j = SJJ - SJ * SJ / N
+        r = covariance / np.sqrt(variance_i * variance_j)
+    r[(variance_i <= 0) | (variance_j <= 0) | (N < 2)] = np.nan
+    return np.clip(r, -1.0, 1.0)
+
+
+def correlation_p_values(r: np.ndarray, n: np.ndarray) -> np.ndarray:
+    """
+    Two-sided p-values for Pearson correlations via the t-distribution
+
+    Args:
+        r: Correlation coefficients
+        n: Number of paired observations behind each coefficient
+
+    Returns:
+        Array of p-values (NaN where fewer than 3 pairs are available)
+    """
+    from scipy.stats import t as t_dist
+
+    r = np.asarray(r, dtype=float)
+    dof = np.asarray(n, dtype=float) - 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t_stat = r * np.sqrt(dof / ((1 - r) * (1 + r)))
+        p_values = 2 * t_dist.sf(np.abs(t_stat), dof)
+    p_values = np.where(np.abs(r) == 1, 0.0, p_values)
+    return np.where(dof > 0, p_values, np.nan)
+
+
+def correlate_with_target(data: pd.DataFrame, features: list, target: str,
+                          method: str = 'pearson') -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pairwise-complete correlations of many features with one target
+
+    Args:
+        data: DataFrame containing features and target
+        features: Feature column names
+        target: Target column name
+        method: 'pearson', 'spearman' or 'kendall'
+
+    Returns:
+        Tuple of (r, n, p_value) arrays aligned with `features`
+    """
+    _check_method(method)
+    subset = data[list(features) + [target]]
+    if method == 'kendall':
+        y = subset[target].to_numpy(dtype=float)
+        return kendall_tau_b_batch(y, subset[list(features)].to_numpy(dtype=float))
+    if method == 'spearman':
+        y = subset[target].to_numpy(dtype=float)
+        r, n = spearman_against(y, subset[list(features)].to_numpy(dtype=float))
+        return r, n, correlation_p_values(r, n)
+    values, mask = prepare_masked(subset)
+    moments = masked_moments(values[:, :-1], mask[:, :-1], values[:, -1:], mask[:, -1:])
+    r = moments_to_correlation(*moments)[:, 0]
+    n = moments[0][:, 0]
+    return r, n, correlation_p_values(r, n)
+
+
+def pairwise_correlation_matrix(data: pd.DataFrame, min_periods: int = 1) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pairwise-complete Pearson correlation matrix with per-pair n and p-values
+
+    Equivalent to DataFrame.corr(min_periods=...) but computed with six
+    matrix products instead of a per-pair loop.
+
+    Args:
+        data: DataFrame of numeric columns
+        min_periods: Minimum paired observations required for a coefficient
+
+    Returns:
+        Tuple of (r, n, p_value) arrays of shape (p, p)
+    """
+    values, mask = prepare_masked(data)
+    moments = masked_moments(values, mask, values, mask)
+    r = moments_to_correlation(*moments)
+    n = moments[0]
+    r[n < min_periods] = np.nan
+    return r, n, correlation_p_values(r, n)
+
+
+def rank_columns(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Tie-averaged ranks of every column in one vectorized call
+
+    Missing values stay missing and each column is ranked over its own
+    observed values. Pearson's r on these ranks is Spearman's rho only for
+    pairs of columns with identical missing-value masks (e.g. complete
+    data); other pairs must be re-ranked on their complete cases.
+    """
+    return data.rank(method='average', na_option='keep').astype(float)
+
+
+def spearman_against(x: np.ndarray, Y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Spearman's rho of x with every column of Y, ranked within each pair's complete cases
+
+    x is broadcast against Y and both are masked to each pair's complete
+    rows, so two rank calls on (n, m) blocks re-rank every pair at once.
+
+    Args:
+        x: 1-D array (NaN for missing)
+        Y: (n, m) array (NaN for missing)
+
+    Returns:
+        Tuple of (rho, n) arrays of length m
+    """
+    complete = ~np.isnan(Y) & ~np.isnan(x)[:, None]
+    x_ranks = pd.DataFrame(np.where(complete, x[:, None], np.nan)).rank().to_numpy()
+    y_ranks = pd.DataFrame(np.where(complete, Y, np.nan)).rank().to_numpy()
+    n = complete.sum(axis=0).astype(float)
+    # Ranks over m values always average (m + 1) / 2
+    center = (n + 1) / 2
+    x_ranks = np.where(complete, x_ranks - center, 0.0)
+    y_ranks = np.where(complete, y_ranks - center, 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        variance_x = np.einsum('ij,ij->j', x_ranks, x_ranks)
+        variance_y = np.einsum('ij,ij->j', y_ranks, y_ranks)
+        rho = np.einsum('ij,ij->j', x_ranks, y_ranks) / np.sqrt(variance_x * variance_y)
+    rho[(variance_x <= 0) | (variance_y <= 0) | (n < 2)] = np.nan
+    return np.clip(rho, -1.0, 1.0), n
+
+
+def spearman_correlation_matrix(data: pd.DataFrame, min_periods: int = 1) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pairwise-complete Spearman matrix with per-pair n and p-values
+
+    Pairs whose columns share a missing-value mask (all pairs, for complete
+    data) come from one masked Pearson pass over shared column ranks; every
+    other pair is re-ranked on its own complete cases, one column's partners
+    at a time.
+    """
+    values = data.to_numpy(dtype=float)
+    mask = ~np.isnan(values)
+    r, n, _ = pairwise_correlation_matrix(rank_columns(data))
+    if not mask.all():
+        for i in range(values.shape[1] - 1):
+            differs = (mask[:, i + 1:] != mask[:, i:i + 1]).any(axis=0)
+            partners = i + 1 + np.flatnonzero(differs)
+            if partners.size:
+                rho, _ = spearman_against(values[:, i], values[:, partners])
+                r[i, partners] = r[partners, i] = rho
+    r[n < min_periods] = np.nan
+    return r, n, correlation_p_values(r, n)
+
+
+def _segment_tie_sums(segments: np.ndarray, keys: np.ndarray,
+                      n_segments: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Tie correction terms per segment: sum t(t-1)/2, sum t(t-1)(t-2), sum t(t-1)(2t+5)
+
+    Args:
+        segments: Segment id per element
+        keys: Non-negative integer keys; equal (segment, key) pairs are ties
+        n_segments: Number of segments
+    """
+    span = int(keys.max()) + 1
+    unique, counts = np.unique(segments * span + keys, return_counts=True)
+    owner = unique // span
+    t = counts.astype(float)
+    return tuple(np.bincount(owner, weights=weights, minlength=n_segments)
+                 for weights in (t * (t - 1) / 2, t * (t - 1) * (t - 2), t * (t - 1) * (2 * t + 5)))
+
+
+def _count_inversions(sequence: np.ndarray, segments: Optional[np.ndarray] = None,
+                      n_segments: int = 1) -> np.ndarray:
+    """
+    Inversions (i < j with sequence[i] > sequence[j]) within each segment, in O(n log n)
+
+    Binary MSD radix sort: at each bit level, elements grouped by their
+    higher bits are stably partitioned into 0s and 1s with cumulative
+    counts, and every 0 adds the 1s before it in its group (pairs that first
+    differ at this bit). Each of the ~log2(max) levels is O(n) array work,
+    and segments (concatenated independent sequences) are kept apart as an
+    extra top-level prefix.
+
+    Args:
+        sequence: Non-negative integers
+        segments: Non-decreasing segment id per element (default: one segment)
+        n_segments: Number of segments
+
+    Returns:
+        Array of inversion counts per segment
+    """
+    current = np.asarray(sequence, dtype=np.int64)
+    n = current.size
+    segments = np.zeros(n, dtype=np.int64) if segments is None else np.asarray(segments, dtype=np.int64)
+    inversions = np.zeros(n_segments)
+    if n < 2:
+        return inversions
+    positions = np.arange(n)
+    segment_change = np.concatenate([[True], segments[1:] != segments[:-1]])
+
+    for bit in range(int(current.max()).bit_length() - 1, -1, -1):
+        prefix = current >> (bit + 1)
+        new_group = segment_change | np.concatenate([[False], prefix[1:] != prefix[:-1]])
+        starts = np.flatnonzero(new_group)
+        group = np.cumsum(new_group) - 1
+        ones = (current >> bit) & 1
+        zeros = 1 - ones
+
+        ones_before = np.cumsum(ones) - ones
+        ones_before = ones_before - ones_before[starts][group]
+        inversions += np.bincount(segments, weights=ones_before * zeros, minlength=n_segments)
+
+        zeros_before = positions - starts[group] - ones_before
+        group_zeros = np.add.reduceat(zeros, starts)
+        target = np.where(ones == 0, starts[group] + zeros_before,
+                          starts[group] + group_zeros[group] + ones_before)
+        arranged = np.empty_like(current)
+        arranged[target] = current
+        current = arranged
+    return inversions
+
+
+def kendall_tau_b_batch(x: np.ndarray, Y: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Kendall's tau-b of x with every column of Y (Knight's algorithm, batched)
+
+    The complete cases of all pairs are concatenated as segments and sorted
+    by (segment, x, y) in one lexsort; discordant pairs are the inversions of
+    the y sequence within each segment, all counted in one O(N log N) pass.
+    Ties use the usual tau-b corrections and p-values the tie-corrected
+    normal approximation.
+
+    Args:
+        x: 1-D array (NaN for missing)
+        Y: (n, m) array; rows with a missing value in either column are dropped per pair
+
+    Returns:
+        Tuple of (tau, n, p_value) arrays of length m
+    """
+    from scipy.special import erfc
+
+    Y = np.asarray(Y, dtype=float).reshape(len(x), -1)
+    m = Y.shape[1]
+    complete = ~np.isnan(Y) & ~np.isnan(x)[:, None]
+    columns, rows = np.nonzero(complete.T)
+    n = np.bincount(columns, minlength=m).astype(float)
+    tau = np.full(m, np.nan)
+    p_values = np.full(m, np.nan)
+    if columns.size == 0:
+        return tau, n, p_values
+
+    # Dense ranks (below n) preserve order and ties within every segment and
+    # keep the number of radix levels at log2(n)
+    x_ranks = np.unique(x[rows], return_inverse=True)[1].reshape(-1)
+    y_dense = pd.DataFrame(np.where(complete, Y, np.nan)).rank(method='dense').to_numpy()
+    y_ranks = (y_dense.T[complete.T] - 1).astype(np.int64)
+    order = np.lexsort((y_ranks, x_ranks, columns))
+    discordant = _count_inversions(y_ranks[order], columns[order], m)
+
+    x_ties, x_ties_2, x_ties_5 = _segment_tie_sums(columns, x_ranks, m)
+    y_ties, y_ties_2, y_ties_5 = _segment_tie_sums(columns, y_ranks, m)
+    joint_ties = _segment_tie_sums(columns, x_ranks * (int(y_ranks.max()) + 1) + y_ranks, m)[0]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        total = n * (n - 1) / 2
+        score = total - x_ties - y_ties + joint_ties - 2 * discordant
+        denominator = np.sqrt((total - x_ties) * (total - y_ties))
+        tau = np.where((denominator > 0) & (n >= 2), np.clip(score / denominator, -1.0, 1.0), np.nan)
+
+        pairs = n * (n - 1.0)
+        variance = ((pairs * (2 * n + 5) - x_ties_5 - y_ties_5) / 18 +
+                    (2 * x_ties * y_ties) / pairs +
+                    x_ties_2 * y_ties_2 / (9 * pairs * (n - 2)))
+        p_values = erfc(np.abs(score) / np.sqrt(variance) / np.sqrt(2))
+    p_values = np.where(np.isfinite(tau) & (n >= 3), p_values, np.nan)
+    return tau, n, p_values
+
+
+def kendall_tau_b(x: np.ndarray, y: np.ndarray) -> Tuple[float, int, float]:
+    """
+    Kendall's tau-b of two 1-D arrays in O(n log n)
+
+    Returns:
+        Tuple of (tau, n, p_value)
+    """
+    tau, n, p_value = kendall_tau_b_batch(np.asarray(x, dtype=float), np.asarray(y, dtype=float)[:, None])
+    return float(tau[0]), int(n[0]), float(p_value[0])
+
+
+def kendall_correlation_matrix(data: pd.DataFrame, min_periods: int = 1) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Pairwise-complete Kendall tau-b matrix with per-pair n and p-values"""
+    values = data.to_numpy(dtype=float)
+    p = values.shape[1]
+    tau = np.full((p, p), np.nan)
+    n = np.zeros((p, p))
+    p_values = np.full((p, p), np.nan)
+    # One batched call per column against all later columns
+    for i in range(p):
+        row = kendall_tau_b_batch(values[:, i], values[:, i:])
+        for target, result in zip((tau, n, p_values), row):
+            target[i, i:] = result
+            target[i:, i] = result
+    tau[n < min_periods] = np.nan
+    return tau, n, p_values
+
+
+def correlation_matrix_by_method(data: pd.DataFrame, method: str = 'pearson',
+                                 min_periods: int = 1) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Correlation matrix dispatcher used by the analyzer and the visualizers
+
+    Args:
+        data: DataFrame of numeric columns
+        method: 'pearson', 'spearman' (ranked within each pair's complete cases) or 'kendall' (tau-b)
+        min_periods: Minimum paired observations required for a coefficient
+
+    Returns:
+        Tuple of (r, n, p_value) arrays of shape (p, p)
+    """
+    _check_method(method)
+    if method == 'kendall':
+        return kendall_correlation_matrix(data, min_periods=min_periods)
+    if method == 'spearman':
+        return spearman_correlation_matrix(data, min_periods=min_periods)
+    return pairwise_correlation_matrix(data, min_periods=min_periods)
+
+
+def correlation_frame(data: pd.DataFrame, method: str = 'pearson', min_periods: int = 1) -> pd.DataFrame:
+    """Correlation matrix of the numeric columns of `data` as a labelled DataFrame"""
+    numeric = data.select_dtypes(include=['number'])
+    r, _, _ = correlation_matrix_by_method(numeric, method=method, min_periods=min_periods)
+    return pd.DataFrame(r, index=numeric.columns, columns=numeric.columns)
+
+
+def partial_correlation_matrix(correlation: np.ndarray) -> np.ndarray:
+    """
+    Partial correlation of every pair given all remaining variables
+
+    All coefficients come from one Cholesky factorization of the
+    correlation matrix: with precision P = R^-1, the partial correlation of
+    i and j is -P_ij / sqrt(P_ii * P_jj).
+
+    Args:
+        correlation: Positive definite (p, p) correlation matrix
+
+    Returns:
+        (p, p) matrix of partial correlations with a unit diagonal
+    """
+    from scipy.linalg import cho_factor, cho_solve
+
+    precision = cho_solve(cho_factor(correlation), np.eye(correlation.shape[0]))
+    scale = np.sqrt(np.diag(precision))
+    partial = -precision / np.outer(scale, scale)
+    np.fill_diagonal(partial, 1.0)
+    return partial
+
+
+def path_coefficients(correlation: np.ndarray,
+                      labels: List[str],
+                      paths: Dict[str, List[str]]) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray], Dict[str, float]]:
+    """
+    Standardized path coefficients of a recursive path model
+
+    Each structural equation regresses an outcome on its predictors using
+    the correlation matrix. All equations are padded to a common size
+    (identity blocks for unused slots) and solved as one batched linear
+    system, whose extra right-hand sides also yield the inverse predictor
+    correlation matrices needed for standard errors.
+
+    Args:
+        correlation: (p, p) correlation matrix
+        labels: Variable names matching the rows of `correlation`
+        paths: Mapping of outcome -> list of its direct predictors
+
+    Returns:
+        Tuple of (coefficients, inverse-diagonals, R^2) keyed by outcome;
+        coefficients and inverse-diagonals are aligned with paths[outcome]
+    """
+    position = {label: i for i, label in enumerate(labels)}
+    outcomes = list(paths)
+    size = max(len(predictors) for predictors in paths.values())
+    systems = np.tile(np.eye(size), (len(outcomes), 1, 1))
+    right_hand = np.zeros((len(outcomes), size, size + 1))
+    right_hand[:, :, 1:] = np.eye(size)
+
+    for e, outcome in enumerate(outcomes):
+        index = [position[predictor] for predictor in paths[outcome]]
+        k = len(index)
+        systems[e, :k, :k] = correlation[np.ix_(index, index)]
+        right_hand[e, :k, 0] = correlation[index, position[outcome]]
+
+    solution = np.linalg.solve(systems, right_hand)
+
+    coefficients, inverse_diagonals, r_squared = {}, {}, {}
+    for e, outcome in enumerate(outcomes):
+        k = len(paths[outcome])
+        beta = solution[e, :k, 0]
+        coefficients[outcome] = beta
+        inverse_diagonals[outcome] = np.diag(solution[e, :k, 1:k + 1]).copy()
+        r_squared[outcome] = float(beta @ right_hand[e, :k, 0])
+    return coefficients, inverse_diagonals, r_squared
+
+
+def _tile_bounds(p: int, block_size: int) -> List[Tuple[int, int]]:
+    return [(start, min(start + block_size, p)) for start in range(0, p, block_size)]
+
+
+def blocked_correlation_matrix(chunks: Iterable[Union[pd.DataFrame, np.ndarray]],
+                               output_path: Union[str, os.PathLike],
+                               columns: Optional[List[str]] = None,
+                               block_size: int = 2048,
+                               min_periods: int = 1,
+                               workdir: Optional[Union[str, os.PathLike]] = None) -> Tuple[np.memmap, List, int]:
+    """
+    Out-of-core Pearson correlation matrix for very wide/long data
+
+    Row chunks from a streaming reader (e.g. pd.read_csv(..., chunksize=...))
+    are folded into on-disk moment accumulators one column tile at a time,
+    and the finished matrix is written tile by tile to a float32 memmap, so
+    memory use depends only on the chunk and block sizes.
+
+    Values are shifted by the first chunk's column means before
+    accumulation. Pairwise-complete count/sum accumulators are only created
+    once a chunk with missing values is seen; until then every pair shares
+    the global row count and column sums.
+
+    Args:
+        chunks: Iterable of row chunks (DataFrames or 2-D arrays) with the same columns
+        output_path: File for the resulting (p, p) float32 memmap
+        columns: Columns to use from DataFrame chunks (default: all columns of the first chunk)
+        block_size: Columns per tile
+        min_periods: Minimum paired observations required for a coefficient
+        workdir: Directory for temporary accumulators (default: system temp dir)
+
+    Returns:
+        Tuple of (correlation memmap, column labels, number of rows read)
+    """
+    with tempfile.TemporaryDirectory(dir=workdir) as scratch:
+        def accumulator(name: str, p: int) -> np.memmap:
+            return np.memmap(os.path.join(scratch, name), dtype=np.float64, mode='w+', shape=(p, p))
+
+        labels, shift, tiles = None, None, None
+        cross = counts = sums = squares = None
+        n_rows = 0
+
+        for chunk in chunks:
+            if isinstance(chunk, pd.DataFrame):
+                if labels is None:
+                    labels = list(columns) if columns is not None else chunk.columns.tolist()
+                chunk = chunk[labels].to_numpy(dtype=float)
+            else:
+                chunk = np.asarray(chunk, dtype=float)
+                if labels is None:
+                    labels = list(columns) if columns is not None else list(range(chunk.shape[1]))
+            if chunk.shape[0] == 0:
+                continue
+
+            if shift is None:
+                p = chunk.shape[1]
+                tiles = _tile_bounds(p, block_size)
+                with np.errstate(invalid='ignore'):
+                    shift = np.nan_to_num(np.nanmean(chunk, axis=0))
+                cross = accumulator('cross', p)
+                column_sums = np.zeros(p)
+                column_squares = np.zeros(p)
+
+            values = chunk - shift
+            mask = ~np.isnan(values)
+            has_missing = not mask.all()
+            values = np.where(mask, values, 0.0)
+            mask = mask.astype(float)
+
+            if has_missing and counts is None:
+                # Retroactively expand the complete-data totals to per-pair form
+                counts = accumulator('counts', p)
+                sums = accumulator('sums', p)
+                squares = accumulator('squares', p)
+                for i0, i1 in tiles:
+                    counts[i0:i1] = n_rows
+                    sums[i0:i1] = column_sums[i0:i1, None]
+                    squares[i0:i1] = column_squares[i0:i1, None]
+
+            for a, (i0, i1) in enumerate(tiles):
+                XI, MI = values[:, i0:i1], mask[:, i0:i1]
+                for j0, j1 in tiles[a:]:
+                    XJ, MJ = values[:, j0:j1], mask[:, j0:j1]
+                    cross[i0:i1, j0:j1] += XI.T @ XJ
+                    if counts is not None:
+                        counts[i0:i1, j0:j1] += MI.T @ MJ
+                        sums[i0:i1, j0:j1] += XI.T @ MJ
+                        squares[i0:i1, j0:j1] += (XI * XI).T @ MJ
+                        if j0 != i0:
+                            sums[j0:j1, i0:i1] += XJ.T @ MI
+                            squares[j0:j1, i0:i1] += (XJ * XJ).T @ MI
+            column_sums += values.sum(axis=0)
+            column_squares += (values * values).sum(axis=0)
+            n_rows += chunk.shape[0]
+
+        if shift is None:
+            raise ValueError("No rows were read from the chunk iterator")
+
+        result = np.lib.format.open_memmap(output_path, mode='w+', dtype=np.float32, shape=(p, p))
+        for a, (i0, i1) in enumerate(tiles):
+            for j0, j1 in tiles[a:]:
+                if counts is None:
+                    N = np.full((i1 - i0, j1 - j0), float(n_rows))
+                    SI = np.broadcast_to(column_sums[i0:i1, None], N.shape)
+                    SJ = np.broadcast_to(column_sums[None, j0:j1], N.shape)
+                    SII = np.broadcast_to(column_squares[i0:i1, None], N.shape)
+                    SJJ = np.broadcast_to(column_squares[None, j0:j1], N.shape)
+                else:
+                    N = np.asarray(counts[i0:i1, j0:j1])
+                    SI = np.asarray(sums[i0:i1, j0:j1])
+                    SJ = np.asarray(sums[j0:j1, i0:i1]).T
+                    SII = np.asarray(squares[i0:i1, j0:j1])
+                    SJJ = np.asarray(squares[j0:j1, i0:i1]).T
+                r = moments_to_correlation(N, SI, SJ, SII, SJJ, np.asarray(cross[i0:i1, j0:j1]))
+                r[N < min_periods] = np.nan
+                result[i0:i1, j0:j1] = r
+                result[j0:j1, i0:i1] = r.T
+        result.flush()
+        del cross, counts, sums, squares
+
+    return result, labels, n_rows
+
+
+class IncrementalCorrelation:
+    """
+    Pairwise-complete Pearson correlation matrix maintained over row batches
+
+    Keeps shifted moment sums (row count, column sums, sums of squares and
+    the cross-product matrix) so that folding in a batch of m rows costs
+    O(m * p^2) and never revisits earlier rows. Values are shifted by the
+    first batch's column means, which keeps the sums small and the final
+    co-moments accurate. As in blocked_correlation_matrix, per-pair count
+    and sum matrices are only created once a batch with missing values
+    arrives. Accumulators built on different workers can be combined with
+    merge().
+    """
+
+    def __init__(self, columns: Optional[List] = None):
+        """
+        Initialize an empty accumulator
+
+        Args:
+            columns: Columns to use from DataFrame batches (default: all
+                columns of the first batch)
+        """
+        self.columns = list(columns) if columns is not None else None
+        self.n_rows = 0
+        self._shift = None
+        self._cross = None
+        self._column_sums = self._column_squares = None
+        self._counts = self._sums = self._squares = None
+
+    def _as_array(self, chunk: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        if isinstance(chunk, pd.DataFrame):
+            if self.columns is None:
+                self.columns = chunk.columns.tolist()
+            return chunk[self.columns].to_numpy(dtype=float)
+        chunk = np.asarray(chunk, dtype=float)
+        if chunk.ndim == 1:
+            chunk = chunk[None, :]
+        if self.columns is None:
+            self.columns = list(range(chunk.shape[1]))
+        elif chunk.shape[1] != len(self.columns):
+            raise ValueError(f"Expected {len(self.columns)} columns, got {chunk.shape[1]}")
+        return chunk
+
+    def _expand_pairs(self) -> None:
+        """Convert the complete-data totals to per-pair accumulators"""
+        p = self._shift.size
+        self._counts = np.full((p, p), float(self.n_rows))
+        self._sums = np.repeat(self._column_sums[:, None], p, axis=1)
+        self._squares = np.repeat(self._column_squares[:, None], p, axis=1)
+
+    def update(self, chunk: Union[pd.DataFrame, np.ndarray]) -> 'IncrementalCorrelation':
+        """
+        Fold a batch of rows into the running sums
+
+        Args:
+            chunk: DataFrame or 2-D array of new rows (NaNs are missing values)
+
+        Returns:
+            self, so calls can be chained
+        """
+        chunk = self._as_array(chunk)
+        if chunk.shape[0] == 0:
+            return self
+        if self._shift is None:
+            p = chunk.shape[1]
+            with np.errstate(invalid='ignore'):
+                self._shift = np.nan_to_num(np.nanmean(chunk, axis=0))
+            self._cross = np.zeros((p, p))
+            self._column_sums = np.zeros(p)
+            self._column_squares = np.zeros(p)
+
+        values = chunk - self._shift
+        mask = ~np.isnan(values)
+        has_missing = not mask.all()
+        values = np.where(mask, values, 0.0)
+        squares = values * values
+
+        if has_missing and self._counts is None:
+            self._expand_pairs()
+        self._cross += values.T @ values
+        if self._counts is not None:
+            mask = mask.astype(float)
+            self._counts += mask.T @ mask
+            self._sums += values.T @ mask
+            self._squares += squares.T @ mask
+        self._column_sums += values.sum(axis=0)
+        self._column_squares += squares.sum(axis=0)
+        self.n_rows += chunk.shape[0]
+        return self
+
+    def merge(self, other: 'IncrementalCorrelation') -> 'IncrementalCorrelation':
+        """
+        Combine another accumulator over the same columns into this one
+
+        The other accumulator's sums are re-expressed around this one's shift
+        before being added, so the two may have started from different batches.
+
+        Returns:
+            self, so calls can be chained
+        """
+        if other._shift is None:
+            return self
+        if self._shift is None:
+            self.columns = list(other.columns)
+            self.n_rows = other.n_rows
+            self._shift = other._shift.copy()
+            for name in ('_cross', '_column_sums', '_column_squares', '_counts', '_sums', '_squares'):
+                value = getattr(other, name)
+                setattr(self, name, None if value is None else value.copy())
+            return self
+        if list(other.columns) != list(self.columns):
+            raise ValueError("Cannot merge accumulators over different columns")
+
+        a = self._shift - other._shift
+        n = other.n_rows
+        sums, squares = other._column_sums, other._column_squares
+        if self._counts is None and other._counts is not None:
+            self._expand_pairs()
+        if self._counts is None:
+            self._cross += (other._cross - np.outer(sums, a) - np.outer(a, sums) + n * np.outer(a, a))
+        else:
+            if other._counts is None:
+                counts = np.full(self._cross.shape, float(n))
+                pair_sums = np.repeat(sums[:, None], a.size, axis=1)
+                pair_squares = np.repeat(squares[:, None], a.size, axis=1)
+            else:
+                counts, pair_sums, pair_squares = other._counts, other._sums, other._squares
+            a_i = a[:, None]
+            self._cross += (other._cross - pair_sums * a[None, :] - a_i * pair_sums.T +
+                            counts * np.outer(a, a))
+            self._counts += counts
+            self._sums += pair_sums - a_i * counts
+            self._squares += pair_squares - 2 * a_i * pair_sums + a_i * a_i * counts
+        self._column_sums += sums - a * n
+        self._column_squares += squares - 2 * a * sums + a * a * n
+        self.n_rows += n
+        return self
+
+    def result(self, min_periods: int = 1) -> Dict[str, pd.DataFrame]:
+        """
+        Current correlation matrix with per-pair sample sizes and p-values
+
+        Args:
+            min_periods: Minimum paired observations required for a coefficient
+
+        Returns:
+            Dictionary with 'correlation', 'n' and 'p_value' DataFrames
+        """
+        if self._shift is None:
+            raise ValueError("No rows have been added to the accumulator")
+        if self._counts is None:
+            N = np.full(self._cross.shape, float(self.n_rows))
+            SI = np.broadcast_to(self._column_sums[:, None], N.shape)
+            SII = np.broadcast_to(self._column_squares[:, None], N.shape)
+        else:
+            N, SI, SII = self._counts, self._sums, self._squares
+        r = moments_to_correlation(N, SI, SI.T, SII, SII.T, self._cross)
+        r[N < min_periods] = np.nan
+        labels = self.columns
+        return {
+            'correlation': pd.DataFrame(r, index=labels, columns=labels),
+            'n': pd.DataFrame(N.astype(np.int64), index=labels, columns=labels),
+            'p_value': pd.DataFrame(correlation_p_values(r, N), index=labels, columns=labels)
+        }
+
+
+def _exact_pair_correlations(values: np.ndarray, mask: np.ndarray,
+                             rows: np.ndarray, cols: np.ndarray,
+                             chunk_size: int = 256) -> Tuple[np.ndarray, np.ndarray]:
+    """Pairwise-complete r and n for an explicit list of (row, col) column pairs"""
+    r = np.empty(rows.size)
+    n = np.empty(rows.size)
+    for start in range(0, rows.size, chunk_size):
+        i, j = rows[start:start + chunk_size], cols[start:start + chunk_size]
+        XI, XJ, MI, MJ = values[:, i], values[:, j], mask[:, i], mask[:, j]
+        moments = (
+            np.einsum('ij,ij->j', MI, MJ),
+            np.einsum('ij,ij->j', XI, MJ),
+            np.einsum('ij,ij->j', MI, XJ),
+            np.einsum('ij,ij->j', XI * XI, MJ),
+            np.einsum('ij,ij->j', MI, XJ * XJ),
+            np.einsum('ij,ij->j', XI, XJ),
+        )
+        r[start:start + chunk_size] = moments_to_correlation(*moments)
+        n[start:start + chunk_size] = moments[0]
+    return r, n
+
+
+def _tile_top_pairs(tile: np.ndarray, i0: int, j0: int, diagonal: bool, k: int) -> List[Tuple[float, int, int]]:
+    """Up to k largest |r| entries of one tile as (|r|, row, col) tuples"""
+    strength = np.abs(tile)
+    if diagonal:
+        strength = np.where(np.triu(np.ones(tile.shape, dtype=bool), k=1), strength, np.nan)
+    strength = np.nan_to_num(strength, nan=-1.0).ravel()
+    keep = min(k, strength.size)
+    best = np.argpartition(strength, strength.size - keep)[strength.size - keep:]
+    best = best[strength[best] >= 0]
+    rows, cols = np.unravel_index(best, tile.shape)
+    return list(zip(strength[best].tolist(), (rows + i0).tolist(), (cols + j0).tolist()))
+
+
+def top_correlated_pairs(data: pd.DataFrame,
+                         k: int = 50,
+                         block_size: int = 1024,
+                         min_periods: int = 3,
+                         sketch_dim: Optional[int] = None,
+                         oversample: int = 20,
+                         random_state: Optional[int] = None) -> pd.DataFrame:
+    """
+    The k most strongly correlated variable pairs without a full p x p matrix
+
+    The correlation matrix is visited one (block_size x block_size) tile at
+    a time and only a bounded heap of the best k pairs survives each tile.
+    With `sketch_dim`, tiles are first screened on a Gaussian random
+    projection of the standardized columns (d << n rows), and only the
+    `oversample * k` most promising pairs are recomputed exactly.
+
+    Args:
+        data: DataFrame of numeric columns
+        k: Number of pairs to return
+        block_size: Columns per tile
+        min_periods: Minimum paired observations for a pair to qualify
+        sketch_dim: Rows of the random-projection sketch (None for exact tiling)
+        oversample: Candidate pairs kept per requested pair when sketching
+        random_state: Seed for the projection
+
+    Returns:
+        DataFrame with variable_1, variable_2, correlation, n and p_value,
+        ordered by decreasing absolute correlation
+    """
+    labels = data.columns
+    values, mask = prepare_masked(data)
+    p = values.shape[1]
+    tiles = _tile_bounds(p, block_size)
+    heap: List[Tuple[float, int, int]] = []
+    budget = k if sketch_dim is None else k * oversample
+
+    # Unit-norm centered columns turn dot products into correlations (exact
+    # for complete data, approximate screening values otherwise)
+    norms = np.sqrt((values * values).sum(axis=0))
+    scale = np.where(norms > 0, norms, np.nan)
+    complete = bool(mask.all())
+
+    if sketch_dim is not None:
+        rng = np.random.default_rng(random_state)
+        sketch = np.zeros((sketch_dim, p))
+        for start in range(0, values.shape[0], 65_536):
+            block = np.nan_to_num(values[start:start + 65_536] / scale)
+            projection = rng.standard_normal((block.shape[0], sketch_dim)) / np.sqrt(sketch_dim)
+            sketch += projection.T @ block
+
+    for a, (i0, i1) in enumerate(tiles):
+        for j0, j1 in tiles[a:]:
+            if sketch_dim is not None:
+                tile = sketch[:, i0:i1].T @ sketch[:, j0:j1]
+            elif complete:
+                tile = (values[:, i0:i1] / scale[i0:i1]).T @ (values[:, j0:j1] / scale[j0:j1])
+                if values.shape[0] < min_periods:
+                    tile[:] = np.nan
+            else:
+                moments = masked_moments(values[:, i0:i1], mask[:, i0:i1], values[:, j0:j1], mask[:, j0:j1])
+                tile = moments_to_correlation(*moments)
+                tile[moments[0] < min_periods] = np.nan
+            for candidate in _tile_top_pairs(tile, i0, j0, i0 == j0, budget):
+                if len(heap) < budget:
+                    heapq.heappush(heap, candidate)
+                elif candidate[0] > heap[0][0]:
+                    heapq.heapreplace(heap, candidate)
+
+    rows = np.array([pair[1] for pair in heap], dtype=np.int64)
+    cols = np.array([pair[2] for pair in heap], dtype=np.int64)
+    r, n = _exact_pair_correlations(values, mask, rows, cols)
+    keep = (n >= min_periods) & ~np.isnan(r)
+    rows, cols, r, n = rows[keep], cols[keep], r[keep], n[keep]
+    order = np.argsort(-np.abs(r), kind='stable')[:k]
+    rows, cols, r, n = rows[order], cols[order], r[order], n[order]
+
+    return pd.DataFrame({
+        'variable_1': labels[rows],
+        'variable_2': labels[cols],
+        'correlation': r,
+        'n': n.astype(np.int64),
+        'p_value': correlation_p_values(r, n)
+    })
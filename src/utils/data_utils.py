@@ -6,10 +6,15 @@ Enterprise-grade utility functions for statistical analysis and data processing
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Union
+from typing import Callable, Dict, Iterable, List, Tuple, Optional, Union
 import logging
 import warnings
 
+from . import anomaly
+from . import cache as result_cache
+from .segments import factorize_groups
+from .multiple_testing import adjust_optional, adjust_p_values
+
 # Optional imports with graceful fallback
 try:
     import pyreadstat
@@ -24,6 +29,13 @@ except ImportError:
     SCIPY_AVAILABLE = False
     logging.warning("scipy not available - advanced statistical tests will be limited")
 
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    PYARROW_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -110,14 +122,89 @@ class DataLoader:
         
         return pd.DataFrame(data_dict)
 
+# Columnar KPI result schema (see StatisticalAnalyzer.business_kpi_analysis)
+_KPI_NUMERIC_FIELDS = (
+    'current_value', 'baseline_average', 'overall_average', 'percentage_change',
+    'trend_slope', 'trend_significance', 'r_squared', 'volatility'
+)
+_PERFORMANCE_LABELS = ['improving', 'declining', 'stable']
+_KPI_INTERPRETATIONS = [
+    f"{significance} {performance} trend"
+    for significance in ('Significant', 'Non-significant')
+    for performance in _PERFORMANCE_LABELS
+]
+
+def _correlation_columns(arguments: Dict) -> Optional[List[str]]:
+    """Columns read by correlation_analysis (all columns when features are inferred)"""
+    if arguments['feature_columns'] is None:
+        return None
+    return [arguments['target_metric']] + list(arguments['feature_columns'])
+
+def _assumption_columns(arguments: Dict) -> List[str]:
+    """Columns read by check_assumptions"""
+    group_by = arguments['group_by']
+    if group_by is None:
+        group_by = []
+    return list(arguments['variables']) + ([group_by] if isinstance(group_by, str) else list(group_by))
+
+def _normality_verdict(p_value: float) -> Tuple[Optional[bool], str]:
+    """Normal flag and interpretation for a normality p-value (None when untestable)"""
+    if not np.isfinite(p_value):
+        return None, 'Insufficient data'
+    if p_value > 0.05:
+        return True, 'Normal distribution'
+    return False, 'Non-normal distribution'
+
+def _performance_code(slope: float, p_value: float) -> int:
+    """Index into _PERFORMANCE_LABELS for a fitted trend"""
+    if slope > 0 and p_value < 0.05:
+        return 0
+    if slope < 0 and p_value < 0.05:
+        return 1
+    return 2
+
 class StatisticalAnalyzer:
     """Enterprise statistical analysis utilities with business intelligence capabilities"""
     
+    @staticmethod
+    def enable_cache(max_entries: int = 128,
+                     directory: Optional[Union[str, Path]] = None) -> Dict:
+        """
+        Turn on result memoization for correlation_analysis, check_assumptions
+        and chi_square_test
+        
+        Repeated calls on identical data (same content fingerprint of the
+        columns used) and identical arguments return the stored result
+        instead of recomputing it. Replaces any cache enabled earlier.
+        
+        Args:
+            max_entries: Maximum number of results held in memory (LRU)
+            directory: Optional directory that also keeps results on disk;
+                entries are read back with pickle, so only use a directory
+                that no untrusted user can write to
+            
+        Returns:
+            Cache statistics (see cache_info)
+        """
+        return result_cache.enable(max_entries=max_entries, directory=directory).info()
+    
+    @staticmethod
+    def disable_cache() -> None:
+        """Turn result memoization off (the on-disk tier is left in place)"""
+        result_cache.disable()
+    
+    @staticmethod
+    def cache_info() -> Optional[Dict]:
+        """Hit/miss counters and size of the active cache, or None when disabled"""
+        cache = result_cache.active_cache()
+        return cache.info() if cache is not None else None
+    
     @staticmethod
     def business_kpi_analysis(data: pd.DataFrame, 
                             metrics: List[str],
                             time_column: str = 'date',
-                            baseline_period: int = 30) -> Dict:
+                            baseline_period: int = 30,
+                            output: str = 'dict') -> Union[Dict, pd.DataFrame, 'pa.Table']:
         """
         Comprehensive business KPI analysis with trend detection
         
@@ -126,11 +213,25 @@ class StatisticalAnalyzer:
             metrics: List of KPI metric column names
             time_column: Name of the time/date column
             baseline_period: Number of periods for baseline comparison
+            output: Result layout - 'dict' (one nested dict per metric),
+                'frame' (typed columnar DataFrame, one row per metric) or
+                'arrow' (pyarrow Table with the same schema as 'frame')
             
         Returns:
-            Dictionary containing KPI analysis results
+            KPI analysis results in the requested layout. The columnar
+            layouts store 'performance' and 'interpretation' as categoricals,
+            so they serialize to Parquet/JSON without per-row string building.
         """
-        results = {}
+        allowed_outputs = ['dict', 'frame', 'arrow']
+        if output not in allowed_outputs:
+            raise ValueError(f"output must be one of {allowed_outputs}")
+        if output == 'arrow' and not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for output='arrow'")
+        
+        columns = {name: [] for name in _KPI_NUMERIC_FIELDS}
+        metric_names = []
+        performance_codes = []
+        significance_codes = []
         
         # Sort by time
         data_sorted = data.sort_values(time_column)
@@ -139,18 +240,18 @@ class StatisticalAnalyzer:
             if metric not in data_sorted.columns:
                 continue
                 
-            metric_data = data_sorted[metric].dropna()
-            if len(metric_data) < baseline_period:
+            metric_values = data_sorted[metric].dropna().to_numpy(dtype=float)
+            if len(metric_values) < baseline_period:
                 continue
             
             # Calculate key statistics
-            current_value = metric_data.iloc[-1]
-            baseline_value = metric_data.iloc[-baseline_period:-1].mean()
-            overall_mean = metric_data.mean()
-            overall_std = metric_data.std()
+            current_value = metric_values[-1]
+            baseline_value = metric_values[-baseline_period:-1].mean()
+            overall_mean = metric_values.mean()
+            overall_std = metric_values.std(ddof=1)
             
             # Trend analysis
-            trend_results = StatisticalAnalyzer.analyze_trend(metric_data)
+            slope, _, r_value, p_value = StatisticalAnalyzer._trend_statistics(metric_values)
             
             # Percentage change
             pct_change = ((current_value - baseline_value) / baseline_value * 100) if baseline_value != 0 else 0
@@ -158,41 +259,56 @@ class StatisticalAnalyzer:
             # Volatility (coefficient of variation)
             volatility = (overall_std / overall_mean * 100) if overall_mean != 0 else 0
             
-            # Performance classification
-            performance = 'improving' if trend_results['slope'] > 0 and trend_results['p_value'] < 0.05 else \
-                         'declining' if trend_results['slope'] < 0 and trend_results['p_value'] < 0.05 else 'stable'
-            
-            results[metric] = {
-                'current_value': current_value,
-                'baseline_average': baseline_value,
-                'overall_average': overall_mean,
-                'percentage_change': pct_change,
-                'trend_slope': trend_results['slope'],
-                'trend_significance': trend_results['p_value'],
-                'r_squared': trend_results['r_squared'],
-                'volatility': volatility,
-                'performance': performance,
-                'interpretation': f"{'Significant' if trend_results['p_value'] < 0.05 else 'Non-significant'} {performance} trend"
+            metric_names.append(metric)
+            columns['current_value'].append(current_value)
+            columns['baseline_average'].append(baseline_value)
+            columns['overall_average'].append(overall_mean)
+            columns['percentage_change'].append(pct_change)
+            columns['trend_slope'].append(slope)
+            columns['trend_significance'].append(p_value)
+            columns['r_squared'].append(r_value**2)
+            columns['volatility'].append(volatility)
+            performance_codes.append(_performance_code(slope, p_value))
+            significance_codes.append(0 if p_value < 0.05 else 1)
+        
+        if output == 'dict':
+            return {
+                metric: {
+                    **{name: columns[name][i] for name in _KPI_NUMERIC_FIELDS},
+                    'performance': _PERFORMANCE_LABELS[performance_codes[i]],
+                    'interpretation': _KPI_INTERPRETATIONS[
+                        significance_codes[i] * len(_PERFORMANCE_LABELS) + performance_codes[i]]
+                }
+                for i, metric in enumerate(metric_names)
             }
         
-        return results
+        # Columnar layout: interpretations stay as categorical codes and are
+        # only turned into strings when a consumer asks for them
+        performance = np.asarray(performance_codes, dtype=np.int8)
+        significance = np.asarray(significance_codes, dtype=np.int8)
+        frame = pd.DataFrame({'metric': pd.Series(metric_names, dtype='string')})
+        for name in _KPI_NUMERIC_FIELDS:
+            frame[name] = np.asarray(columns[name], dtype=np.float64)
+        frame['performance'] = pd.Categorical.from_codes(performance, _PERFORMANCE_LABELS)
+        frame['interpretation'] = pd.Categorical.from_codes(
+            significance * len(_PERFORMANCE_LABELS) + performance, _KPI_INTERPRETATIONS)
+        
+        if output == 'arrow':
+            return pa.Table.from_pandas(frame, preserve_index=False)
+        return frame
     
     @staticmethod
-    def analyze_trend(data: pd.Series) -> Dict:
+    def _trend_statistics(values: np.ndarray) -> Tuple[float, float, float, float]:
+        """Least-squares trend against the observation index: (slope, intercept, r, p)"""
         from scipy.stats import linregress
-        x = np.arange(len(data))
-        slope, intercept, r_value, p_value, std_err = tuple(linregress(x, data.to_numpy()))
-        slope = float(slope)
-        intercept = float(intercept)
-        r_value = float(r_value)
-        p_value = float(p_value)
-        std_err = float(std_err)
-        if slope > 0 and p_value < 0.05:
-            performance = 'improving'
-        elif slope < 0 and p_value < 0.05:
-            performance = 'declining'
-        else:
-            performance = 'stable'
+        x = np.arange(len(values))
+        slope, intercept, r_value, p_value, _ = tuple(linregress(x, values))
+        return float(slope), float(intercept), float(r_value), float(p_value)
+    
+    @staticmethod
+    def analyze_trend(data: pd.Series) -> Dict:
+        slope, intercept, r_value, p_value = StatisticalAnalyzer._trend_statistics(data.to_numpy())
+        performance = _PERFORMANCE_LABELS[_performance_code(slope, p_value)]
         return {
             'slope': slope,
             'intercept': intercept,
@@ -203,7 +319,28 @@ class StatisticalAnalyzer:
         }
     
     @staticmethod
-    def detect_anomalies(data: pd.Series) -> Tuple[List[int], List[float]]:
+    def detect_anomalies(data: pd.Series,
+                         group_by: Optional[Union[pd.Series, np.ndarray]] = None) -> Union[Tuple[List[int], List[float]], pd.Series]:
+        """
+        Detect anomalies using modified z-scores (median/MAD)
+        
+        Args:
+            data: Series to screen
+            group_by: Optional group key per row (e.g. store id); each value is
+                then judged against its own group's median and MAD
+            
+        Returns:
+            Without group_by, a tuple of (positions among the non-missing
+            values, anomalous values). With group_by, a boolean Series
+            aligned with `data`.
+        """
+        if group_by is not None:
+            codes, groups = factorize_groups(group_by)
+            scores = anomaly.grouped_modified_z_scores(data.to_numpy(dtype=float), codes, len(groups))
+            with np.errstate(invalid='ignore'):
+                flags = np.abs(scores) > anomaly.DEFAULT_THRESHOLD
+            return pd.Series(flags, index=data.index, name=data.name)
+        
         arr = data.dropna().to_numpy()
         median = np.median(arr)
         mad = np.median(np.abs(arr - median))
@@ -217,9 +354,122 @@ class StatisticalAnalyzer:
         return anomaly_indices, anomaly_values
     
     @staticmethod
+    def detect_anomalies_frame(data: pd.DataFrame,
+                               columns: Optional[List[str]] = None,
+                               threshold: float = anomaly.DEFAULT_THRESHOLD,
+                               return_labels: bool = False,
+                               group_by: Optional[Union[str, pd.Series]] = None) -> Union[pd.DataFrame, Dict[str, pd.Index]]:
+        """
+        Detect anomalies in many columns at once using modified z-scores
+        
+        Args:
+            data: DataFrame containing the variables to screen
+            columns: Columns to screen (if None, uses all numeric)
+            threshold: Absolute modified z-score above which a value is anomalous
+            return_labels: Return index labels of anomalies per column instead of a mask
+            group_by: Grouping column name (or per-row keys) for within-group screening
+            
+        Returns:
+            Boolean mask aligned with the original rows, or a dict of
+            anomalous index labels per column
+        """
+        if isinstance(group_by, str):
+            group_by = data[group_by]
+        if columns is None:
+            columns = data.select_dtypes(include=['number']).columns.tolist()
+            if getattr(group_by, 'name', None) in columns:
+                columns.remove(group_by.name)
+        return anomaly.detect_anomalies_frame(data[columns], threshold=threshold,
+                                              return_labels=return_labels,
+                                              group_by=group_by)
+    
+    @staticmethod
+    def detect_anomalies_rolling(data: Union[pd.Series, pd.DataFrame],
+                                 window: int,
+                                 threshold: float = anomaly.DEFAULT_THRESHOLD,
+                                 min_periods: Optional[int] = None) -> Union[pd.Series, pd.DataFrame]:
+        """
+        Detect local spikes using a trailing-window median and MAD
+        
+        Args:
+            data: Series, or DataFrame of series (one per column) in time order
+            window: Number of trailing observations in each window
+            threshold: Absolute modified z-score above which a value is anomalous
+            min_periods: Minimum non-missing values per window (defaults to window)
+            
+        Returns:
+            Boolean mask aligned with the original rows
+        """
+        return anomaly.detect_anomalies_rolling(data, window, threshold=threshold,
+                                                min_periods=min_periods)
+    
+    @staticmethod
+    def detect_multivariate_outliers(data: pd.DataFrame,
+                                     columns: Optional[List[str]] = None,
+                                     alpha: float = 0.025,
+                                     support_fraction: Optional[float] = None,
+                                     n_trials: int = 500,
+                                     chunk_size: int = 100_000,
+                                     random_state: Optional[int] = None) -> Dict:
+        """
+        Detect multivariate outliers with robust (FAST-MCD) Mahalanobis distances
+        
+        Args:
+            data: DataFrame containing the variables
+            columns: Variables to screen jointly (if None, uses all numeric)
+            alpha: Tail probability of the chi-square cutoff
+            support_fraction: Fraction of rows in the MCD support (default about half)
+            n_trials: Number of random starting subsets
+            chunk_size: Rows per chunk for distance computations
+            random_state: Seed for reproducible results
+            
+        Returns:
+            Dictionary with robust location/covariance, per-row distances,
+            p-values and outlier flags (rows with missing values are not scored)
+        """
+        from scipy.stats import chi2
+        from .robust_covariance import fast_mcd
+        
+        if columns is None:
+            columns = data.select_dtypes(include=['number']).columns.tolist()
+        
+        values = data[columns].to_numpy(dtype=float)
+        complete = ~np.isnan(values).any(axis=1)
+        location, covariance, squared = fast_mcd(
+            values[complete], support_fraction=support_fraction, n_trials=n_trials,
+            chunk_size=chunk_size, random_state=random_state)
+        
+        p = len(columns)
+        cutoff = chi2.ppf(1 - alpha, p)
+        distances = np.full(len(data), np.nan)
+        p_values = np.full(len(data), np.nan)
+        distances[complete] = np.sqrt(squared)
+        p_values[complete] = chi2.sf(squared, p)
+        outliers = np.zeros(len(data), dtype=bool)
+        outliers[complete] = squared > cutoff
+        
+        return {
+            'location': pd.Series(location, index=columns),
+            'covariance': pd.DataFrame(covariance, index=columns, columns=columns),
+            'distances': pd.Series(distances, index=data.index, name='robust_distance'),
+            'p_values': pd.Series(p_values, index=data.index, name='p_value'),
+            'outliers': pd.Series(outliers, index=data.index, name='outlier'),
+            'threshold': float(np.sqrt(cutoff)),
+            'n_outliers': int(outliers.sum()),
+            'n_scored': int(complete.sum())
+        }
+    
+    @staticmethod
+    @result_cache.memoized(columns=_correlation_columns,
+                           skip=lambda a: bool(a['bootstrap_resamples']) and a['random_state'] is None)
     def correlation_analysis(data: pd.DataFrame, 
                            target_metric: str,
-                           feature_columns: Optional[List[str]] = None) -> Dict:
+                           feature_columns: Optional[List[str]] = None,
+                           method: str = 'pearson',
+                           correction: Optional[str] = None,
+                           bootstrap_resamples: int = 0,
+                           ci_method: str = 'bca',
+                           random_state: Optional[int] = None) -> Dict:
         """
         Analyze correlations between business metrics
         
@@ -227,50 +477,75 @@ class StatisticalAnalyzer:
             data: DataFrame containing metrics
             target_metric: Target metric to analyze correlations with
             feature_columns: Specific columns to analyze (if None, uses all numeric)
+            method: Correlation method ('pearson', 'spearman', 'kendall')
+            correction: Multiple-testing correction across features ('bonferroni',
+                'holm', 'fdr_bh', 'fdr_by'); significance then uses adjusted p-values
+            bootstrap_resamples: Number of bootstrap replicates for 95% confidence
+                intervals of each correlation (0 disables; pearson/spearman only)
+            ci_method: Bootstrap interval type ('percentile' or 'bca')
+            random_state: Seed for reproducible bootstrap intervals
             
         Returns:
             Dictionary with correlation analysis results
         """
+        from .correlation import correlate_with_target
+        from .bootstrap import bootstrap_ci, pearson_statistic, spearman_statistic
+        
+        if bootstrap_resamples and method == 'kendall':
+            raise ValueError("bootstrap intervals are available for 'pearson' and 'spearman' only")
+        
         if feature_columns is None:
             numeric_columns = data.select_dtypes(include=['number']).columns.tolist()
             feature_columns = [col for col in numeric_columns if col != target_metric]
         
         correlations = {}
+        if target_metric in data.columns:
+            feature_columns = [feature for feature in feature_columns if feature in data.columns]
+        else:
+            feature_columns = []
         
-        for feature in feature_columns:
-            if feature in data.columns and target_metric in data.columns:
-                # Calculate Pearson correlation
-                corr_coef = data[feature].corr(data[target_metric])
-                
-                # Calculate significance
-                from scipy.stats import pearsonr
-                _, p_value = pearsonr(data[feature].dropna(), data[target_metric].dropna())
-                import numpy as np
-                if isinstance(p_value, (tuple, list, np.ndarray)):
-                    val = p_value[0]
-                else:
-                    val = p_value
-                if isinstance(val, (float, int, np.floating)):
-                    p_value_float = float(val)
-                else:
-                    p_value_float = 1.0
-                # Interpret correlation strength
-                abs_corr = abs(corr_coef)
-                if abs_corr >= 0.7:
-                    strength = 'strong'
-                elif abs_corr >= 0.3:
-                    strength = 'moderate'
-                else:
-                    strength = 'weak'
-                direction = 'positive' if corr_coef > 0 else 'negative'
-                correlations[feature] = {
-                    'correlation': corr_coef,
-                    'p_value': p_value_float,
-                    'significant': p_value_float < 0.05,
-                    'strength': strength,
-                    'direction': direction,
-                    'interpretation': f"{strength.title()} {direction} correlation"
-                }
+        # All features are correlated with the target in one masked matrix
+        # product, each on the rows where both values are present
+        r_values = pair_counts = p_values = np.empty(0)
+        if feature_columns:
+            r_values, pair_counts, p_values = correlate_with_target(data, feature_columns, target_metric,
+                                                                    method=method)
+        adjusted = adjust_optional(p_values, correction)
+        
+        for i, (feature, corr_coef, n_pairs, p_value) in enumerate(zip(feature_columns, r_values, pair_counts, p_values)):
+            p_value_float = float(p_value) if not np.isnan(p_value) else 1.0
+            decision_p = p_value_float
+            if adjusted is not None:
+                decision_p = float(adjusted[i]) if not np.isnan(adjusted[i]) else 1.0
+            # Interpret correlation strength
+            abs_corr = abs(corr_coef)
+            if abs_corr >= 0.7:
+                strength = 'strong'
+            elif abs_corr >= 0.3:
+                strength = 'moderate'
+            else:
+                strength = 'weak'
+            direction = 'positive' if corr_coef > 0 else 'negative'
+            correlations[feature] = {
+                'correlation': float(corr_coef),
+                'p_value': p_value_float,
+                'n': int(n_pairs),
+                'significant': decision_p < 0.05,
+                'strength': strength,
+                'direction': direction,
+                'interpretation': f"{strength.title()} {direction} correlation"
+            }
+            if adjusted is not None:
+                correlations[feature]['p_value_adjusted'] = decision_p
+            if bootstrap_resamples:
+                pairs = data[[feature, target_metric]].dropna().to_numpy(dtype=float)
+                interval = bootstrap_ci(
+                    (pairs[:, 0], pairs[:, 1]),
+                    pearson_statistic if method == 'pearson' else spearman_statistic,
+                    paired=True, n_resamples=bootstrap_resamples, method=ci_method,
+                    random_state=random_state)
+                correlations[feature]['ci_low'] = interval['ci_low']
+                correlations[feature]['ci_high'] = interval['ci_high']
         
         # Sort by absolute correlation value
         sorted_correlations = dict(sorted(correlations.items(), 
@@ -279,55 +554,315 @@ class StatisticalAnalyzer:
         
         return {
             'target_metric': target_metric,
+            'method': method,
+            'correction': correction,
             'correlations': sorted_correlations,
             'strongest_correlation': list(sorted_correlations.keys())[0] if sorted_correlations else None
         }
     
     @staticmethod
+    def correlation_matrix(data: pd.DataFrame,
+                           columns: Optional[List[str]] = None,
+                           min_periods: int = 1,
+                           method: str = 'pearson',
+                           correction: Optional[str] = None) -> Dict:
+        """
+        Pairwise-complete correlation matrix with sample sizes and p-values
+        
+        Args:
+            data: DataFrame containing variables
+            columns: Variables to correlate (if None, uses all numeric)
+            min_periods: Minimum paired observations required for a coefficient
+            method: Correlation method ('pearson', 'spearman', 'kendall')
+            correction: Multiple-testing correction over the distinct pairs
+                ('bonferroni', 'holm', 'fdr_bh', 'fdr_by')
+            
+        Returns:
+            Dictionary with 'correlation', 'n' and 'p_value' DataFrames (plus
+            'p_value_adjusted' when a correction is requested)
+        """
+        from .correlation import correlation_matrix_by_method
+        
+        if columns is None:
+            columns = data.select_dtypes(include=['number']).columns.tolist()
+        
+        r, n, p_values = correlation_matrix_by_method(data[columns], method=method,
+                                                      min_periods=min_periods)
+        results = {
+            'correlation': pd.DataFrame(r, index=columns, columns=columns),
+            'n': pd.DataFrame(n.astype(np.int64), index=columns, columns=columns),
+            'p_value': pd.DataFrame(p_values, index=columns, columns=columns)
+        }
+        if correction is not None:
+            # Each pair is one test: adjust the upper triangle and mirror it
+            upper = np.triu_indices(len(columns), k=1)
+            adjusted = np.full(p_values.shape, np.nan)
+            adjusted[upper] = adjust_p_values(p_values[upper], correction)
+            adjusted.T[upper] = adjusted[upper]
+            results['p_value_adjusted'] = pd.DataFrame(adjusted, index=columns, columns=columns)
+        return results
+    
+    @staticmethod
+    def blocked_correlation_matrix(chunks: Iterable[Union[pd.DataFrame, np.ndarray]],
+                                   output_path: Union[str, Path],
+                                   columns: Optional[List[str]] = None,
+                                   block_size: int = 2048,
+                                   min_periods: int = 1) -> Dict:
+        """
+        Out-of-core correlation matrix for panels too large for DataFrame.corr
+        
+        Args:
+            chunks: Row chunks from a streaming reader, e.g. pd.read_csv(path, chunksize=50_000)
+            output_path: .npy file that receives the float32 correlation matrix
+            columns: Columns to use from each chunk (default: all)
+            block_size: Columns per tile (bounds memory per matrix product)
+            min_periods: Minimum paired observations required for a coefficient
+            
+        Returns:
+            Dictionary with the memory-mapped 'correlation' matrix, its
+            'columns' labels, 'n_rows' read and the output 'path'
+        """
+        from .correlation import blocked_correlation_matrix
+        
+        matrix, labels, n_rows = blocked_correlation_matrix(
+            chunks, output_path, columns=columns, block_size=block_size, min_periods=min_periods)
+        return {
+            'correlation': matrix,
+            'columns': labels,
+            'n_rows': n_rows,
+            'path': str(output_path)
+        }
+    
+    @staticmethod
+    def top_correlated_pairs(data: pd.DataFrame,
+                             k: int = 50,
+                             columns: Optional[List[str]] = None,
+                             block_size: int = 1024,
+                             min_periods: int = 3,
+                             sketch_dim: Optional[int] = None,
+                             random_state: Optional[int] = None) -> pd.DataFrame:
+        """
+        Find the k strongest pairwise correlations among many variables
+        
+        Args:
+            data: DataFrame containing variables
+            k: Number of pairs to return
+            columns: Variables to search (if None, uses all numeric)
+            block_size: Columns per tile of the correlation matrix
+            min_periods: Minimum paired observations for a pair to qualify
+            sketch_dim: Random-projection size used to pre-filter candidate
+                pairs (None computes every tile exactly)
+            random_state: Seed for the random projection
+            
+        Returns:
+            DataFrame of pairs ordered by decreasing absolute correlation
+        """
+        from .correlation import top_correlated_pairs
+        
+        if columns is None:
+            columns = data.select_dtypes(include=['number']).columns.tolist()
+        return top_correlated_pairs(data[columns], k=k, block_size=block_size,
+                                    min_periods=min_periods, sketch_dim=sketch_dim,
+                                    random_state=random_state)
+    
+    @staticmethod
+    def partial_correlations(data: pd.DataFrame,
+                             columns: Optional[List[str]] = None) -> Dict:
+        """
+        Partial correlations of every pair controlling for all other variables
+        
+        Args:
+            data: DataFrame containing variables (rows with missing values are
+                excluded listwise, as in SPSS PARTIAL CORR)
+            columns: Variables to include (if None, uses all numeric)
+            
+        Returns:
+            Dictionary with 'partial_correlation' and 'p_value' DataFrames and
+            the number of complete cases 'n'
+        """
+        from .correlation import correlation_p_values, partial_correlation_matrix
+        
+        if columns is None:
+            columns = data.select_dtypes(include=['number']).columns.tolist()
+        
+        complete = data[columns].dropna()
+        n = len(complete)
+        partial = partial_correlation_matrix(np.corrcoef(complete.to_numpy(dtype=float), rowvar=False))
+        # Each coefficient controls for p - 2 variables: df = n - p
+        p_values = correlation_p_values(partial, np.full(partial.shape, n - len(columns) + 2))
+        np.fill_diagonal(p_values, np.nan)
+        return {
+            'partial_correlation': pd.DataFrame(partial, index=columns, columns=columns),
+            'p_value': pd.DataFrame(p_values, index=columns, columns=columns),
+            'n': n
+        }
+    
+    @staticmethod
+    def path_analysis(data: pd.DataFrame, paths: Dict[str, List[str]]) -> Dict:
+        """
+        Standardized path coefficients for a recursive path (SEM) model
+        
+        Args:
+            data: DataFrame containing the model variables (listwise deletion)
+            paths: Mapping of each endogenous variable to its direct predictors,
+                e.g. {'ROISCORE': ['BLDGAGE'], 'CUSTSCORE': ['BLDGAGE', 'ROISCORE']}
+            
+        Returns:
+            Dictionary with a 'coefficients' DataFrame (one row per path with
+            beta, standard error, t and p-value), 'r_squared' per endogenous
+            variable and the number of complete cases 'n'
+        """
+        from scipy.stats import t as t_dist
+        from .correlation import path_coefficients
+        
+        variables = list(dict.fromkeys([*paths, *(p for preds in paths.values() for p in preds)]))
+        complete = data[variables].dropna()
+        n = len(complete)
+        correlation = np.corrcoef(complete.to_numpy(dtype=float), rowvar=False)
+        coefficients, inverse_diagonals, r_squared = path_coefficients(correlation, variables, paths)
+        
+        rows = []
+        for outcome, predictors in paths.items():
+            k = len(predictors)
+            dof = n - k - 1
+            standard_errors = np.sqrt((1 - r_squared[outcome]) / dof * inverse_diagonals[outcome])
+            t_values = coefficients[outcome] / standard_errors
+            for predictor, beta, se, t_value in zip(predictors, coefficients[outcome], standard_errors, t_values):
+                rows.append({
+                    'predictor': predictor,
+                    'outcome': outcome,
+                    'beta': float(beta),
+                    'std_error': float(se),
+                    't': float(t_value),
+                    'p_value': float(2 * t_dist.sf(abs(t_value), dof))
+                })
+        
+        return {
+            'coefficients': pd.DataFrame(rows),
+            'r_squared': r_squared,
+            'n': n
+        }
+    
+    @staticmethod
+    def adjust_p_values(p_values: Union[np.ndarray, pd.Series, List[float]],
+                        method: str = 'fdr_bh') -> Union[np.ndarray, pd.Series]:
+        """
+        Correct a family of p-values for multiple comparisons
+        
+        Args:
+            p_values: Raw p-values (NaNs are ignored)
+            method: 'bonferroni', 'holm', 'fdr_bh' or 'fdr_by'
+            
+        Returns:
+            Adjusted p-values in the same layout as the input
+        """
+        adjusted = adjust_p_values(np.asarray(p_values, dtype=float), method)
+        if isinstance(p_values, pd.Series):
+            return pd.Series(adjusted, index=p_values.index, name=p_values.name)
+        return adjusted
+    
+    @staticmethod
+    @result_cache.memoized(columns=_assumption_columns)
     def check_assumptions(data: pd.DataFrame, 
                          variables: List[str],
-                         test_type: str = 'normality') -> Dict:
+                         test_type: str = 'normality',
+                         correction: Optional[str] = None,
+                         method: str = 'auto',
+                         group_by: Optional[Union[str, List[str]]] = None) -> Dict:
         """
         Check statistical assumptions for analysis
         
         Args:
             data: DataFrame containing variables
             variables: List of variable names to test
-            test_type: Type of assumption test ('normality', 'homogeneity', etc.)
+            test_type: Type of assumption test ('normality' or 'homogeneity')
+            correction: Multiple-testing correction across all tests performed
+                ('bonferroni', 'holm', 'fdr_bh', 'fdr_by')
+            method: Normality test ('shapiro', 'dagostino', 'jarque_bera',
+                'anderson'); 'auto' picks one per variable from its sample
+                size (Shapiro-Wilk up to 50, Anderson-Darling up to 5,000,
+                D'Agostino K-squared above). Homogeneity test ('levene' or
+                'brown_forsythe'); 'auto' uses Brown-Forsythe
+            group_by: Grouping variable(s) for test_type='homogeneity'
             
         Returns:
-            Dictionary of test results
+            Dictionary of test results; for homogeneity, nested as
+            results[variable][grouping variable]
         """
-        from scipy import stats
+        from .normality import normality_tests
+        from .homogeneity import homogeneity_tests
         
         results = {}
         
+        if test_type == 'homogeneity':
+            if group_by is None:
+                raise ValueError("group_by is required for test_type='homogeneity'")
+            numeric = [var for var in variables if pd.api.types.is_numeric_dtype(data[var])]
+            tests = homogeneity_tests(data, numeric, group_by,
+                                      method='brown_forsythe' if method == 'auto' else method)
+            adjusted = adjust_optional(tests['p_value'].to_numpy(), correction)
+            for i, ((var, group), row) in enumerate(zip(tests.index, tests.itertuples(index=False))):
+                decision_p = row.p_value if adjusted is None else adjusted[i]
+                testable = bool(np.isfinite(decision_p))
+                entry = {
+                    'test': row.test,
+                    'statistic': float(row.statistic),
+                    'p_value': float(row.p_value),
+                    'df_between': int(row.df_between),
+                    'df_within': int(row.df_within),
+                    'equal_variance': decision_p > 0.05 if testable else None,
+                    'interpretation': ('Insufficient data' if not testable else
+                                       'Equal variances' if decision_p > 0.05 else 'Unequal variances')
+                }
+                if adjusted is not None:
+                    entry['p_value_adjusted'] = float(adjusted[i])
+                results.setdefault(var, {})[group] = entry
+        
         if test_type == 'normality':
-            for var in variables:
-                if pd.api.types.is_numeric_dtype(data[var]):
-                    # Shapiro-Wilk test for normality
-                    stat, p_value = stats.shapiro(data[var].dropna())
-                    results[var] = {
-                        'test': 'Shapiro-Wilk',
-                        'statistic': stat,
-                        'p_value': p_value,
-                        'normal': p_value > 0.05,
-                        'interpretation': 'Normal distribution' if p_value > 0.05 else 'Non-normal distribution'
-                    }
+            numeric = [var for var in variables if pd.api.types.is_numeric_dtype(data[var])]
+            tests = normality_tests(data[numeric], method=method)
+            for var, row in zip(numeric, tests.itertuples(index=False)):
+                normal, interpretation = _normality_verdict(row.p_value)
+                results[var] = {
+                    'test': row.test,
+                    'statistic': float(row.statistic),
+                    'p_value': float(row.p_value),
+                    'n': int(row.n),
+                    'skewness': float(row.skewness),
+                    'kurtosis': float(row.kurtosis),
+                    'normal': normal,
+                    'interpretation': interpretation
+                }
+            
+            adjusted = adjust_optional(np.array([entry['p_value'] for entry in results.values()]), correction)
+            if adjusted is not None:
+                for entry, p_adjusted in zip(results.values(), adjusted):
+                    entry['p_value_adjusted'] = float(p_adjusted)
+                    entry['normal'], entry['interpretation'] = _normality_verdict(p_adjusted)
         
         return results
     
     @staticmethod
-    def effect_size_cohens_d(group1: pd.Series, group2: pd.Series) -> float:
+    def effect_size_cohens_d(group1: pd.Series, group2: pd.Series,
+                             bootstrap_resamples: int = 0,
+                             ci_method: str = 'bca',
+                             confidence_level: float = 0.95,
+                             random_state: Optional[int] = None) -> Union[float, Dict]:
         """
         Calculate Cohen's d effect size
         
         Args:
             group1: First group data
             group2: Second group data
+            bootstrap_resamples: Number of bootstrap replicates for a confidence
+                interval (0 returns the point estimate only)
+            ci_method: Bootstrap interval type ('percentile' or 'bca')
+            confidence_level: Two-sided coverage of the interval
+            random_state: Seed for reproducible bootstrap intervals
             
         Returns:
-            Cohen's d effect size
+            Cohen's d effect size, or (with bootstrap_resamples) a dictionary
+            with 'cohens_d', 'ci_low', 'ci_high' and 'standard_error'
         """
         n1, n2 = len(group1), len(group2)
         s1, s2 = group1.std(ddof=1), group2.std(ddof=1)
@@ -338,11 +873,393 @@ class StatisticalAnalyzer:
         # Cohen's d
         d = (group1.mean() - group2.mean()) / pooled_std
         
-        return d
+        if not bootstrap_resamples:
+            return d
+        
+        from .bootstrap import bootstrap_ci, cohens_d_statistic
+        
+        interval = bootstrap_ci(
+            (group1.dropna().to_numpy(dtype=float), group2.dropna().to_numpy(dtype=float)),
+            cohens_d_statistic, paired=False, n_resamples=bootstrap_resamples,
+            confidence_level=confidence_level, method=ci_method, random_state=random_state)
+        return {
+            'cohens_d': d,
+            'ci_low': interval['ci_low'],
+            'ci_high': interval['ci_high'],
+            'standard_error': interval['standard_error'],
+            'confidence_level': confidence_level,
+            'method': ci_method
+        }
+    
+    @staticmethod
+    def compare_groups(data: pd.DataFrame,
+                       outcomes: List[str],
+                       groups: Union[str, List[str]],
+                       equal_var: Union[str, bool] = 'auto',
+                       levene_method: str = 'brown_forsythe',
+                       correction: Optional[str] = None,
+                       alpha: float = 0.05) -> pd.DataFrame:
+        """
+        Independent-samples t-tests for every outcome x grouping variable pair
+        
+        Args:
+            data: DataFrame containing outcomes and grouping variables
+            outcomes: Numeric outcome variables
+            groups: Grouping variable name(s); every pair of levels is compared
+            equal_var: True (Student), False (Welch) or 'auto' (decided per
+                comparison by Levene's test)
+            levene_method: 'brown_forsythe' (median-centered) or 'levene'
+            correction: Multiple-testing correction across all comparisons
+                ('bonferroni', 'holm', 'fdr_bh', 'fdr_by')
+            alpha: Significance level
+            
+        Returns:
+            DataFrame with one row per comparison: group sizes, means and
+            SDs, Levene result, t, df, p-value, Cohen's d and Hedges' g
+        """
+        from .group_comparison import compare_groups
+        
+        results = compare_groups(data, outcomes, groups, equal_var=equal_var,
+                                 levene_method=levene_method, alpha=alpha)
+        adjusted = adjust_optional(results['p_value'].to_numpy(dtype=float), correction)
+        if adjusted is not None:
+            results['p_value_adjusted'] = adjusted
+            results['significant'] = adjusted < alpha
+        return results
+    
+    @staticmethod
+    def permutation_test(data: pd.DataFrame,
+                         outcomes: Union[str, List[str]],
+                         group: str,
+                         statistic: str = 'mean_difference',
+                         n_permutations: int = 100_000,
+                         alpha: float = 0.05,
+                         early_stopping: bool = True,
+                         confidence_level: float = 0.99,
+                         correction: Optional[str] = None,
+                         random_state: Optional[int] = None) -> pd.DataFrame:
+        """
+        Permutation tests of group differences for non-normal outcomes
+        
+        A distribution-free alternative to compare_groups/one_way_anova for
+        variables that check_assumptions flags as non-normal. Permutations
+        stop early for an outcome once its p-value is clearly above or
+        below alpha.
+        
+        Args:
+            data: DataFrame containing outcomes and the grouping variable
+            outcomes: Numeric outcome variable(s)
+            group: Grouping variable
+            statistic: 'mean_difference' or 'welch_t' (two groups), or 'f'
+                (any number of groups)
+            n_permutations: Maximum permutations per outcome
+            alpha: Significance level (also the early-stopping boundary)
+            early_stopping: Stop drawing permutations for an outcome once its
+                p-value interval excludes alpha
+            confidence_level: Coverage of the Monte Carlo p-value interval
+                used for early stopping
+            correction: Multiple-testing correction across outcomes
+                ('bonferroni', 'holm', 'fdr_bh', 'fdr_by')
+            random_state: Seed for reproducible permutations
+            
+        Returns:
+            DataFrame indexed by outcome with the observed statistic, Monte
+            Carlo p-value, its confidence interval and permutations used
+        """
+        from .permutation import permutation_test
+        
+        outcomes = [outcomes] if isinstance(outcomes, str) else list(outcomes)
+        codes, _ = factorize_groups(data[group])
+        values = data[outcomes].to_numpy(dtype=float)[codes >= 0]
+        codes = codes[codes >= 0]
+        
+        # Outcomes without missing values share one run; the rest use their complete cases
+        complete = ~np.isnan(values).any(axis=0)
+        batches = [np.flatnonzero(complete)] + [[j] for j in np.flatnonzero(~complete)]
+        rows = {}
+        for columns in batches:
+            if len(columns) == 0:
+                continue
+            subset = values[:, columns]
+            observed = ~np.isnan(subset).any(axis=1)
+            subset_codes = pd.factorize(codes[observed], sort=True)[0]
+            result = permutation_test(subset[observed], subset_codes, statistic=statistic,
+                                      n_permutations=n_permutations,
+                                      alpha=alpha if early_stopping else None,
+                                      confidence_level=confidence_level, random_state=random_state)
+            for i, j in enumerate(columns):
+                rows[outcomes[j]] = {name: values_[i] for name, values_ in result.items()}
+        
+        results = pd.DataFrame.from_dict(rows, orient='index').reindex(outcomes)
+        results.index.name = 'outcome'
+        decision_p = adjust_optional(results['p_value'].to_numpy(dtype=float), correction)
+        if decision_p is not None:
+            results['p_value_adjusted'] = decision_p
+        else:
+            decision_p = results['p_value'].to_numpy(dtype=float)
+        results['significant'] = decision_p < alpha
+        return results
     
     @staticmethod
-    def chi_square_test(data: pd.DataFrame, col1: str, col2: str) -> Dict:
+    def one_way_anova(data: pd.DataFrame,
+                      outcomes: Union[str, List[str]],
+                      group: str,
+                      post_hoc: bool = True,
+                      correction: Optional[str] = None,
+                      confidence_level: float = 0.95,
+                      alpha: float = 0.05) -> Dict:
+        """
+        One-way ANOVA, Welch's ANOVA and Tukey HSD for many outcomes
+        
+        Args:
+            data: DataFrame containing outcomes and the grouping variable
+            outcomes: Numeric outcome variable(s)
+            group: Grouping variable
+            post_hoc: Run Tukey HSD comparisons of every pair of levels
+            correction: Multiple-testing correction of the ANOVA p-values
+                across outcomes ('bonferroni', 'holm', 'fdr_bh', 'fdr_by')
+            confidence_level: Coverage of the Tukey simultaneous intervals
+            alpha: Significance level
+            
+        Returns:
+            Dictionary with 'anova' (one row per outcome), 'group_statistics'
+            and, with post_hoc, 'tukey_hsd' DataFrames
+        """
+        from .anova import one_way_anova_frame
+        
+        outcomes = [outcomes] if isinstance(outcomes, str) else list(outcomes)
+        results = one_way_anova_frame(data, outcomes, group, post_hoc=post_hoc,
+                                      confidence_level=confidence_level, alpha=alpha)
+        return StatisticalAnalyzer._correct_anova(results, correction, alpha)
+    
+    @staticmethod
+    def one_way_anova_from_summary(summary: pd.DataFrame,
+                                   post_hoc: bool = True,
+                                   correction: Optional[str] = None,
+                                   confidence_level: float = 0.95,
+                                   alpha: float = 0.05) -> Dict:
+        """
+        One-way ANOVA from pre-aggregated group statistics
+        
+        Group counts, means and variances can be accumulated chunk by chunk
+        from a stream (or taken from a published table) and tested without
+        the raw observations.
+        
+        Args:
+            summary: DataFrame with 'count', 'mean' and 'var' (ddof=1)
+                columns, indexed by (outcome, level) or by level alone for a
+                single outcome
+            post_hoc: Run Tukey HSD comparisons of every pair of levels
+            correction: Multiple-testing correction of the ANOVA p-values
+                across outcomes ('bonferroni', 'holm', 'fdr_bh', 'fdr_by')
+            confidence_level: Coverage of the Tukey simultaneous intervals
+            alpha: Significance level
+            
+        Returns:
+            Dictionary with 'anova' and, with post_hoc, 'tukey_hsd' DataFrames
+        """
+        from .anova import one_way_anova, parse_summary
+        
+        counts, means, variances, outcomes, levels = parse_summary(summary)
+        results = one_way_anova(counts, means, variances, outcomes, levels, post_hoc=post_hoc,
+                                confidence_level=confidence_level, alpha=alpha)
+        return StatisticalAnalyzer._correct_anova(results, correction, alpha)
+    
+    @staticmethod
+    def _correct_anova(results: Dict, correction: Optional[str], alpha: float) -> Dict:
+        """Add adjusted ANOVA p-values across outcomes when a correction is requested"""
+        anova = results['anova']
+        for column, decision in (('p_value', 'significant'), ('welch_p_value', 'welch_significant')):
+            adjusted = adjust_optional(anova[column].to_numpy(dtype=float), correction)
+            if adjusted is not None:
+                anova[column + '_adjusted'] = adjusted
+                anova[decision] = adjusted < alpha
+        return results
+
+    @staticmethod
+    def multiple_regression(data: pd.DataFrame,
+                            outcomes: Union[str, List[str]],
+                            predictors: List[str],
+                            add_intercept: bool = True,
+                            confidence_level: float = 0.95,
+                            alpha: float = 0.05) -> Dict:
+        """
+        OLS multiple regression of one or many outcomes on shared predictors
+
+        All outcomes with the same missing-value pattern are solved with a
+        single QR factorization of the design matrix.
+
+        Args:
+            data: DataFrame containing outcomes and predictors
+            outcomes: Numeric outcome variable(s)
+            predictors: Predictor variables
+            add_intercept: Include a constant term
+            confidence_level: Coverage of the coefficient intervals
+            alpha: Significance level for the coefficient decisions
+
+        Returns:
+            Dictionary with 'coefficients' (one row per outcome x term),
+            'model' (R², adjusted R², F per outcome) and 'vif' tables
+        """
+        from .regression import ols
+
+        outcomes = [outcomes] if isinstance(outcomes, str) else list(outcomes)
+        results = ols(data, outcomes, list(predictors), add_intercept=add_intercept,
+                      confidence_level=confidence_level)
+        results['coefficients']['significant'] = results['coefficients']['p_value'] < alpha
+        unfitted = results['model'].index[results['model']['df_resid'] <= 0].tolist()
+        if unfitted:
+            logger.warning(f"Not enough complete observations to fit {unfitted}")
+        return results
+
+    @staticmethod
+    def streaming_regression(chunks: Iterable[pd.DataFrame],
+                             outcomes: Union[str, List[str]],
+                             predictors: List[str],
+                             confidence_level: float = 0.95,
+                             alpha: float = 0.05) -> Dict:
+        """
+        OLS multiple regression over row chunks (e.g. pd.read_csv(chunksize=...))
+
+        Only X'X, X'Y and outcome sums are kept in memory, so the data never
+        has to be loaded at once. Rows with any missing value are dropped and
+        the model always includes an intercept.
+
+        Args:
+            chunks: Iterable of DataFrames with the outcome and predictor columns
+            outcomes: Numeric outcome variable(s)
+            predictors: Predictor variables
+            confidence_level: Coverage of the coefficient intervals
+            alpha: Significance level for the coefficient decisions
+
+        Returns:
+            Same tables as multiple_regression, plus 'n_rows'
+        """
+        from .regression import streaming_ols
+
+        outcomes = [outcomes] if isinstance(outcomes, str) else list(outcomes)
+        results = streaming_ols(chunks, outcomes, list(predictors), confidence_level=confidence_level)
+        results['coefficients']['significant'] = results['coefficients']['p_value'] < alpha
+        return results
+
+    @staticmethod
+    def logistic_regression(data: pd.DataFrame,
+                            outcomes: Union[str, List[str]],
+                            predictors: List[str],
+                            add_intercept: bool = True,
+                            confidence_level: float = 0.95,
+                            alpha: float = 0.05,
+                            start: Optional[np.ndarray] = None,
+                            max_iter: int = 50) -> Dict:
+        """
+        Logistic regression (IRLS) of one or many binary outcomes
+
+        All outcomes are fitted together against the same design matrix;
+        each Newton iteration updates every unconverged model at once.
+
+        Args:
+            data: DataFrame containing outcomes and predictors
+            outcomes: Binary outcome variable(s); the larger of the two
+                observed values is modelled as the event
+            predictors: Predictor variables
+            add_intercept: Include a constant term
+            confidence_level: Coverage of the coefficient and odds-ratio intervals
+            alpha: Significance level for the coefficient decisions
+            start: Warm-start coefficients, e.g. from a previous fit, shaped
+                (terms,) or (terms, outcomes)
+            max_iter: Maximum Newton iterations
+
+        Returns:
+            Dictionary with 'coefficients' (one row per outcome x term, with
+            odds ratios) and 'model' (fit statistics per outcome) tables
+        """
+        from .logistic import logistic_regression
+
+        outcomes = [outcomes] if isinstance(outcomes, str) else list(outcomes)
+        results = logistic_regression(data, outcomes, list(predictors), add_intercept=add_intercept,
+                                      confidence_level=confidence_level, start=start, max_iter=max_iter)
+        return StatisticalAnalyzer._finish_logistic(results, alpha)
+
+    @staticmethod
+    def streaming_logistic_regression(chunk_source: Callable[[], Iterable[pd.DataFrame]],
+                                      outcomes: Union[str, List[str]],
+                                      predictors: List[str],
+                                      add_intercept: bool = True,
+                                      confidence_level: float = 0.95,
+                                      alpha: float = 0.05,
+                                      start: Optional[np.ndarray] = None,
+                                      max_iter: int = 50) -> Dict:
+        """
+        Logistic regression over row chunks, one pass per Newton iteration
+
+        Args:
+            chunk_source: Callable returning a fresh iterable of DataFrame
+                chunks on every call, e.g. lambda: pd.read_csv(path, chunksize=100_000)
+            outcomes, predictors, add_intercept, confidence_level, alpha,
+            start, max_iter: As for logistic_regression
+
+        Returns:
+            Same tables as logistic_regression
+        """
+        from .logistic import streaming_logistic_regression
+
+        outcomes = [outcomes] if isinstance(outcomes, str) else list(outcomes)
+        results = streaming_logistic_regression(chunk_source, outcomes, list(predictors),
+                                                add_intercept=add_intercept,
+                                                confidence_level=confidence_level,
+                                                start=start, max_iter=max_iter)
+        return StatisticalAnalyzer._finish_logistic(results, alpha)
+
+    @staticmethod
+    def _finish_logistic(results: Dict, alpha: float) -> Dict:
+        """Add coefficient decisions and report models that did not converge"""
+        results['coefficients']['significant'] = results['coefficients']['p_value'] < alpha
+        failed = results['model'].index[~results['model']['converged']].tolist()
+        if failed:
+            logger.warning(f"Logistic regression did not converge for {failed} "
+                           "(possible complete separation)")
+        return results
+    
+    @staticmethod
+    @result_cache.memoized(columns=lambda a: [a['col1'], a['col2']])
+    def chi_square_test(data: pd.DataFrame, col1: str, col2: str,
+                        sparse: Optional[bool] = None,
+                        sparse_threshold: int = 1_000_000) -> Dict:
+        """
+        Chi-square test of independence between two categorical variables
+        
+        Args:
+            data: DataFrame containing both variables
+            col1: Row variable
+            col2: Column variable
+            sparse: Build the table as a sparse matrix from factorized codes
+                and return 'expected' as a lazy ExpectedFrequencies object
+                (None: only when the dense table would exceed sparse_threshold cells)
+            sparse_threshold: Cell count above which sparse=None switches to
+                the sparse path
+            
+        Returns:
+            Dictionary with chi2, p_value, dof, expected and significance
+        """
         from scipy.stats import chi2_contingency
+        
+        if sparse is None or sparse:
+            from .contingency import sparse_chi_square, sparse_contingency_table
+            codes1, labels1 = factorize_groups(data[col1])
+            codes2, labels2 = factorize_groups(data[col2])
+            if sparse or len(labels1) * len(labels2) > sparse_threshold:
+                from scipy.stats import chi2 as chi2_dist
+                table = sparse_contingency_table(codes1, len(labels1), codes2, len(labels2))
+                chi2, dof, expected = sparse_chi_square(table, index=labels1, columns=labels2)
+                p_value = float(chi2_dist.sf(chi2, dof)) if dof > 0 else 1.0
+                return {
+                    'chi2': chi2,
+                    'p_value': p_value,
+                    'dof': dof,
+                    'expected': expected,
+                    'significant': p_value < 0.05
+                }
+        
         contingency_table = pd.crosstab(data[col1], data[col2])
         chi2, p_value, dof, expected = chi2_contingency(contingency_table)
         import numpy as np
@@ -361,6 +1278,41 @@ class StatisticalAnalyzer:
             'expected': expected,
             'significant': p_value_float < 0.05
         }
+    
+    @staticmethod
+    def chi_square_matrix(data: pd.DataFrame,
+                          columns: Optional[List[str]] = None,
+                          correction: Optional[str] = None,
+                          yates: bool = True) -> Dict:
+        """
+        Chi-square association matrix across many categorical variables
+        
+        Args:
+            data: DataFrame containing categorical variables
+            columns: Variables to cross-tabulate (if None, uses all
+                non-numeric columns)
+            correction: Multiple-testing correction over the distinct pairs
+                ('bonferroni', 'holm', 'fdr_bh', 'fdr_by')
+            yates: Apply Yates' continuity correction to 2x2 tables
+            
+        Returns:
+            Dictionary with 'chi2', 'dof', 'p_value', 'cramers_v' and 'n'
+            DataFrames (plus 'p_value_adjusted' when a correction is requested)
+        """
+        from .contingency import chi_square_matrix
+        
+        if columns is None:
+            columns = data.select_dtypes(exclude=['number']).columns.tolist()
+        
+        matrices = chi_square_matrix(data, columns, yates=yates)
+        if correction is not None:
+            upper = np.triu_indices(len(columns), k=1)
+            adjusted = np.full(matrices['p_value'].shape, np.nan)
+            adjusted[upper] = adjust_p_values(matrices['p_value'][upper], correction)
+            adjusted.T[upper] = adjusted[upper]
+            matrices['p_value_adjusted'] = adjusted
+        return {name: pd.DataFrame(matrix, index=columns, columns=columns)
+                for name, matrix in matrices.items()}
 
 def load_environment_config() -> Dict:
     """Load configuration from environment variables"""
@@ -0,0 +1,149 @@
+"""
+Group Comparison Utilities
+Pairwise t-tests and effect sizes computed from per-group sufficient statistics
+"""
+
+from typing import List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .homogeneity import HOMOGENEITY_TESTS, deviation_statistics, levene_from_statistics
+from .segments import factorize_groups
+
+
+def group_moments(data: pd.DataFrame, outcomes: List[str],
+                  codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-group count, mean and sample variance of every outcome in one groupby
+
+    Args:
+        data: DataFrame containing the outcomes
+        outcomes: Outcome columns
+        codes: Dense group code per row (negative codes are ignored)
+
+    Returns:
+        Tuple of (counts, means, variances), each of shape (p, groups)
+    """
+    valid = codes >= 0
+    summary = data.loc[valid, outcomes].groupby(codes[valid], sort=True).agg(['count', 'mean', 'var'])
+    return tuple(summary.xs(statistic, axis=1, level=1)[outcomes].to_numpy(dtype=float).T
+                 for statistic in ('count', 'mean', 'var'))
+
+
+def pairwise_t_tests(n1: np.ndarray, mean1: np.ndarray, var1: np.ndarray,
+                     n2: np.ndarray, mean2: np.ndarray, var2: np.ndarray,
+                     equal_var: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    Student or Welch two-sample t-tests and effect sizes from summary statistics
+
+    All arguments broadcast, so any number of outcome x pair combinations is
+    tested at once.
+
+    Returns:
+        Tuple of (t, df, p_value, cohens_d, hedges_g)
+    """
+    from scipy.special import gammaln
+    from scipy.stats import t as t_dist
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pooled_df = n1 + n2 - 2
+        pooled_var = ((n1 - 1) * var1 + (n2 - 1) * var2) / pooled_df
+        share1, share2 = var1 / n1, var2 / n2
+        welch_df = (share1 + share2) ** 2 / (share1 ** 2 / (n1 - 1) + share2 ** 2 / (n2 - 1))
+
+        difference = mean1 - mean2
+        standard_error = np.where(equal_var, np.sqrt(pooled_var * (1 / n1 + 1 / n2)),
+                                  np.sqrt(share1 + share2))
+        t_stat = difference / standard_error
+        df = np.where(equal_var, pooled_df, welch_df)
+        p_values = 2 * t_dist.sf(np.abs(t_stat), df)
+
+        cohens_d = difference / np.sqrt(pooled_var)
+        correction = np.exp(gammaln(pooled_df / 2) - gammaln((pooled_df - 1) / 2)) / np.sqrt(pooled_df / 2)
+        hedges_g = cohens_d * correction
+    return t_stat, df, p_values, cohens_d, hedges_g
+
+
+def compare_groups(data: pd.DataFrame,
+                   outcomes: List[str],
+                   groups: Union[str, List[str]],
+                   equal_var: Union[str, bool] = 'auto',
+                   levene_method: str = 'brown_forsythe',
+                   alpha: float = 0.05) -> pd.DataFrame:
+    """
+    Two-sample comparisons of every outcome between every pair of group levels
+
+    Each grouping variable is factorized once. Group counts, means and
+    variances come from a single groupby aggregation, and Levene deviation
+    statistics from one batched pass; every pairwise test is then computed
+    from those arrays without slicing the data again.
+
+    Args:
+        data: DataFrame containing outcomes and grouping variables
+        outcomes: Numeric outcome columns
+        groups: Grouping column name or list of names
+        equal_var: True (Student), False (Welch) or 'auto' (Student when the
+            pair's Levene test is not significant at alpha, as in the report scripts)
+        levene_method: 'brown_forsythe' or 'levene'
+        alpha: Significance level for the Levene and t-test decisions
+
+    Returns:
+        DataFrame with one row per outcome x grouping variable x level pair
+    """
+    if levene_method not in HOMOGENEITY_TESTS:
+        raise ValueError(f"levene_method must be one of {list(HOMOGENEITY_TESTS)}")
+    groups = [groups] if isinstance(groups, str) else list(groups)
+    _, center = HOMOGENEITY_TESTS[levene_method]
+    values = data[outcomes].to_numpy(dtype=float)
+
+    frames = []
+    for group in groups:
+        codes, labels = factorize_groups(data[group])
+        first, second = np.triu_indices(len(labels), k=1)
+        if first.size == 0:
+            continue
+        counts, means, variances = group_moments(data, outcomes, codes)
+        deviation_counts, deviation_means, deviation_squares = deviation_statistics(values, codes, center)
+
+        pair = np.stack([first, second], axis=1)
+        levene_stat, levene_p, _, _ = levene_from_statistics(
+            deviation_counts[:, pair], deviation_means[:, pair], deviation_squares[:, pair])
+        if equal_var == 'auto':
+            assume_equal = ~(levene_p <= alpha)
+        else:
+            assume_equal = np.full(levene_p.shape, bool(equal_var))
+
+        t_stat, df, p_values, cohens_d, hedges_g = pairwise_t_tests(
+            counts[:, first], means[:, first], variances[:, first],
+            counts[:, second], means[:, second], variances[:, second], assume_equal)
+
+        n_pairs = first.size
+        frames.append(pd.DataFrame({
+            'outcome': np.repeat(outcomes, n_pairs),
+            'group': group,
+            'level_1': np.tile(labels[first], len(outcomes)),
+            'level_2': np.tile(labels[second], len(outcomes)),
+            'n_1': counts[:, first].ravel().astype(np.int64),
+            'n_2': counts[:, second].ravel().astype(np.int64),
+            'mean_1': means[:, first].ravel(),
+            'mean_2': means[:, second].ravel(),
+            'std_1': np.sqrt(variances[:, first]).ravel(),
+            'std_2': np.sqrt(variances[:, second]).ravel(),
+            'mean_difference': (means[:, first] - means[:, second]).ravel(),
+            'levene_statistic': levene_stat.ravel(),
+            'levene_p_value': levene_p.ravel(),
+            'equal_variance': assume_equal.ravel(),
+            'test': np.where(assume_equal, 'Student t', 'Welch t').ravel(),
+            't_statistic': t_stat.ravel(),
+            'df': df.ravel(),
+            'p_value': p_values.ravel(),
+            'cohens_d': cohens_d.ravel(),
+            'hedges_g': hedges_g.ravel()
+        }))
+
+    if not frames:
+        return pd.DataFrame(columns=['outcome', 'group', 'level_1', 'level_2', 't_statistic', 'p_value'])
+    results = pd.concat(frames, ignore_index=True)
+    results['significant'] = results['p_value'] < alpha
+    return results
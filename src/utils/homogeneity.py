@@ -0,0 +1,177 @@
+"""
+Homogeneity-of-Variance Utilities
+Levene and Brown-Forsythe tests batched over many outcome columns
+"""
+
+import warnings
+from typing import List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .segments import factorize_groups
+
+HOMOGENEITY_TESTS = {
+    'levene': ('Levene', 'mean'),
+    'brown_forsythe': ('Brown-Forsythe', 'median')
+}
+
+
+def _sorted_segments(codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Row order grouping rows by code, plus segment starts and lengths"""
+    valid = np.flatnonzero(codes >= 0)
+    order = valid[np.argsort(codes[valid], kind='stable')]
+    lengths = np.bincount(codes[valid])
+    starts = np.cumsum(lengths) - lengths
+    return order, starts, lengths
+
+
+def _group_centers(values: np.ndarray, starts: np.ndarray, lengths: np.ndarray,
+                   center: str) -> np.ndarray:
+    """(p, groups) centers of a (p, n) matrix whose rows are segment-ordered"""
+    if center == 'mean':
+        observed = ~np.isnan(values)
+        sums = np.add.reduceat(np.where(observed, values, 0.0), starts, axis=1)
+        counts = np.add.reduceat(observed, starts, axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return sums / counts
+    # One partition per group covers every outcome at once
+    median = np.nanmedian if np.isnan(values).any() else np.median
+    centers = np.empty((values.shape[0], starts.size))
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        for g, (start, length) in enumerate(zip(starts, lengths)):
+            centers[:, g] = median(values[:, start:start + length], axis=1)
+    return centers
+
+
+def deviation_statistics(values: np.ndarray, codes: np.ndarray,
+                         center: str = 'median') -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Per-group sufficient statistics of absolute deviations from the group center
+
+    Observations are ordered by group once; group centers, absolute
+    deviations and their group moments then come from segment reductions
+    over all outcomes. Work is done on the (p, n) transpose so that every
+    reduction runs over contiguous memory. Missing outcome values are
+    dropped per column.
+
+    Args:
+        values: Outcome matrix of shape (n, p)
+        codes: Group code per row (negative codes are ignored)
+        center: 'mean' (Levene) or 'median' (Brown-Forsythe)
+
+    Returns:
+        Tuple of (counts, means, sums of squares) of the deviations, each of
+        shape (p, groups)
+    """
+    order, starts, lengths = _sorted_segments(codes)
+    if lengths.size == 0:
+        # No row has a group (e.g. an all-missing grouping column)
+        empty = np.zeros((values.shape[1], 0))
+        return empty, empty.copy(), empty.copy()
+    values = np.ascontiguousarray(values.T)[:, order]
+    missing = np.isnan(values)
+    has_missing = missing.any()
+
+    centers = _group_centers(values, starts, lengths, center)
+    deviations = np.subtract(values, np.repeat(centers, lengths, axis=1), out=values)
+    np.abs(deviations, out=deviations)
+    if has_missing:
+        deviations[missing] = 0.0
+        counts = np.add.reduceat(~missing, starts, axis=1).astype(float)
+    else:
+        counts = np.broadcast_to(lengths.astype(float), (values.shape[0], lengths.size))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = np.add.reduceat(deviations, starts, axis=1) / counts
+    deviations -= np.repeat(np.nan_to_num(means), lengths, axis=1)
+    if has_missing:
+        deviations[missing] = 0.0
+    squares = np.add.reduceat(deviations * deviations, starts, axis=1)
+    return counts, means, squares
+
+
+def levene_from_statistics(counts: np.ndarray, means: np.ndarray,
+                           squares: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    Levene-type W test from per-group deviation statistics
+
+    The last axis indexes groups, so any subset of groups (e.g. every pair)
+    can be tested without touching the observations again.
+
+    Returns:
+        Tuple of (W, p_value, df_between, df_within)
+    """
+    from scipy.stats import f as f_dist
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        n = counts.sum(axis=-1)
+        k = (counts > 0).sum(axis=-1)
+        grand_mean = np.nansum(counts * means, axis=-1) / n
+        between = np.nansum(counts * (means - grand_mean[..., None]) ** 2, axis=-1)
+        within = squares.sum(axis=-1)
+        df_between = np.maximum(k - 1, 0)
+        df_within = n - k
+        statistic = (df_within / df_between) * between / within
+    statistic = np.where((df_between > 0) & (df_within > 0), statistic, np.nan)
+    p_values = f_dist.sf(statistic, df_between, df_within)
+    return statistic, p_values, df_between, df_within
+
+
+def homogeneity_test(values: np.ndarray, codes: np.ndarray,
+                     center: str = 'median') -> Tuple[np.ndarray, ...]:
+    """
+    Levene-type W statistics for every column of an outcome matrix
+
+    Args:
+        values: Outcome matrix of shape (n, p)
+        codes: Group code per row (negative codes are ignored)
+        center: 'mean' (Levene) or 'median' (Brown-Forsythe)
+
+    Returns:
+        Tuple of (W, p_value, df_between, df_within) arrays of shape (p,)
+    """
+    return levene_from_statistics(*deviation_statistics(values, codes, center))
+
+
+def homogeneity_tests(data: pd.DataFrame,
+                      outcomes: List[str],
+                      group_by: Union[str, List[str]],
+                      method: str = 'brown_forsythe') -> pd.DataFrame:
+    """
+    Homogeneity-of-variance tests for every outcome x grouping variable pair
+
+    Each grouping variable is factorized once and tested against all
+    outcomes in a single batched pass.
+
+    Args:
+        data: DataFrame containing outcomes and grouping variables
+        outcomes: Numeric outcome columns
+        group_by: Grouping column name or list of names
+        method: 'brown_forsythe' (median-centered, as scipy.stats.levene's
+            default) or 'levene' (mean-centered)
+
+    Returns:
+        DataFrame indexed by (outcome, group) with test, statistic, p_value,
+        df_between and df_within
+    """
+    if method not in HOMOGENEITY_TESTS:
+        raise ValueError(f"method must be one of {list(HOMOGENEITY_TESTS)}")
+    name, center = HOMOGENEITY_TESTS[method]
+    groups = [group_by] if isinstance(group_by, str) else list(group_by)
+    values = data[outcomes].to_numpy(dtype=float)
+
+    frames = []
+    for group in groups:
+        codes, _ = factorize_groups(data[group])
+        statistic, p_values, df_between, df_within = homogeneity_test(values, codes, center)
+        frames.append(pd.DataFrame({
+            'outcome': outcomes,
+            'group': group,
+            'test': name,
+            'statistic': statistic,
+            'p_value': p_values,
+            'df_between': df_between.astype(np.int64),
+            'df_within': df_within.astype(np.int64)
+        }))
+    return pd.concat(frames, ignore_index=True).set_index(['outcome', 'group'])
@@ -0,0 +1,322 @@
+"""
+Logistic Regression Utilities
+Batched IRLS (Newton-Raphson) fits of many binary outcomes on a shared design
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .regression import _check_rank, _design
+
+
+def binary_events(values: np.ndarray, outcomes: List[str]) -> np.ndarray:
+    """
+    Event level of each binary outcome: the larger of its two observed values
+
+    Binary survey items are often coded 1/2 rather than 0/1, so any two
+    distinct values are accepted; the larger one is modelled as the event.
+
+    Args:
+        values: (n, m) outcome matrix (NaN for missing)
+        outcomes: Outcome names for error messages
+
+    Returns:
+        (m,) array of event levels
+    """
+    events = np.empty(values.shape[1])
+    for j, name in enumerate(outcomes):
+        levels = np.unique(values[:, j][~np.isnan(values[:, j])])
+        if levels.size != 2:
+            raise ValueError(f"Outcome '{name}' must have exactly two observed values, found {levels.size}")
+        events[j] = levels[1]
+    return events
+
+
+def _encode(values: np.ndarray, events: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """0/1 outcome matrix and observed mask; missing outcomes get zero weight"""
+    observed = ~np.isnan(values)
+    return (values == events).astype(float), observed.astype(float)
+
+
+def newton_terms(X: np.ndarray, Y: np.ndarray, observed: np.ndarray,
+                 coefficients: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Log-likelihood derivatives of a batch of logistic models on one block of rows
+
+    Weights mu(1 - mu) of every outcome are formed at once; rows where an
+    outcome is missing get zero weight, so outcomes with different missing
+    patterns still share the design matrix. Terms from row blocks add up.
+
+    Args:
+        X: (n, k) design matrix
+        Y: (n, m) 0/1 outcomes
+        observed: (n, m) 0/1 observation mask
+        coefficients: (k, m) current coefficients
+
+    Returns:
+        Tuple of (information matrices (m, k, k), gradients (k, m),
+        log-likelihoods (m,))
+    """
+    from scipy.special import expit, log_expit
+
+    eta = X @ coefficients
+    mu = expit(eta)
+    weights = mu * (1 - mu) * observed
+    gradient = X.T @ ((Y - mu) * observed)
+    information = np.einsum('ni,nm,nj->mij', X, weights, X, optimize=True)
+    loglik = (observed * (Y * log_expit(eta) + (1 - Y) * log_expit(-eta))).sum(axis=0)
+    return information, gradient, loglik
+
+
+def _newton_step(information: np.ndarray, gradient: np.ndarray) -> np.ndarray:
+    """Solve every outcome's k x k Newton system in one batched call"""
+    try:
+        return np.linalg.solve(information, gradient.T[..., None])[..., 0].T
+    except np.linalg.LinAlgError:
+        # Separated or collinear outcomes make some systems singular
+        return np.einsum('mij,jm->im', np.linalg.pinv(information), gradient)
+
+
+def irls(evaluate: Callable[[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray, np.ndarray]],
+         start: np.ndarray, max_iter: int = 50,
+         tol: float = 1e-8) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Newton-Raphson (IRLS) iterations for a batch of logistic models
+
+    Outcomes that have converged drop out of later iterations, so each
+    pass only evaluates the models still moving.
+
+    Args:
+        evaluate: Callable(coefficients (k, a), active outcome indices) returning
+            newton_terms() summed over all rows
+        start: (k, m) starting coefficients (warm start)
+        max_iter: Maximum Newton iterations
+        tol: Convergence tolerance on the largest coefficient step
+
+    Returns:
+        Tuple of (coefficients (k, m), information matrices (m, k, k),
+        log-likelihoods (m,), iterations (m,), converged flags (m,))
+    """
+    coefficients = np.array(start, dtype=float)
+    k, m = coefficients.shape
+    information = np.full((m, k, k), np.nan)
+    loglik = np.full(m, np.nan)
+    iterations = np.zeros(m, dtype=np.int64)
+    converged = np.zeros(m, dtype=bool)
+    active = np.arange(m)
+
+    for iteration in range(1, max_iter + 1):
+        block_information, gradient, block_loglik = evaluate(coefficients[:, active], active)
+        step = _newton_step(block_information, gradient)
+        coefficients[:, active] += step
+        information[active] = block_information
+        loglik[active] = block_loglik
+        iterations[active] = iteration
+
+        size = np.abs(coefficients[:, active]).max(axis=0)
+        done = np.abs(step).max(axis=0) <= tol * (1 + size)
+        converged[active[done]] = True
+        active = active[~done]
+        if not active.size:
+            break
+    return coefficients, information, loglik, iterations, converged
+
+
+def _start_values(events: np.ndarray, n: np.ndarray, k: int, add_intercept: bool,
+                  start: Optional[np.ndarray]) -> np.ndarray:
+    """User-supplied warm start, or the intercept-only fit (logit of each event rate)"""
+    m = n.size
+    if start is not None:
+        start = np.asarray(start, dtype=float)
+        return np.array(np.broadcast_to(start.reshape(k, -1), (k, m)))
+    coefficients = np.zeros((k, m))
+    if add_intercept:
+        rate = np.clip(events / n, 1e-6, 1 - 1e-6)
+        coefficients[0] = np.log(rate / (1 - rate))
+    return coefficients
+
+
+def _null_loglik(events: np.ndarray, n: np.ndarray, add_intercept: bool) -> np.ndarray:
+    """Log-likelihood of the intercept-only model (p = 0.5 without an intercept)"""
+    from scipy.special import xlogy
+
+    if not add_intercept:
+        return n * np.log(0.5)
+    rate = events / n
+    return xlogy(events, rate) + xlogy(n - events, 1 - rate)
+
+
+def logistic_tables(coefficients: np.ndarray, information: np.ndarray, loglik: np.ndarray,
+                    null_loglik: np.ndarray, n: np.ndarray, iterations: np.ndarray,
+                    converged: np.ndarray, events: np.ndarray, terms: List[str],
+                    outcomes: List[str], has_intercept: bool,
+                    confidence_level: float = 0.95) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Coefficient (with odds ratios) and model-fit tables from fitted IRLS models
+
+    Returns:
+        Tuple of (long coefficient table, per-outcome model table)
+    """
+    from scipy.stats import chi2, norm
+
+    k, m = coefficients.shape
+    with np.errstate(divide='ignore', invalid='ignore'):
+        try:
+            covariance = np.linalg.inv(information)
+        except np.linalg.LinAlgError:
+            covariance = np.linalg.pinv(information)
+        std_errors = np.sqrt(np.diagonal(covariance, axis1=1, axis2=2)).T
+        z_stat = coefficients / std_errors
+        p_values = 2 * norm.sf(np.abs(z_stat))
+        margin = norm.ppf(0.5 + confidence_level / 2) * std_errors
+        ci_low, ci_high = coefficients - margin, coefficients + margin
+
+        df_model = k - int(has_intercept)
+        llr = 2 * (loglik - null_loglik)
+        llr_p = chi2.sf(llr, df_model) if df_model > 0 else np.full(m, np.nan)
+        pseudo_r_squared = 1 - loglik / null_loglik
+
+    coefficient_table = pd.DataFrame({
+        'outcome': np.repeat(outcomes, k),
+        'term': np.tile(terms, m),
+        'coefficient': coefficients.T.ravel(),
+        'std_error': std_errors.T.ravel(),
+        'z_statistic': z_stat.T.ravel(),
+        'p_value': p_values.T.ravel(),
+        'ci_low': ci_low.T.ravel(),
+        'ci_high': ci_high.T.ravel(),
+        'odds_ratio': np.exp(coefficients).T.ravel(),
+        'odds_ratio_ci_low': np.exp(ci_low).T.ravel(),
+        'odds_ratio_ci_high': np.exp(ci_high).T.ravel()
+    })
+    model_table = pd.DataFrame({
+        'n': n.astype(np.int64),
+        'event': events,
+        'log_likelihood': loglik,
+        'null_log_likelihood': null_loglik,
+        'pseudo_r_squared': pseudo_r_squared,
+        'llr': llr,
+        'llr_p_value': llr_p,
+        'df_model': df_model,
+        'aic': 2 * k - 2 * loglik,
+        'iterations': iterations,
+        'converged': converged
+    }, index=pd.Index(outcomes, name='outcome'))
+    return coefficient_table, model_table
+
+
+def logistic_regression(data: pd.DataFrame, outcomes: List[str], predictors: List[str],
+                        add_intercept: bool = True, confidence_level: float = 0.95,
+                        start: Optional[np.ndarray] = None, max_iter: int = 50,
+                        tol: float = 1e-8) -> Dict[str, pd.DataFrame]:
+    """
+    Logistic regression of many binary outcomes on shared predictors
+
+    Rows with missing predictors are dropped; missing outcome values only
+    remove the row from that outcome's model.
+
+    Args:
+        data: DataFrame containing outcomes and predictors
+        outcomes: Binary outcome columns (any two distinct values)
+        predictors: Predictor columns
+        add_intercept: Include a constant term
+        confidence_level: Coverage of the coefficient and odds-ratio intervals
+        start: Warm-start coefficients, (k,) shared or (k, m) per outcome
+        max_iter: Maximum Newton iterations
+        tol: Convergence tolerance on the largest coefficient step
+
+    Returns:
+        Dictionary with 'coefficients' (long) and 'model' (per outcome) tables
+    """
+    rows = data[predictors].notna().all(axis=1).to_numpy()
+    frame = data.loc[rows]
+    X, terms = _design(frame, predictors, add_intercept)
+    values = frame[outcomes].to_numpy(dtype=float)
+    events = binary_events(values, outcomes)
+    Y, observed = _encode(values, events)
+    _check_rank(np.linalg.qr(X, mode='r').diagonal(), terms)
+
+    n = observed.sum(axis=0)
+    n_events = (Y * observed).sum(axis=0)
+    start = _start_values(n_events, n, len(terms), add_intercept, start)
+
+    def evaluate(coefficients: np.ndarray, active: np.ndarray):
+        return newton_terms(X, Y[:, active], observed[:, active], coefficients)
+
+    coefficients, information, loglik, iterations, converged = irls(evaluate, start, max_iter, tol)
+    coefficient_table, model_table = logistic_tables(
+        coefficients, information, loglik, _null_loglik(n_events, n, add_intercept), n,
+        iterations, converged, events, terms, list(outcomes), add_intercept, confidence_level)
+    return {'coefficients': coefficient_table, 'model': model_table}
+
+
+def streaming_logistic_regression(chunk_source: Callable[[], Iterable[pd.DataFrame]],
+                                  outcomes: List[str], predictors: List[str],
+                                  add_intercept: bool = True, confidence_level: float = 0.95,
+                                  start: Optional[np.ndarray] = None, max_iter: int = 50,
+                                  tol: float = 1e-8) -> Dict[str, pd.DataFrame]:
+    """
+    Logistic regression over row chunks that are never held in memory together
+
+    Each Newton iteration is one pass over the chunks, summing the
+    information matrices, gradients and log-likelihoods of every outcome; a
+    first pass finds the event levels, the counts used for the warm start
+    and X'X for the rank check.
+
+    Args:
+        chunk_source: Callable returning a fresh iterable of DataFrame chunks
+            on every call (e.g. lambda: pd.read_csv(path, chunksize=100_000))
+        outcomes, predictors, add_intercept, confidence_level, start,
+        max_iter, tol: As for logistic_regression()
+
+    Returns:
+        Dictionary with 'coefficients' and 'model' tables
+    """
+    columns = list(predictors) + list(outcomes)
+
+    def blocks():
+        for chunk in chunk_source():
+            chunk = chunk[columns]
+            chunk = chunk[chunk[predictors].notna().all(axis=1)]
+            if not chunk.empty:
+                yield chunk
+
+    levels = [set() for _ in outcomes]
+    for chunk in blocks():
+        values = chunk[outcomes].to_numpy(dtype=float)
+        for j in range(len(outcomes)):
+            levels[j].update(np.unique(values[:, j][~np.isnan(values[:, j])]).tolist())
+            if len(levels[j]) > 2:
+                raise ValueError(f"Outcome '{outcomes[j]}' has more than two observed values")
+    events = binary_events(np.array([sorted(level) + [np.nan] * (2 - len(level)) for level in levels]).T,
+                           list(outcomes))
+
+    terms = (['const'] if add_intercept else []) + list(predictors)
+    n = np.zeros(len(outcomes))
+    n_events = np.zeros(len(outcomes))
+    cross_products = np.zeros((len(terms), len(terms)))
+    for chunk in blocks():
+        X, _ = _design(chunk, predictors, add_intercept)
+        Y, observed = _encode(chunk[outcomes].to_numpy(dtype=float), events)
+        n += observed.sum(axis=0)
+        n_events += (Y * observed).sum(axis=0)
+        cross_products += X.T @ X
+    _check_rank(np.linalg.qr(cross_products, mode='r').diagonal(), terms)
+    start = _start_values(n_events, n, len(terms), add_intercept, start)
+
+    def evaluate(coefficients: np.ndarray, active: np.ndarray):
+        totals = None
+        for chunk in blocks():
+            X, _ = _design(chunk, predictors, add_intercept)
+            Y, observed = _encode(chunk[outcomes].to_numpy(dtype=float)[:, active], events[active])
+            block = newton_terms(X, Y, observed, coefficients)
+            totals = block if totals is None else tuple(a + b for a, b in zip(totals, block))
+        return totals
+
+    coefficients, information, loglik, iterations, converged = irls(evaluate, start, max_iter, tol)
+    coefficient_table, model_table = logistic_tables(
+        coefficients, information, loglik, _null_loglik(n_events, n, add_intercept), n,
+        iterations, converged, events, terms, list(outcomes), add_intercept, confidence_level)
+    return {'coefficients': coefficient_table, 'model': model_table}
@@ -0,0 +1,64 @@
+"""
+Multiple Testing Utilities
+Vectorized family-wise error and false discovery rate p-value corrections
+"""
+
+from typing import Optional
+
+import numpy as np
+
+CORRECTION_METHODS = ['bonferroni', 'holm', 'fdr_bh', 'fdr_by']
+
+
+def adjust_p_values(p_values: np.ndarray, method: str = 'fdr_bh') -> np.ndarray:
+    """
+    Adjust a family of p-values for multiple comparisons
+
+    All methods share a single argsort of the p-values; the step-down and
+    step-up adjustments are cumulative max/min passes over the sorted array.
+    Missing p-values stay missing and do not count towards the family size.
+
+    Args:
+        p_values: Array of raw p-values (any shape)
+        method: 'bonferroni', 'holm' (step-down FWER), 'fdr_bh'
+            (Benjamini-Hochberg) or 'fdr_by' (Benjamini-Yekutieli)
+
+    Returns:
+        Array of adjusted p-values with the same shape as `p_values`
+    """
+    if method not in CORRECTION_METHODS:
+        raise ValueError(f"method must be one of {CORRECTION_METHODS}")
+
+    p_values = np.asarray(p_values, dtype=float)
+    flat = p_values.ravel()
+    adjusted = np.full(flat.shape, np.nan)
+    present = np.flatnonzero(~np.isnan(flat))
+    m = present.size
+    if m == 0:
+        return adjusted.reshape(p_values.shape)
+
+    if method == 'bonferroni':
+        adjusted[present] = np.minimum(flat[present] * m, 1.0)
+        return adjusted.reshape(p_values.shape)
+
+    order = present[np.argsort(flat[present], kind='stable')]
+    ranked = flat[order]
+    ranks = np.arange(1, m + 1)
+
+    if method == 'holm':
+        stepped = np.maximum.accumulate((m - ranks + 1) * ranked)
+    else:
+        stepped = ranked * m / ranks
+        if method == 'fdr_by':
+            stepped *= np.sum(1.0 / ranks)
+        stepped = np.minimum.accumulate(stepped[::-1])[::-1]
+
+    adjusted[order] = np.minimum(stepped, 1.0)
+    return adjusted.reshape(p_values.shape)
+
+
+def adjust_optional(p_values: np.ndarray, method: Optional[str]) -> Optional[np.ndarray]:
+    """adjust_p_values, or None when no correction was requested"""
+    if method is None:
+        return None
+    return adjust_p_values(p_values, method)
@@ -0,0 +1,159 @@
+"""
+Permutation Test Utilities
+Block-vectorized permutation tests with sequential early stopping
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+PERMUTATION_STATISTICS = ['mean_difference', 'welch_t', 'f']
+
+
+def _statistics(indicators: np.ndarray, values: np.ndarray, squares: np.ndarray,
+                totals: Tuple[np.ndarray, np.ndarray], sizes: np.ndarray,
+                statistic: str) -> np.ndarray:
+    """
+    Test statistic of every labelling in a block
+
+    Args:
+        indicators: (groups, block, n) 0/1 group-membership matrices
+        values: (n, p) outcome matrix; squares is its elementwise square
+        totals: Column sums and sums of squares over all rows
+        sizes: Group sizes (fixed under permutation)
+
+    Returns:
+        (block, p) array of statistics
+    """
+    sums = indicators @ values
+    if statistic == 'f':
+        total, total_squares = totals
+        n = sizes.sum()
+        between = (sums ** 2 / sizes[:, None, None]).sum(axis=0) - total ** 2 / n
+        within = total_squares - total ** 2 / n - between
+        k = sizes.size
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (between / (k - 1)) / (within / (n - k))
+
+    n1, n2 = sizes
+    sum1 = sums[0]
+    sum2 = totals[0] - sum1
+    difference = sum1 / n1 - sum2 / n2
+    if statistic == 'mean_difference':
+        return difference
+    squares1 = indicators[0] @ squares
+    squares2 = totals[1] - squares1
+    var1 = (squares1 - sum1 ** 2 / n1) / (n1 - 1)
+    var2 = (squares2 - sum2 ** 2 / n2) / (n2 - 1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return difference / np.sqrt(var1 / n1 + var2 / n2)
+
+
+def clopper_pearson(successes: np.ndarray, trials: np.ndarray,
+                    confidence_level: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Exact binomial confidence interval for a proportion"""
+    from scipy.stats import beta
+
+    tail = (1 - confidence_level) / 2
+    with np.errstate(invalid='ignore'):
+        low = np.where(successes > 0, beta.ppf(tail, successes, trials - successes + 1), 0.0)
+        high = np.where(successes < trials, beta.ppf(1 - tail, successes + 1, trials - successes), 1.0)
+    return low, high
+
+
+def permutation_test(values: np.ndarray,
+                     codes: np.ndarray,
+                     statistic: str = 'mean_difference',
+                     n_permutations: int = 100_000,
+                     alpha: Optional[float] = 0.05,
+                     confidence_level: float = 0.99,
+                     block_size: int = 1000,
+                     max_block_elements: int = 2 ** 24,
+                     random_state: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """
+    Monte Carlo permutation test for many outcomes sharing the same groups
+
+    Group labels are permuted a block at a time from one seeded generator.
+    Each block becomes 0/1 group-indicator matrices, so the group sums of all
+    outcomes under every permutation in the block are one matrix product.
+    After each block, a Clopper-Pearson interval for each outcome's p-value
+    is checked; outcomes whose interval lies entirely above or below alpha
+    stop drawing permutations, and the test ends once all are decided.
+
+    Args:
+        values: Complete (n, p) outcome matrix
+        codes: Dense group code per row (0 .. groups - 1)
+        statistic: 'mean_difference' or 'welch_t' (two groups, two-sided),
+            or 'f' (one-way ANOVA F, any number of groups)
+        n_permutations: Maximum number of permutations per outcome
+        alpha: Decision threshold for early stopping (None disables it)
+        confidence_level: Coverage of the p-value interval used to stop
+        block_size: Permutations per block
+        max_block_elements: Cap on block_size * n * groups (bounds indicator memory)
+        random_state: Seed for reproducible permutations
+
+    Returns:
+        Dictionary of (p,) arrays: statistic, p_value, n_permutations,
+        p_value_ci_low, p_value_ci_high and stopped_early
+    """
+    if statistic not in PERMUTATION_STATISTICS:
+        raise ValueError(f"statistic must be one of {PERMUTATION_STATISTICS}")
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[:, None]
+    codes = np.asarray(codes, dtype=np.int64)
+    sizes = np.bincount(codes).astype(float)
+    if statistic != 'f' and sizes.size != 2:
+        raise ValueError(f"statistic='{statistic}' compares exactly two groups; use statistic='f'")
+
+    n, p = values.shape
+    squares = values * values
+    totals = (values.sum(axis=0), squares.sum(axis=0))
+    levels = np.arange(sizes.size)[:, None, None]
+
+    def evaluate(labels: np.ndarray, columns: np.ndarray) -> np.ndarray:
+        indicators = (labels[None, :, :] == levels).astype(float)
+        column_totals = (totals[0][columns], totals[1][columns])
+        return _statistics(indicators, values[:, columns], squares[:, columns],
+                           column_totals, sizes, statistic)
+
+    observed = evaluate(codes[None, :], np.arange(p))[0]
+    two_sided = statistic != 'f'
+    target = np.abs(observed) if two_sided else observed
+    # Relative tolerance so ties with the observed labelling count as exceedances
+    threshold = target - 1e-12 * np.maximum(np.abs(target), 1.0)
+
+    rng = np.random.default_rng(random_state)
+    block_size = max(1, min(block_size, max_block_elements // max(n * sizes.size, 1)))
+    exceedances = np.zeros(p)
+    drawn = np.zeros(p)
+    active = np.flatnonzero(np.isfinite(observed))
+
+    while active.size:
+        size = int(min(block_size, n_permutations - drawn[active].max()))
+        if size <= 0:
+            break
+        labels = rng.permuted(np.broadcast_to(codes, (size, n)), axis=1)
+        permuted = evaluate(labels, active)
+        if two_sided:
+            permuted = np.abs(permuted)
+        exceedances[active] += (permuted >= threshold[active]).sum(axis=0)
+        drawn[active] += size
+
+        if alpha is not None:
+            low, high = clopper_pearson(exceedances[active], drawn[active], confidence_level)
+            decided = (high < alpha) | (low > alpha)
+            active = active[~decided]
+
+    low, high = clopper_pearson(exceedances, drawn, confidence_level)
+    with np.errstate(invalid='ignore'):
+        p_values = (exceedances + 1) / (drawn + 1)
+    p_values[~np.isfinite(observed)] = np.nan
+    return {
+        'statistic': observed,
+        'p_value': p_values,
+        'n_permutations': drawn.astype(np.int64),
+        'p_value_ci_low': low,
+        'p_value_ci_high': high,
+        'stopped_early': drawn < n_permutations
+    }
@@ -0,0 +1,331 @@
+"""
+Regression Utilities
+Multi-outcome OLS via QR factorization or streamed normal equations
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+def _design(data: pd.DataFrame, predictors: List[str], add_intercept: bool) -> Tuple[np.ndarray, List[str]]:
+    """Design matrix and term names for the given predictor columns"""
+    X = data[predictors].to_numpy(dtype=float)
+    terms = list(predictors)
+    if add_intercept:
+        X = np.column_stack([np.ones(X.shape[0]), X])
+        terms = ['const'] + terms
+    return X, terms
+
+
+def _check_rank(diagonal: np.ndarray, terms: List[str]) -> None:
+    scale = np.abs(diagonal).max() if diagonal.size else 0.0
+    singular = np.abs(diagonal) <= scale * 1e-10
+    if singular.any():
+        dropped = [term for term, flag in zip(terms, singular) if flag]
+        raise ValueError(f"Design matrix is rank deficient (collinear terms: {dropped})")
+
+
+def qr_fit(X: np.ndarray, Y: np.ndarray,
+           terms: Optional[List[str]] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Least squares for many outcomes with a single QR factorization of X
+
+    Args:
+        X: Design matrix of shape (n, k)
+        Y: Outcome matrix of shape (n, m)
+        terms: Column names used in the rank-deficiency error message
+
+    Returns:
+        Tuple of (coefficients (k, m), (X'X)^-1 (k, k), residual sums of squares (m,))
+    """
+    from scipy.linalg import solve_triangular
+
+    Q, R = np.linalg.qr(X)
+    _check_rank(np.diag(R), terms or list(range(X.shape[1])))
+    coefficients = solve_triangular(R, Q.T @ Y)
+    residuals = Y - X @ coefficients
+    R_inverse = solve_triangular(R, np.eye(R.shape[0]))
+    return coefficients, R_inverse @ R_inverse.T, np.einsum('ij,ij->j', residuals, residuals)
+
+
+class StreamingOLS:
+    """
+    Normal-equation accumulator for regressions on data that does not fit in memory
+
+    Keeps X'X, X'Y and the outcome sums of squares over row chunks, with
+    predictors and outcomes shifted by the first chunk's means so the sums
+    stay well conditioned. The model always includes an intercept, which
+    absorbs the shifts. Fitting is one Cholesky solve of the k x k system
+    for all outcomes; accumulators from different workers can be combined
+    with merge().
+    """
+
+    def __init__(self, predictors: List[str], outcomes: List[str]):
+        """
+        Initialize an empty accumulator
+
+        Args:
+            predictors: Predictor columns read from each chunk
+            outcomes: Outcome columns read from each chunk
+        """
+        self.predictors = list(predictors)
+        self.outcomes = list(outcomes)
+        self.terms = ['const'] + self.predictors
+        self.n_rows = 0
+        self._x_shift = self._y_shift = None
+        self._xtx = self._xty = self._y_sums = self._y_squares = None
+
+    def update(self, chunk: pd.DataFrame) -> 'StreamingOLS':
+        """
+        Fold a chunk of rows into the normal equations (listwise deletion)
+
+        Returns:
+            self, so calls can be chained
+        """
+        complete = chunk[self.predictors + self.outcomes].dropna()
+        if complete.empty:
+            return self
+        X = complete[self.predictors].to_numpy(dtype=float)
+        Y = complete[self.outcomes].to_numpy(dtype=float)
+        if self._x_shift is None:
+            self._x_shift, self._y_shift = X.mean(axis=0), Y.mean(axis=0)
+            k = len(self.terms)
+            self._xtx = np.zeros((k, k))
+            self._xty = np.zeros((k, Y.shape[1]))
+            self._y_sums = np.zeros(Y.shape[1])
+            self._y_squares = np.zeros(Y.shape[1])
+        X = np.column_stack([np.ones(X.shape[0]), X - self._x_shift])
+        Y = Y - self._y_shift
+        self._xtx += X.T @ X
+        self._xty += X.T @ Y
+        self._y_sums += Y.sum(axis=0)
+        self._y_squares += np.einsum('ij,ij->j', Y, Y)
+        self.n_rows += X.shape[0]
+        return self
+
+    def merge(self, other: 'StreamingOLS') -> 'StreamingOLS':
+        """
+        Combine another accumulator over the same columns into this one
+
+        The other accumulator's sums are re-expressed around this one's
+        shifts before being added.
+
+        Returns:
+            self, so calls can be chained
+        """
+        if other._x_shift is None:
+            return self
+        if self._x_shift is None:
+            self.n_rows = other.n_rows
+            for name in ('_x_shift', '_y_shift', '_xtx', '_xty', '_y_sums', '_y_squares'):
+                setattr(self, name, getattr(other, name).copy())
+            return self
+
+        # A value v in the other frame is v - a in this frame; the constant column has a = 0
+        a_x = np.concatenate([[0.0], self._x_shift - other._x_shift])
+        a_y = self._y_shift - other._y_shift
+        n = other.n_rows
+        sums_x, sums_y = other._xtx[0], other._y_sums
+        self._xtx += other._xtx - np.outer(sums_x, a_x) - np.outer(a_x, sums_x) + n * np.outer(a_x, a_x)
+        self._xty += other._xty - np.outer(sums_x, a_y) - np.outer(a_x, sums_y) + n * np.outer(a_x, a_y)
+        self._y_squares += other._y_squares - 2 * a_y * sums_y + n * a_y * a_y
+        self._y_sums += sums_y - n * a_y
+        self.n_rows += n
+        return self
+
+    def fit(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Solve the accumulated normal equations
+
+        Returns:
+            Tuple of (coefficients (k, m), (X'X)^-1, residual sums of squares,
+            total sums of squares), expressed on the original (unshifted) scale
+        """
+        from scipy.linalg import cho_factor, cho_solve
+
+        if self._x_shift is None:
+            raise ValueError("No complete rows have been added to the accumulator")
+        try:
+            factor = cho_factor(self._xtx)
+        except np.linalg.LinAlgError:
+            raise ValueError(f"Design matrix is rank deficient (terms: {self.terms})") from None
+        _check_rank(np.diag(factor[0]) ** 2, self.terms)
+        coefficients = cho_solve(factor, self._xty)
+        xtx_inverse = cho_solve(factor, np.eye(len(self.terms)))
+        sse = np.maximum(self._y_squares - np.einsum('km,km->m', coefficients, self._xty), 0.0)
+        sst = self._y_squares - self._y_sums ** 2 / self.n_rows
+
+        # Undo the shifts: only the intercept (and its covariances) change
+        transform = np.eye(len(self.terms))
+        transform[0, 1:] = -self._x_shift
+        coefficients = transform @ coefficients
+        coefficients[0] += self._y_shift
+        xtx_inverse = transform @ xtx_inverse @ transform.T
+        return coefficients, xtx_inverse, sse, sst
+
+    def variance_inflation_factors(self) -> pd.Series:
+        """VIFs from the accumulated predictor cross products"""
+        n, sums = self._xtx[0, 0], self._xtx[0, 1:]
+        covariance = self._xtx[1:, 1:] - np.outer(sums, sums) / n
+        scale = np.sqrt(np.diag(covariance))
+        return _vif_from_correlation(covariance / np.outer(scale, scale), self.predictors)
+
+
+def regression_tables(coefficients: np.ndarray, xtx_inverse: np.ndarray,
+                      sse: np.ndarray, sst: np.ndarray, n: Union[int, np.ndarray],
+                      terms: List[str], outcomes: List[str], has_intercept: bool,
+                      confidence_level: float = 0.95) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Coefficient and model-fit tables from a solved least-squares system
+
+    Returns:
+        Tuple of (long coefficient table, per-outcome model table)
+    """
+    from scipy.stats import f as f_dist
+    from scipy.stats import t as t_dist
+
+    k = len(terms)
+    n = np.broadcast_to(np.asarray(n, dtype=float), sse.shape)
+    df_resid = n - k
+    df_model = k - int(has_intercept)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sigma2 = sse / df_resid
+        std_errors = np.sqrt(np.outer(np.diag(xtx_inverse), sigma2))
+        t_stat = coefficients / std_errors
+        p_values = 2 * t_dist.sf(np.abs(t_stat), df_resid)
+        margin = t_dist.ppf(0.5 + confidence_level / 2, df_resid) * std_errors
+
+        r_squared = 1 - sse / sst
+        adj_r_squared = 1 - (1 - r_squared) * (n - int(has_intercept)) / df_resid
+        f_stat = ((sst - sse) / df_model) / sigma2
+        f_p = f_dist.sf(f_stat, df_model, df_resid)
+
+    m = len(outcomes)
+    coefficient_table = pd.DataFrame({
+        'outcome': np.repeat(outcomes, k),
+        'term': np.tile(terms, m),
+        'coefficient': coefficients.T.ravel(),
+        'std_error': std_errors.T.ravel(),
+        't_statistic': t_stat.T.ravel(),
+        'p_value': p_values.T.ravel(),
+        'ci_low': (coefficients - margin).T.ravel(),
+        'ci_high': (coefficients + margin).T.ravel()
+    })
+    model_table = pd.DataFrame({
+        'n': n.astype(np.int64),
+        'r_squared': r_squared,
+        'adj_r_squared': adj_r_squared,
+        'f_statistic': f_stat,
+        'f_p_value': f_p,
+        'df_model': df_model,
+        'df_resid': df_resid.astype(np.int64),
+        'rmse': np.sqrt(sigma2)
+    }, index=pd.Index(outcomes, name='outcome'))
+    return coefficient_table, model_table
+
+
+def _vif_from_correlation(correlation: np.ndarray, predictors: List[str]) -> pd.Series:
+    """VIFs as the diagonal of the inverse predictor correlation matrix"""
+    if len(predictors) == 1:
+        return pd.Series([1.0], index=predictors, name='vif')
+    try:
+        vif = np.diag(np.linalg.inv(correlation))
+    except np.linalg.LinAlgError:
+        vif = np.full(len(predictors), np.inf)
+    return pd.Series(vif, index=predictors, name='vif')
+
+
+def variance_inflation_factors(X: np.ndarray, predictors: List[str]) -> pd.Series:
+    """
+    VIF of each predictor: diagonal of the inverse predictor correlation matrix
+
+    Args:
+        X: Predictor matrix without the constant column
+        predictors: Predictor names
+
+    Returns:
+        Series of VIFs (1 for a single predictor)
+    """
+    return _vif_from_correlation(np.atleast_2d(np.corrcoef(X, rowvar=False)), predictors)
+
+
+def ols(data: pd.DataFrame, outcomes: List[str], predictors: List[str],
+        add_intercept: bool = True, confidence_level: float = 0.95) -> Dict:
+    """
+    OLS of many outcomes on a shared set of predictors (listwise deletion)
+
+    Rows with missing predictors are dropped. Outcomes are then grouped by
+    their missing-value pattern, and every group is fitted with one QR
+    factorization of its design matrix - a single factorization when the
+    outcomes are complete. Outcomes with no more complete rows than terms
+    get NaN coefficient and model rows.
+
+    Returns:
+        Dictionary with 'coefficients' (long), 'model' (per outcome) and
+        'vif' (per predictor) tables
+    """
+    rows = data[predictors].notna().all(axis=1).to_numpy()
+    frame = data.loc[rows, list(predictors) + list(outcomes)]
+    X, terms = _design(frame, predictors, add_intercept)
+    Y = frame[outcomes].to_numpy(dtype=float)
+    observed = ~np.isnan(Y)
+
+    patterns: Dict[bytes, List[int]] = {}
+    for j in range(Y.shape[1]):
+        patterns.setdefault(np.packbits(observed[:, j]).tobytes(), []).append(j)
+
+    coefficient_tables, model_tables = [], []
+    for columns in patterns.values():
+        keep = observed[:, columns[0]]
+        X_fit, Y_fit = X[keep], Y[np.ix_(keep, columns)]
+        if X_fit.shape[0] <= X_fit.shape[1]:
+            # Too few complete rows for these outcomes: report NaN rather than
+            # failing the other patterns
+            coefficients = np.full((len(terms), len(columns)), np.nan)
+            xtx_inverse = np.full((len(terms), len(terms)), np.nan)
+            sse = sst = np.full(len(columns), np.nan)
+        else:
+            coefficients, xtx_inverse, sse = qr_fit(X_fit, Y_fit, terms)
+            if add_intercept:
+                sst = np.einsum('ij,ij->j', Y_fit - Y_fit.mean(axis=0), Y_fit - Y_fit.mean(axis=0))
+            else:
+                sst = np.einsum('ij,ij->j', Y_fit, Y_fit)
+        names = [outcomes[j] for j in columns]
+        tables = regression_tables(coefficients, xtx_inverse, sse, sst, X_fit.shape[0],
+                                   terms, names, add_intercept, confidence_level)
+        coefficient_tables.append(tables[0])
+        model_tables.append(tables[1])
+
+    order = {name: i for i, name in enumerate(outcomes)}
+    coefficient_table = pd.concat(coefficient_tables, ignore_index=True)
+    coefficient_table = coefficient_table.sort_values('outcome', key=lambda s: s.map(order), kind='stable')
+    return {
+        'coefficients': coefficient_table.reset_index(drop=True),
+        'model': pd.concat(model_tables).reindex(outcomes),
+        'vif': variance_inflation_factors(frame[predictors].to_numpy(dtype=float), list(predictors))
+    }
+
+
+def streaming_ols(chunks: Iterable[pd.DataFrame], outcomes: List[str], predictors: List[str],
+                  confidence_level: float = 0.95) -> Dict:
+    """
+    OLS from row chunks via accumulated normal equations (listwise deletion)
+
+    Returns:
+        Same tables as ols(), plus the number of rows used
+    """
+    accumulator = StreamingOLS(predictors, outcomes)
+    for chunk in chunks:
+        accumulator.update(chunk)
+    coefficients, xtx_inverse, sse, sst = accumulator.fit()
+    coefficient_table, model_table = regression_tables(
+        coefficients, xtx_inverse, sse, sst, accumulator.n_rows, accumulator.terms,
+        list(outcomes), True, confidence_level)
+    return {
+        'coefficients': coefficient_table,
+        'model': model_table,
+        'vif': accumulator.variance_inflation_factors(),
+        'n_rows': accumulator.n_rows
+    }
@@ -0,0 +1,60 @@
+"""
+Segment Reduction Utilities
+Vectorized per-group statistics over factorized group codes
+"""
+
+from typing import Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+def factorize_groups(keys: Union[pd.Series, np.ndarray, list]) -> Tuple[np.ndarray, pd.Index]:
+    """
+    Encode group keys as dense integer codes
+
+    Args:
+        keys: Group key per row
+
+    Returns:
+        Tuple of (codes, group labels); rows with a missing key get code -1
+    """
+    codes, uniques = pd.factorize(pd.Series(keys), sort=True)
+    return codes.astype(np.int64), pd.Index(uniques)
+
+
+def segment_medians(values: np.ndarray, codes: np.ndarray, n_groups: int) -> np.ndarray:
+    """
+    Per-group medians of one or many columns in a single sort
+
+    Every (column, group) pair is a segment; one lexsort orders all
+    observations by (segment, value), and each median is read from the
+    middle of its contiguous segment.
+
+    Args:
+        values: Observations, 1-D or (n, columns) (NaNs are ignored)
+        codes: Group code per row (negative codes are ignored)
+        n_groups: Number of groups
+
+    Returns:
+        Array of shape (n_groups,) or (n_groups, columns), NaN for groups
+        without observations
+    """
+    values = np.asarray(values, dtype=float)
+    block = values.reshape(values.shape[0], -1)
+    p = block.shape[1]
+    medians = np.full(n_groups * p, np.nan)
+    if n_groups and block.size:
+        valid = (codes >= 0)[:, None] & ~np.isnan(block)
+        segments = (codes[:, None] + n_groups * np.arange(p))[valid]
+        observed = block[valid]
+        ordered = observed[np.lexsort((observed, segments))]
+
+        counts = np.bincount(segments, minlength=n_groups * p)
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        present = counts > 0
+        lower = starts[present] + (counts[present] - 1) // 2
+        upper = starts[present] + counts[present] // 2
+        medians[present] = (ordered[lower] + ordered[upper]) / 2
+    medians = medians.reshape(p, n_groups).T
+    return medians.reshape((n_groups,) + values.shape[1:])
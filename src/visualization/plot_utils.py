@@ -10,6 +10,12 @@ import numpy as np
 from typing import Dict, List, Tuple, Optional, Union, Any
 import warnings
 
+try:
+    from ..utils.correlation import CORRELATION_METHODS, correlation_frame
+except ImportError:
+    # Imported as a top-level package (src/ on sys.path, see src/visualizer.py)
+    from utils.correlation import CORRELATION_METHODS, correlation_frame
+
 # Optional imports with graceful fallback
 try:
     import seaborn as sns
@@ -287,12 +293,11 @@ class EnterpriseVisualizer:
         Returns:
             matplotlib Figure object
         """
-        allowed_methods = ['pearson', 'spearman', 'kendall']
-        if method not in allowed_methods:
-            raise ValueError(f"method must be one of {allowed_methods}")
+        if method not in CORRELATION_METHODS:
+            raise ValueError(f"method must be one of {CORRELATION_METHODS}")
         
         # Calculate correlation matrix
-        corr_matrix = data.corr(method='pearson')
+        corr_matrix = correlation_frame(data, method=method)
         
         # Create heatmap
         fig, ax = plt.subplots(figsize=self.config['figure_size'])
@@ -362,12 +367,13 @@ class InteractiveDashboard:
     """Interactive dashboard creation utilities"""
     
     @staticmethod
-    def create_overview_dashboard(data: pd.DataFrame) -> Any:
+    def create_overview_dashboard(data: pd.DataFrame, correlation_method: str = 'pearson') -> Any:
         """
         Create interactive overview dashboard
         
         Args:
             data: DataFrame to visualize
+            correlation_method: Correlation method ('pearson', 'spearman', 'kendall')
             
         Returns:
             Plotly Figure object
@@ -404,7 +410,7 @@ class InteractiveDashboard:
         
         # Correlation Matrix Heatmap
         if len(numeric_cols) > 1:
-            corr_matrix = data[numeric_cols].corr(method='pearson')
+            corr_matrix = correlation_frame(data[numeric_cols], method=correlation_method)
             fig.add_trace(go.Heatmap(z=corr_matrix.values, x=corr_matrix.columns, y=corr_matrix.index, colorscale='Viridis'), row=2, col=2)
         
         fig.update_layout(title="Enterprise Data Overview Dashboard")
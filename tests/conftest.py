@@ -0,0 +1,10 @@
+"""
+Shared pytest configuration: make the src/ packages importable as in the scripts
+"""
+
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / 'src'
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
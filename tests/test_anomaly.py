@@ -0,0 +1,174 @@
+"""
+Tests for the robust anomaly screening kernels in utils.anomaly
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.anomaly import (DEFAULT_THRESHOLD, StreamingAnomalyDetector, detect_anomalies_frame,
+                           detect_anomalies_rolling, grouped_modified_z_scores, rolling_median_mad)
+from utils.data_utils import StatisticalAnalyzer
+from utils.segments import factorize_groups
+
+
+def _reference_rolling(frame: pd.DataFrame, window: int, min_periods: int):
+    rolling = frame.rolling(window, min_periods=min_periods)
+    mad = rolling.apply(lambda a: np.nanmedian(np.abs(a - np.nanmedian(a))), raw=True)
+    return rolling.median().to_numpy(), mad.to_numpy()
+
+
+@pytest.mark.parametrize('window, min_periods', [(50, None), (51, 10), (4, 1)])
+def test_rolling_median_mad_matches_pandas(window, min_periods):
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(1500, 3))
+    values[rng.random(values.shape) < 0.1] = np.nan
+
+    median, mad = rolling_median_mad(values, window, min_periods)
+    expected_median, expected_mad = _reference_rolling(pd.DataFrame(values), window,
+                                                       min_periods or window)
+    np.testing.assert_allclose(median, expected_median, equal_nan=True)
+    np.testing.assert_allclose(mad, expected_mad, equal_nan=True)
+
+    # A single series gives the same answer as its column in the batch
+    single_median, single_mad = rolling_median_mad(values[:, 1], window, min_periods)
+    np.testing.assert_allclose(single_median, median[:, 1], equal_nan=True)
+    np.testing.assert_allclose(single_mad, mad[:, 1], equal_nan=True)
+
+
+def test_rolling_median_mad_cost_does_not_scale_with_window():
+    # Sorted-window updates are O(log w) per step; recomputing every window
+    # would make the wide window about 100x slower than the narrow one
+    values = np.random.default_rng(1).normal(size=20000)
+
+    def best_time(window: int) -> float:
+        timings = []
+        for _ in range(2):
+            started = time.perf_counter()
+            rolling_median_mad(values, window)
+            timings.append(time.perf_counter() - started)
+        return min(timings)
+
+    assert best_time(10000) < 5 * best_time(100)
+
+
+def test_detect_anomalies_rolling_flags_spike_in_every_column():
+    rng = np.random.default_rng(2)
+    series = pd.Series(rng.normal(size=600))
+    series.iloc[400] = 50.0
+    frame = pd.DataFrame({'a': series, 'b': series * 2})
+
+    flags = detect_anomalies_rolling(frame, window=100)
+    assert flags.loc[400].all()
+    assert detect_anomalies_rolling(series, window=100).equals(flags['a'].rename(None))
+
+
+def _reference_grouped_scores(values: pd.Series, keys: pd.Series) -> pd.Series:
+    grouped = values.groupby(keys)
+    median = grouped.transform('median')
+    mad = (values - median).abs().groupby(keys).transform('median')
+    scores = 0.6745 * (values - median) / mad.where(mad != 0)
+    return scores.where(mad != 0, 0.0).where(values.notna() & keys.notna())
+
+
+def test_grouped_modified_z_scores_match_groupby():
+    rng = np.random.default_rng(3)
+    frame = pd.DataFrame(rng.normal(size=(400, 3)), columns=list('abc'))
+    frame.iloc[rng.random(frame.shape) < 0.05] = np.nan
+    keys = pd.Series(rng.integers(0, 5, 400)).where(rng.random(400) > 0.05)
+    codes, labels = factorize_groups(keys)
+
+    scores = grouped_modified_z_scores(frame.to_numpy(), codes, len(labels))
+    for j, column in enumerate(frame.columns):
+        expected = _reference_grouped_scores(frame[column], keys)
+        np.testing.assert_allclose(scores[:, j], expected.to_numpy(), equal_nan=True)
+
+    flags = detect_anomalies_frame(frame, group_by=keys)
+    np.testing.assert_array_equal(flags.to_numpy(), np.abs(scores) > DEFAULT_THRESHOLD)
+
+
+def test_detect_anomalies_frame_matches_per_column_detection():
+    rng = np.random.default_rng(4)
+    frame = pd.DataFrame({
+        'sales': rng.normal(size=300),
+        'visits': rng.standard_t(2, size=300),
+        'flat': np.where(rng.random(300) < 0.9, 7.0, rng.normal(size=300)),
+        'region': rng.choice(['n', 's'], 300)
+    }, index=pd.Index(rng.permutation(np.arange(1000, 1300)) * 3, name='order_id'))
+    frame.loc[frame.index[[5, 120]], 'sales'] = [15.0, -12.0]
+    frame[['sales', 'visits']] = frame[['sales', 'visits']].mask(rng.random((300, 2)) < 0.1)
+    numeric = ['sales', 'visits', 'flat']
+
+    mask = StatisticalAnalyzer.detect_anomalies_frame(frame)
+    labels = StatisticalAnalyzer.detect_anomalies_frame(frame, return_labels=True)
+    assert mask.columns.tolist() == numeric and mask.index.equals(frame.index)
+    assert list(labels) == numeric
+    for column in numeric:
+        series = frame[column]
+        positions, values = StatisticalAnalyzer.detect_anomalies(series)
+        expected = series.dropna().index[positions]
+        assert labels[column].equals(expected)
+        assert mask.index[mask[column]].equals(expected)
+        assert series.loc[expected].tolist() == values
+        assert not mask.loc[series.isna(), column].any()
+    assert {frame.index[5], frame.index[120]} <= set(labels['sales'])
+
+
+def test_grouped_detection_with_all_keys_missing():
+    data = pd.Series([1.0, 2.0, 50.0, 3.0])
+    keys = pd.Series([np.nan] * 4)
+
+    flags = StatisticalAnalyzer.detect_anomalies(data, group_by=keys)
+    assert not flags.any()
+    assert np.isnan(grouped_modified_z_scores(data.to_numpy(), factorize_groups(keys)[0], 0)).all()
+    assert not detect_anomalies_frame(data.to_frame(), group_by=keys).to_numpy().any()
+
+
+@pytest.mark.parametrize('values', [[1, 1, 1, 1, 50], [1, 2, 3, 100], [5.0, np.nan, -2.0, 7.5, 40.0, 6.0]])
+def test_streaming_detector_is_exact_for_small_streams(values):
+    series = pd.Series(values, dtype=float)
+    scores, flags = StreamingAnomalyDetector().observe(series)
+    positions, anomalous = StatisticalAnalyzer.detect_anomalies(series)
+
+    observed = series.notna().to_numpy()
+    clean = series.dropna().to_numpy()
+    median = np.median(clean)
+    mad = np.median(np.abs(clean - median))
+    expected = np.zeros_like(clean) if mad == 0 else 0.6745 * (clean - median) / mad
+    np.testing.assert_allclose(scores[observed], expected)
+    assert np.flatnonzero(flags[observed]).tolist() == positions
+    assert series[observed][flags[observed]].tolist() == anomalous
+
+
+def test_streaming_detector_tracks_median_and_mad():
+    values = np.random.default_rng(5).standard_t(4, size=100_000)
+    detector = StreamingAnomalyDetector()
+    for batch in np.array_split(values, 40):
+        detector.observe(batch)
+    median = np.median(values)
+    assert detector.count == values.size
+    # Rank error of the estimated median, and relative error of the MAD
+    assert abs(np.mean(values <= detector.median) - 0.5) < 0.002
+    assert detector.mad == pytest.approx(np.median(np.abs(values - median)), rel=0.01)
+
+
+@pytest.mark.parametrize('size', [300, 50_000])
+def test_streaming_detector_merge_matches_single_stream(size):
+    values = np.random.default_rng(6).lognormal(size=size)
+    single = StreamingAnomalyDetector()
+    single.observe(values)
+    parts = [StreamingAnomalyDetector() for _ in range(3)]
+    for detector, batch in zip(parts, np.array_split(values, 3)):
+        detector.observe(batch)
+    merged = parts[0].merge(parts[1]).merge(parts[2])
+
+    assert merged.count == single.count
+    if size <= 500:
+        # Still below the compression: both are exact
+        assert merged.median == np.median(values) == single.median
+        assert merged.mad == single.mad
+    else:
+        assert merged.median == pytest.approx(single.median, rel=0.01)
+        assert merged.mad == pytest.approx(single.mad, rel=0.01)
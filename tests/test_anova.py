@@ -0,0 +1,57 @@
+"""
+Tests for the summary-statistic ANOVA in utils.anova
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+from statsmodels.stats.oneway import anova_oneway
+
+from utils.anova import one_way_anova_frame
+
+
+@pytest.fixture
+def grouped() -> pd.DataFrame:
+    rng = np.random.default_rng(10)
+    n = 300
+    group = rng.choice(['a', 'b', 'c', 'd'], n, p=[0.4, 0.3, 0.2, 0.1])
+    shift = pd.Series(group).map({'a': 0.0, 'b': 0.2, 'c': 0.8, 'd': 0.1}).to_numpy()
+    frame = pd.DataFrame({
+        'group': group,
+        'y': 1e4 + rng.normal(size=n) * np.where(group == 'd', 2.5, 1.0) + shift,
+        'z': rng.normal(size=n)
+    })
+    frame['y'] = frame['y'].mask(rng.random(n) < 0.1)
+    return frame
+
+
+def _samples(grouped, outcome):
+    return [values.dropna().to_numpy() for _, values in grouped.groupby('group')[outcome]]
+
+
+def test_anova_matches_scipy_and_statsmodels(grouped):
+    anova = one_way_anova_frame(grouped, ['y', 'z'], 'group', post_hoc=False)['anova']
+    for outcome in ['y', 'z']:
+        samples = _samples(grouped, outcome)
+        classic = stats.f_oneway(*samples)
+        assert anova.loc[outcome, 'F'] == pytest.approx(classic.statistic, rel=1e-8)
+        assert anova.loc[outcome, 'p_value'] == pytest.approx(classic.pvalue, rel=1e-6)
+
+        welch = anova_oneway(samples, use_var='unequal')
+        assert anova.loc[outcome, 'welch_F'] == pytest.approx(welch.statistic, rel=1e-8)
+        assert anova.loc[outcome, 'welch_p_value'] == pytest.approx(welch.pvalue, rel=1e-6)
+        assert anova.loc[outcome, 'welch_df2'] == pytest.approx(welch.df[1], rel=1e-8)
+
+
+def test_tukey_hsd_matches_scipy(grouped):
+    tukey = one_way_anova_frame(grouped, ['y'], 'group')['tukey_hsd']
+    reference = stats.tukey_hsd(*_samples(grouped, 'y'))
+    interval = reference.confidence_interval(0.95)
+    levels = sorted(grouped['group'].unique())
+    for row in tukey.itertuples(index=False):
+        i, j = levels.index(row.level_1), levels.index(row.level_2)
+        assert row.mean_difference == pytest.approx(reference.statistic[i, j])
+        assert row.p_value == pytest.approx(reference.pvalue[i, j], rel=1e-4, abs=1e-10)
+        assert row.ci_low == pytest.approx(interval.low[i, j], rel=1e-6)
+        assert row.ci_high == pytest.approx(interval.high[i, j], rel=1e-6)
@@ -0,0 +1,48 @@
+"""
+Tests for the batched bootstrap in utils.bootstrap
+"""
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from utils.bootstrap import bootstrap_ci, cohens_d_statistic, pearson_statistic
+
+
+@pytest.fixture
+def samples():
+    rng = np.random.default_rng(8)
+    x = rng.exponential(size=80)
+    y = 0.5 * x + rng.normal(size=80)
+    return x, y
+
+
+def _assert_close_interval(result, reference, tolerance):
+    width = reference.confidence_interval.high - reference.confidence_interval.low
+    assert result['ci_low'] == pytest.approx(reference.confidence_interval.low, abs=tolerance * width)
+    assert result['ci_high'] == pytest.approx(reference.confidence_interval.high, abs=tolerance * width)
+    assert result['standard_error'] == pytest.approx(reference.standard_error, rel=tolerance)
+
+
+@pytest.mark.parametrize('method', ['percentile', 'bca'])
+def test_paired_interval_matches_scipy(samples, method):
+    result = bootstrap_ci(samples, pearson_statistic, paired=True, n_resamples=20000,
+                          method=method, random_state=0)
+    reference = stats.bootstrap(samples, lambda x, y, axis: pearson_statistic(x, y), paired=True, vectorized=True, axis=-1,
+                                n_resamples=20000, method=method, random_state=1)
+    assert result['estimate'] == pytest.approx(stats.pearsonr(*samples).statistic)
+    _assert_close_interval(result, reference, 0.05)
+
+
+def test_independent_bca_matches_scipy(samples):
+    groups = (samples[0], samples[1][:60] + 0.3)
+    result = bootstrap_ci(groups, cohens_d_statistic, n_resamples=20000, random_state=0)
+    reference = stats.bootstrap(groups, lambda a, b, axis: cohens_d_statistic(a, b), vectorized=True, axis=-1,
+                                n_resamples=20000, method='BCa', random_state=1)
+    _assert_close_interval(result, reference, 0.05)
+
+
+def test_seeded_intervals_are_reproducible(samples):
+    first = bootstrap_ci(samples, pearson_statistic, paired=True, n_resamples=500, random_state=3, chunk_size=64)
+    second = bootstrap_ci(samples, pearson_statistic, paired=True, n_resamples=500, random_state=3, chunk_size=64)
+    assert first == second
@@ -0,0 +1,106 @@
+"""
+Tests for the result cache in utils.cache
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils import cache
+from utils.data_utils import StatisticalAnalyzer
+
+
+@pytest.fixture(autouse=True)
+def no_active_cache():
+    cache.disable()
+    yield
+    cache.disable()
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    rng = np.random.default_rng(6)
+    return pd.DataFrame(rng.normal(size=(50, 3)), columns=['x', 'y', 'z'])
+
+
+def _counted(calls: list, **options):
+    @cache.memoized(**options)
+    def summarize(data: pd.DataFrame, column: str, scale: float = 1.0) -> dict:
+        calls.append(column)
+        return {'mean': float(data[column].mean()) * scale}
+    return summarize
+
+
+def test_memoized_hits_and_misses(frame):
+    calls = []
+    summarize = _counted(calls)
+    summarize(frame, 'x')
+    assert calls == ['x']
+
+    cache.enable()
+    first = summarize(frame, 'x')
+    first['mean'] = None  # returned values are copies
+    assert summarize(frame.copy(), 'x')['mean'] == pytest.approx(frame['x'].mean())
+    summarize(frame, 'x', scale=2.0)
+    summarize(frame.assign(x=frame['x'] + 1), 'x')
+    assert calls == ['x', 'x', 'x', 'x']
+    info = cache.active_cache().info()
+    assert (info['hits'], info['misses'], info['entries']) == (1, 3, 3)
+
+
+def test_lru_eviction(frame):
+    calls = []
+    summarize = _counted(calls)
+    cache.enable(max_entries=2)
+    summarize(frame, 'x')
+    summarize(frame, 'y')
+    summarize(frame, 'x')  # 'x' becomes most recently used
+    summarize(frame, 'z')  # evicts 'y'
+    summarize(frame, 'x')
+    summarize(frame, 'y')
+    assert calls == ['x', 'y', 'z', 'y']
+    assert cache.active_cache().info()['entries'] == 2
+
+
+def test_column_restricted_fingerprint(frame):
+    assert cache.fingerprint(frame, ['x']) == cache.fingerprint(frame.assign(y=0.0), ['x'])
+    assert cache.fingerprint(frame, ['x']) != cache.fingerprint(frame.assign(x=0.0), ['x'])
+    assert cache.fingerprint(frame) != cache.fingerprint(frame.rename(columns={'z': 'w'}))
+    assert cache.fingerprint(frame) != cache.fingerprint(frame.astype({'z': 'float32'}))
+
+    calls = []
+    summarize = _counted(calls, columns=lambda arguments: [arguments['column']])
+    cache.enable()
+    summarize(frame, 'x')
+    summarize(frame.assign(y=0.0), 'x')
+    assert calls == ['x']
+
+
+def test_disk_tier_and_version_salt(frame, tmp_path):
+    calls = []
+    cache.enable(max_entries=1, directory=tmp_path)
+    _counted(calls)(frame, 'x')
+    cache.enable(max_entries=1, directory=tmp_path)  # fresh memory tier, same directory
+    _counted(calls)(frame, 'x')
+    assert calls == ['x']
+    assert cache.active_cache().info()['disk_hits'] == 1
+
+    _counted(calls, version=2)(frame, 'x')
+    assert calls == ['x', 'x']
+
+
+def test_skip_and_analyzer_methods(frame):
+    calls = []
+    summarize = _counted(calls, skip=lambda arguments: arguments['scale'] < 0)
+    info = StatisticalAnalyzer.enable_cache()
+    assert info['entries'] == 0
+    summarize(frame, 'x', scale=-1.0)
+    summarize(frame, 'x', scale=-1.0)
+    assert calls == ['x', 'x']
+
+    first = StatisticalAnalyzer.check_assumptions(frame, ['x', 'y'], test_type='normality')
+    second = StatisticalAnalyzer.check_assumptions(frame, ['x', 'y'], test_type='normality')
+    assert first == second
+    assert StatisticalAnalyzer.cache_info()['hits'] == 1
+    StatisticalAnalyzer.disable_cache()
+    assert StatisticalAnalyzer.cache_info() is None
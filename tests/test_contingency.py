@@ -0,0 +1,75 @@
+"""
+Tests for the chi-square utilities in utils.contingency
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+from scipy.stats.contingency import association
+
+from utils.contingency import chi_square_matrix, sparse_chi_square, sparse_contingency_table
+from utils.data_utils import StatisticalAnalyzer
+
+
+@pytest.fixture
+def categories() -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    n = 600
+    frame = pd.DataFrame({
+        'a': rng.choice(list('xyz'), n),
+        'b': rng.choice(list('pq'), n),
+        'c': rng.choice(list('klmn'), n),
+        'd': rng.choice(list('uv'), n)
+    })
+    frame['b'] = np.where(rng.random(n) < 0.3, np.where(frame['a'] == 'x', 'p', 'q'), frame['b'])
+    return frame.mask(rng.random(frame.shape) < 0.05)
+
+
+@pytest.mark.parametrize('max_block_elements', [2 ** 24, 700])
+def test_chi_square_matrix_matches_scipy(categories, max_block_elements):
+    columns = list(categories.columns)
+    result = chi_square_matrix(categories, columns, max_block_elements=max_block_elements)
+    for i, first in enumerate(columns):
+        for j, second in enumerate(columns):
+            if i == j:
+                continue
+            table = pd.crosstab(categories[first], categories[second]).to_numpy()
+            expected = stats.chi2_contingency(table, correction=True)
+            assert result['chi2'][i, j] == pytest.approx(expected.statistic)
+            assert result['p_value'][i, j] == pytest.approx(expected.pvalue)
+            assert result['dof'][i, j] == expected.dof
+            assert result['n'][i, j] == table.sum()
+            assert result['cramers_v'][i, j] == pytest.approx(association(table, method='cramer'))
+
+
+def test_chi_square_matrix_degenerate_columns(categories):
+    data = categories.assign(constant='k', empty=None)
+    result = chi_square_matrix(data, ['a', 'constant', 'empty'])
+    assert result['dof'][0, 1] == 0 and result['p_value'][0, 1] == 1.0
+    assert result['dof'][0, 2] == 0 and result['n'][0, 2] == 0
+    assert result['n'][0, 0] == categories['a'].notna().sum()
+
+
+@pytest.mark.parametrize('first, second', [('a', 'c'), ('a', 'b'), ('b', 'd')])
+def test_sparse_chi_square_matches_dense_path(categories, first, second):
+    dense = StatisticalAnalyzer.chi_square_test(categories, first, second, sparse=False)
+    sparse = StatisticalAnalyzer.chi_square_test(categories, first, second, sparse=True)
+    assert sparse['chi2'] == pytest.approx(dense['chi2'])
+    assert sparse['p_value'] == pytest.approx(dense['p_value'])
+    assert sparse['dof'] == dense['dof']
+    np.testing.assert_allclose(np.asarray(sparse['expected']), dense['expected'])
+
+
+def test_sparse_chi_square_high_cardinality():
+    rng = np.random.default_rng(5)
+    first = rng.integers(0, 300, 5000)
+    second = (first // 3 + rng.integers(0, 40, 5000)) % 400
+    table = sparse_contingency_table(first, 300, second, 400)
+    chi2, dof, expected = sparse_chi_square(table)
+    dense = pd.crosstab(first, second).to_numpy()
+    reference = stats.chi2_contingency(dense)
+    assert chi2 == pytest.approx(reference.statistic)
+    assert dof == reference.dof
+    assert expected.shape == dense.shape
+    np.testing.assert_allclose(expected[:5, :7], reference.expected_freq[:5, :7])
@@ -0,0 +1,161 @@
+"""
+Tests for the correlation utilities in utils.correlation
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+import statsmodels.api as sm
+from scipy import stats
+from statsmodels.stats.multitest import multipletests
+
+from utils.correlation import (IncrementalCorrelation, _count_inversions, blocked_correlation_matrix,
+                               correlate_with_target, correlation_matrix_by_method, kendall_tau_b,
+                               top_correlated_pairs)
+from utils.data_utils import StatisticalAnalyzer
+
+
+@pytest.fixture
+def data_with_gaps() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame(rng.normal(size=(300, 6)), columns=list('abcdef'))
+    frame['b'] += frame['a']
+    frame['c'] = np.round(frame['c'])  # ties
+    frame = frame.mask(rng.random(frame.shape) < 0.15)
+    frame['f'] = frame['a'] * 2  # same missing mask as 'a'
+    return frame
+
+
+def _brute_force_inversions(sequence: np.ndarray) -> int:
+    return sum(int(sequence[i] > sequence[j])
+               for i in range(len(sequence)) for j in range(i + 1, len(sequence)))
+
+
+def test_count_inversions_matches_brute_force():
+    rng = np.random.default_rng(1)
+    for size in (0, 1, 2, 17, 64):
+        sequence = rng.integers(0, 6, size)
+        assert _count_inversions(sequence)[0] == _brute_force_inversions(sequence)
+
+    segments = np.repeat([0, 1, 2], [10, 0, 15])
+    sequence = rng.integers(0, 5, 25)
+    expected = [_brute_force_inversions(sequence[:10]), 0, _brute_force_inversions(sequence[10:])]
+    np.testing.assert_array_equal(_count_inversions(sequence, segments, 3), expected)
+
+
+@pytest.mark.parametrize('method', ['pearson', 'spearman', 'kendall'])
+def test_correlation_matrix_matches_pandas(data_with_gaps, method):
+    r, n, _ = correlation_matrix_by_method(data_with_gaps, method)
+    np.testing.assert_allclose(r, data_with_gaps.corr(method), atol=1e-12, equal_nan=True)
+    np.testing.assert_array_equal(n, data_with_gaps.notna().astype(int).T @ data_with_gaps.notna().astype(int))
+
+
+def test_spearman_with_target_matches_scipy(data_with_gaps):
+    features = ['b', 'c', 'd', 'e']
+    r, n, p_values = correlate_with_target(data_with_gaps, features, 'a', method='spearman')
+    for k, feature in enumerate(features):
+        expected = stats.spearmanr(data_with_gaps['a'], data_with_gaps[feature], nan_policy='omit')
+        assert r[k] == pytest.approx(expected.statistic)
+        assert p_values[k] == pytest.approx(expected.pvalue)
+
+
+def test_kendall_with_target_matches_scipy(data_with_gaps):
+    features = ['b', 'c', 'd', 'e']
+    tau, n, p_values = correlate_with_target(data_with_gaps, features, 'a', method='kendall')
+    for k, feature in enumerate(features):
+        pair = data_with_gaps[['a', feature]].dropna()
+        expected = stats.kendalltau(pair['a'], pair[feature])
+        assert n[k] == len(pair)
+        assert tau[k] == pytest.approx(expected.statistic)
+        assert p_values[k] == pytest.approx(expected.pvalue)
+
+
+def test_kendall_tau_b_degenerate_inputs():
+    tau, n, p_value = kendall_tau_b(np.array([1.0, 1.0, 1.0]), np.array([1.0, 2.0, 3.0]))
+    assert np.isnan(tau) and n == 3 and np.isnan(p_value)
+    assert kendall_tau_b(np.array([np.nan, 1.0]), np.array([1.0, 2.0]))[1] == 1
+
+
+def test_correlation_analysis_matches_scipy(data_with_gaps):
+    results = StatisticalAnalyzer.correlation_analysis(data_with_gaps, 'a', ['b', 'c', 'd'], correction='holm')
+    p_values = []
+    for feature in ['b', 'c', 'd']:
+        pair = data_with_gaps[['a', feature]].dropna()
+        expected = stats.pearsonr(pair['a'], pair[feature])
+        assert results['correlations'][feature]['correlation'] == pytest.approx(expected.statistic)
+        assert results['correlations'][feature]['p_value'] == pytest.approx(expected.pvalue)
+        p_values.append(expected.pvalue)
+    adjusted = multipletests(p_values, method='holm')[1]
+    for feature, expected in zip(['b', 'c', 'd'], adjusted):
+        assert results['correlations'][feature]['p_value_adjusted'] == pytest.approx(expected)
+
+
+@pytest.mark.parametrize('block_size', [2, 16])
+def test_blocked_correlation_matrix_matches_pandas(data_with_gaps, tmp_path, block_size):
+    complete = data_with_gaps.fillna(0.0)
+    chunks = [complete.iloc[:100], data_with_gaps.iloc[100:250], data_with_gaps.iloc[250:]]
+    expected = pd.concat(chunks)
+    r, labels, n_rows = blocked_correlation_matrix(iter(chunks), tmp_path / 'r.npy', block_size=block_size,
+                                                   workdir=tmp_path)
+    assert labels == list(data_with_gaps.columns) and n_rows == len(data_with_gaps)
+    np.testing.assert_allclose(np.asarray(r), expected.corr(), atol=1e-6)
+
+
+def test_top_correlated_pairs_matches_full_matrix():
+    rng = np.random.default_rng(14)
+    base = rng.normal(size=(400, 4))
+    frame = pd.DataFrame(np.repeat(base, 5, axis=1) + rng.normal(scale=1.5, size=(400, 20)),
+                         columns=[f'v{j}' for j in range(20)])
+    frame = frame.mask(rng.random(frame.shape) < 0.05)
+    full = frame.corr().where(np.triu(np.ones((20, 20), dtype=bool), k=1)).stack()
+    expected = full.reindex(full.abs().sort_values(ascending=False).index)[:10]
+
+    for sketch_dim in (None, 64):
+        pairs = top_correlated_pairs(frame, k=10, block_size=6, sketch_dim=sketch_dim, random_state=0)
+        found = set(zip(pairs['variable_1'], pairs['variable_2']))
+        assert found == set(expected.index)
+        np.testing.assert_allclose(pairs['correlation'], expected.to_numpy(), atol=1e-12)
+
+
+def test_partial_correlations_match_residual_regressions(data_with_gaps):
+    columns = ['a', 'b', 'c', 'd']
+    result = StatisticalAnalyzer.partial_correlations(data_with_gaps, columns)
+    complete = data_with_gaps[columns].dropna()
+    assert result['n'] == len(complete)
+    for first, second in [('a', 'b'), ('b', 'd'), ('c', 'd')]:
+        controls = sm.add_constant(complete[[c for c in columns if c not in (first, second)]])
+        residuals = [sm.OLS(complete[column], controls).fit().resid for column in (first, second)]
+        expected = stats.pearsonr(*residuals).statistic
+        assert result['partial_correlation'].loc[first, second] == pytest.approx(expected)
+
+        others = sm.add_constant(complete[[c for c in columns if c != first]])
+        fit = sm.OLS(complete[first], others).fit()
+        assert result['p_value'].loc[first, second] == pytest.approx(fit.pvalues[second])
+
+
+def test_path_analysis_matches_standardized_ols(data_with_gaps):
+    paths = {'b': ['a'], 'd': ['a', 'b', 'c']}
+    result = StatisticalAnalyzer.path_analysis(data_with_gaps, paths)
+    complete = data_with_gaps[['a', 'b', 'c', 'd']].dropna()
+    standardized = (complete - complete.mean()) / complete.std()
+    for outcome, predictors in paths.items():
+        fit = sm.OLS(standardized[outcome], sm.add_constant(standardized[predictors])).fit()
+        rows = result['coefficients'].query('outcome == @outcome').set_index('predictor')
+        np.testing.assert_allclose(rows['beta'], fit.params[predictors], rtol=1e-8)
+        np.testing.assert_allclose(rows['std_error'], fit.bse[predictors], rtol=1e-8)
+        np.testing.assert_allclose(rows['p_value'], fit.pvalues[predictors], rtol=1e-6)
+        assert result['r_squared'][outcome] == pytest.approx(fit.rsquared)
+
+
+def test_incremental_correlation_matches_pandas(data_with_gaps):
+    first = IncrementalCorrelation().update(data_with_gaps.iloc[:90].fillna(0.0))
+    first.update(data_with_gaps.iloc[90:150])
+    second = IncrementalCorrelation().update(data_with_gaps.iloc[150:])
+    merged = first.merge(second).result(min_periods=3)
+
+    expected = pd.concat([data_with_gaps.iloc[:90].fillna(0.0), data_with_gaps.iloc[90:]])
+    pd.testing.assert_frame_equal(merged['correlation'], expected.corr(min_periods=3), atol=1e-10)
+    counts = expected.notna().astype(int)
+    np.testing.assert_array_equal(merged['n'], counts.T @ counts)
+    pair = expected[['a', 'b']].dropna()
+    assert merged['p_value'].loc['a', 'b'] == pytest.approx(stats.pearsonr(pair['a'], pair['b']).pvalue)
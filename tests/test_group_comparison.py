@@ -0,0 +1,47 @@
+"""
+Tests for the pairwise group comparisons in utils.group_comparison
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from utils.group_comparison import compare_groups
+
+
+@pytest.fixture
+def grouped() -> pd.DataFrame:
+    rng = np.random.default_rng(9)
+    n = 400
+    group = rng.choice(['a', 'b', 'c'], n)
+    frame = pd.DataFrame({
+        'group': group,
+        'score': rng.normal(size=n) * np.where(group == 'c', 3.0, 1.0) + (group == 'b'),
+        'time': rng.gamma(2.0, size=n)
+    })
+    frame['score'] = frame['score'].mask(rng.random(n) < 0.1)
+    return frame
+
+
+@pytest.mark.parametrize('equal_var', ['auto', True, False])
+def test_compare_groups_matches_scipy(grouped, equal_var):
+    result = compare_groups(grouped, ['score', 'time'], 'group', equal_var=equal_var)
+    assert len(result) == 6
+    for row in result.itertuples(index=False):
+        first = grouped.loc[grouped['group'] == row.level_1, row.outcome].dropna()
+        second = grouped.loc[grouped['group'] == row.level_2, row.outcome].dropna()
+        levene = stats.levene(first, second, center='median')
+        assert row.levene_statistic == pytest.approx(levene.statistic)
+        assert row.levene_p_value == pytest.approx(levene.pvalue)
+
+        student = row.equal_variance if equal_var == 'auto' else equal_var
+        assert row.equal_variance == (levene.pvalue > 0.05 if equal_var == 'auto' else equal_var)
+        t_test = stats.ttest_ind(first, second, equal_var=student)
+        assert row.t_statistic == pytest.approx(t_test.statistic)
+        assert row.p_value == pytest.approx(t_test.pvalue)
+        assert row.df == pytest.approx(t_test.df)
+        assert (row.n_1, row.n_2) == (len(first), len(second))
+
+        pooled = ((len(first) - 1) * first.var() + (len(second) - 1) * second.var()) / (len(first) + len(second) - 2)
+        assert row.cohens_d == pytest.approx((first.mean() - second.mean()) / np.sqrt(pooled))
@@ -0,0 +1,63 @@
+"""
+Tests for the batched Levene / Brown-Forsythe tests in utils.homogeneity
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from utils.data_utils import StatisticalAnalyzer
+from utils.homogeneity import homogeneity_tests
+
+
+@pytest.fixture
+def grouped() -> pd.DataFrame:
+    rng = np.random.default_rng(4)
+    n = 500
+    group = rng.choice(['a', 'b', 'c', 'd'], n)
+    scale = pd.Series(group).map({'a': 1.0, 'b': 1.0, 'c': 1.5, 'd': 3.0}).to_numpy()
+    frame = pd.DataFrame({
+        'group': group,
+        'site': rng.choice(['north', 'south'], n),
+        'equal': rng.normal(size=n),
+        'unequal': rng.normal(scale=scale),
+        'skewed': rng.exponential(size=n)
+    })
+    for column in ['equal', 'unequal', 'skewed']:
+        frame[column] = frame[column].mask(rng.random(n) < 0.1)
+    return frame
+
+
+@pytest.mark.parametrize('method, center', [('levene', 'mean'), ('brown_forsythe', 'median')])
+def test_homogeneity_tests_match_scipy(grouped, method, center):
+    outcomes = ['equal', 'unequal', 'skewed']
+    result = homogeneity_tests(grouped, outcomes, ['group', 'site'], method=method)
+    for outcome in outcomes:
+        for group in ['group', 'site']:
+            samples = [values.dropna() for _, values in grouped.groupby(group)[outcome]]
+            expected = stats.levene(*samples, center=center)
+            row = result.loc[(outcome, group)]
+            assert row['statistic'] == pytest.approx(expected.statistic)
+            assert row['p_value'] == pytest.approx(expected.pvalue)
+            assert row['df_within'] == sum(len(sample) for sample in samples) - len(samples)
+
+
+def test_check_assumptions_flags_single_group(grouped):
+    data = grouped.assign(single='only')
+    results = StatisticalAnalyzer.check_assumptions(data, ['unequal'], group_by=['group', 'single'],
+                                                    test_type='homogeneity')
+    assert results['unequal']['group']['equal_variance'] is False
+    assert results['unequal']['single']['equal_variance'] is None
+    assert results['unequal']['single']['interpretation'] == 'Insufficient data'
+
+
+def test_check_assumptions_reports_all_missing_grouping(grouped):
+    data = grouped.assign(unknown=np.nan)
+    results = StatisticalAnalyzer.check_assumptions(data, ['equal', 'unequal'], group_by=['group', 'unknown'],
+                                                    test_type='homogeneity')
+    for outcome in ['equal', 'unequal']:
+        assert results[outcome]['unknown']['equal_variance'] is None
+        assert results[outcome]['unknown']['interpretation'] == 'Insufficient data'
+        assert results[outcome]['unknown']['df_between'] == 0
+    assert results['unequal']['group']['equal_variance'] is False
@@ -0,0 +1,76 @@
+"""
+Tests for the layouts of StatisticalAnalyzer.business_kpi_analysis
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.data_utils import StatisticalAnalyzer
+
+METRIC_FIELDS = ['current_value', 'baseline_average', 'overall_average', 'percentage_change',
+                 'trend_slope', 'trend_significance', 'r_squared', 'volatility']
+
+
+@pytest.fixture
+def kpis() -> pd.DataFrame:
+    rng = np.random.default_rng(15)
+    n = 120
+    frame = pd.DataFrame({
+        'date': pd.date_range('2025-01-01', periods=n),
+        'revenue': 100 + 0.5 * np.arange(n) + rng.normal(size=n),
+        'churn': 5 - 0.02 * np.arange(n) + rng.normal(scale=0.1, size=n),
+        'nps': rng.normal(size=n),
+        'short': [1.0] * 10 + [np.nan] * (n - 10)
+    })
+    # Rows arrive out of order; the analysis sorts them by date
+    return frame.iloc[rng.permutation(n)]
+
+
+def test_frame_matches_dict_layout(kpis):
+    metrics = ['revenue', 'churn', 'nps', 'short', 'missing']
+    nested = StatisticalAnalyzer.business_kpi_analysis(kpis, metrics)
+    frame = StatisticalAnalyzer.business_kpi_analysis(kpis, metrics, output='frame')
+
+    assert frame['metric'].tolist() == list(nested) == ['revenue', 'churn', 'nps']
+    for row in frame.itertuples(index=False):
+        expected = nested[row.metric]
+        for field in METRIC_FIELDS:
+            assert getattr(row, field) == pytest.approx(expected[field])
+        assert row.performance == expected['performance']
+        assert row.interpretation == expected['interpretation']
+    assert nested['revenue']['performance'] == 'improving'
+    assert nested['churn']['interpretation'] == 'Significant declining trend'
+
+
+def test_frame_dtypes(kpis):
+    frame = StatisticalAnalyzer.business_kpi_analysis(kpis, ['revenue', 'churn', 'nps'], output='frame')
+    assert frame['metric'].dtype == pd.StringDtype()
+    assert (frame[METRIC_FIELDS].dtypes == np.float64).all()
+    assert isinstance(frame['performance'].dtype, pd.CategoricalDtype)
+    assert frame['performance'].cat.categories.tolist() == ['improving', 'declining', 'stable']
+    assert isinstance(frame['interpretation'].dtype, pd.CategoricalDtype)
+    assert len(frame['interpretation'].cat.categories) == 6
+
+    empty = StatisticalAnalyzer.business_kpi_analysis(kpis, ['short'], output='frame')
+    assert empty.empty and empty.columns.tolist() == frame.columns.tolist()
+
+
+def test_arrow_output_round_trips_through_parquet(kpis, tmp_path):
+    pa = pytest.importorskip('pyarrow')
+    pq = pytest.importorskip('pyarrow.parquet')
+    metrics = ['revenue', 'churn', 'nps']
+    frame = StatisticalAnalyzer.business_kpi_analysis(kpis, metrics, output='frame')
+    table = StatisticalAnalyzer.business_kpi_analysis(kpis, metrics, output='arrow')
+    assert isinstance(table, pa.Table)
+    assert pa.types.is_dictionary(table.schema.field('performance').type)
+
+    pq.write_table(table, tmp_path / 'kpis.parquet')
+    restored = pd.read_parquet(tmp_path / 'kpis.parquet')
+    pd.testing.assert_frame_equal(restored, frame, check_dtype=False, check_categorical=False)
+    assert isinstance(restored['interpretation'].dtype, pd.CategoricalDtype)
+
+
+def test_unknown_output_is_rejected(kpis):
+    with pytest.raises(ValueError, match='output'):
+        StatisticalAnalyzer.business_kpi_analysis(kpis, ['revenue'], output='records')
@@ -0,0 +1,66 @@
+"""
+Tests for the batched IRLS logistic regression in utils.logistic
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+import statsmodels.api as sm
+
+from utils.logistic import logistic_regression, streaming_logistic_regression
+
+PREDICTORS = ['x1', 'x2']
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    rng = np.random.default_rng(13)
+    n = 800
+    data = pd.DataFrame(rng.normal(size=(n, 2)), columns=PREDICTORS)
+    eta = -0.4 + 1.2 * data['x1'] - 0.7 * data['x2']
+    data['buy'] = (rng.random(n) < 1 / (1 + np.exp(-eta))).astype(float)
+    # Survey-style 1/2 coding with missing answers
+    data['agree'] = np.where(rng.random(n) < 1 / (1 + np.exp(-0.5 * data['x2'])), 2.0, 1.0)
+    data['agree'] = data['agree'].mask(rng.random(n) < 0.15)
+    data['x1'] = data['x1'].mask(rng.random(n) < 0.05)
+    return data
+
+
+def _check_against_statsmodels(result, data, outcome, event):
+    complete = data[PREDICTORS + [outcome]].dropna()
+    reference = sm.Logit((complete[outcome] == event).astype(float),
+                         sm.add_constant(complete[PREDICTORS])).fit(disp=0)
+    coefficients = result['coefficients'].query('outcome == @outcome')
+    np.testing.assert_allclose(coefficients['coefficient'], reference.params, rtol=1e-6)
+    np.testing.assert_allclose(coefficients['std_error'], reference.bse, rtol=1e-5)
+    np.testing.assert_allclose(coefficients['p_value'], reference.pvalues, rtol=1e-4)
+    np.testing.assert_allclose(coefficients['odds_ratio'], np.exp(reference.params), rtol=1e-6)
+
+    model = result['model'].loc[outcome]
+    assert model['converged'] and model['n'] == reference.nobs
+    assert model['log_likelihood'] == pytest.approx(reference.llf, rel=1e-8)
+    assert model['null_log_likelihood'] == pytest.approx(reference.llnull, rel=1e-8)
+    assert model['pseudo_r_squared'] == pytest.approx(reference.prsquared, rel=1e-6)
+    assert model['llr_p_value'] == pytest.approx(reference.llr_pvalue, rel=1e-4)
+    assert model['aic'] == pytest.approx(reference.aic, rel=1e-8)
+
+
+def test_logistic_regression_matches_statsmodels(frame):
+    result = logistic_regression(frame, ['buy', 'agree'], PREDICTORS)
+    _check_against_statsmodels(result, frame, 'buy', 1.0)
+    _check_against_statsmodels(result, frame, 'agree', 2.0)
+
+
+def test_streaming_logistic_regression_matches_in_memory_fit(frame):
+    expected = logistic_regression(frame, ['buy', 'agree'], PREDICTORS)
+    result = streaming_logistic_regression(
+        lambda: (frame.iloc[start:start + 150] for start in range(0, len(frame), 150)),
+        ['buy', 'agree'], PREDICTORS)
+    _check_against_statsmodels(result, frame, 'buy', 1.0)
+    _check_against_statsmodels(result, frame, 'agree', 2.0)
+    pd.testing.assert_frame_equal(result['coefficients'], expected['coefficients'], rtol=1e-8)
+
+
+def test_non_binary_outcome_is_rejected(frame):
+    with pytest.raises(ValueError, match='exactly two'):
+        logistic_regression(frame.assign(score=np.arange(len(frame)) % 3), ['score'], PREDICTORS)
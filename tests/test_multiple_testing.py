@@ -0,0 +1,30 @@
+"""
+Tests for the p-value corrections in utils.multiple_testing
+"""
+
+import numpy as np
+import pytest
+from statsmodels.stats.multitest import multipletests
+
+from utils.multiple_testing import CORRECTION_METHODS, adjust_p_values
+
+
+@pytest.mark.parametrize('method', CORRECTION_METHODS)
+def test_adjust_p_values_matches_statsmodels(method):
+    rng = np.random.default_rng(7)
+    p_values = np.concatenate([rng.uniform(size=40), rng.uniform(0, 0.01, size=10), [0.02, 0.02]])
+    expected = multipletests(p_values, method=method)[1]
+    np.testing.assert_allclose(adjust_p_values(p_values, method), expected, rtol=1e-12)
+
+
+def test_missing_p_values_are_kept_and_not_counted():
+    p_values = np.array([[0.01, np.nan], [0.04, 0.03]])
+    adjusted = adjust_p_values(p_values, 'holm')
+    assert adjusted.shape == p_values.shape and np.isnan(adjusted[0, 1])
+    np.testing.assert_allclose(adjusted[~np.isnan(p_values)],
+                               multipletests([0.01, 0.04, 0.03], method='holm')[1])
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        adjust_p_values(np.array([0.5]), 'sidak')
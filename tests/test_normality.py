@@ -0,0 +1,69 @@
+"""
+Tests for the batched normality tests in utils.normality
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+from statsmodels.stats.diagnostic import normal_ad
+
+from utils.data_utils import StatisticalAnalyzer
+from utils.normality import normality_tests
+
+
+@pytest.fixture
+def columns() -> pd.DataFrame:
+    rng = np.random.default_rng(2)
+    frame = pd.DataFrame({
+        'normal': rng.normal(size=400),
+        'skewed': rng.exponential(size=400),
+        'heavy': rng.standard_t(3, size=400)
+    })
+    return frame.mask(rng.random(frame.shape) < 0.1)
+
+
+@pytest.mark.parametrize('method, reference', [
+    ('dagostino', stats.normaltest),
+    ('jarque_bera', stats.jarque_bera),
+    ('shapiro', stats.shapiro),
+    ('anderson', normal_ad)
+])
+def test_normality_tests_match_references(columns, method, reference):
+    result = normality_tests(columns, method=method, block_size=2)
+    for name in columns:
+        statistic, p_value = reference(columns[name].dropna().to_numpy())[:2]
+        assert result.loc[name, 'statistic'] == pytest.approx(statistic, rel=1e-8)
+        assert result.loc[name, 'p_value'] == pytest.approx(p_value, rel=1e-6, abs=1e-12)
+        assert result.loc[name, 'n'] == columns[name].notna().sum()
+
+
+def test_moments_match_scipy(columns):
+    result = normality_tests(columns, method='jarque_bera')
+    for name in columns:
+        values = columns[name].dropna()
+        assert result.loc[name, 'skewness'] == pytest.approx(stats.skew(values))
+        assert result.loc[name, 'kurtosis'] == pytest.approx(stats.kurtosis(values))
+
+
+@pytest.mark.parametrize('correction', [None, 'holm'])
+def test_check_assumptions_reports_untestable_columns(columns, correction):
+    data = columns.assign(short=[1.0, 2.0] + [np.nan] * (len(columns) - 2),
+                          constant=0.1,
+                          constant_small=[0.1] * 20 + [np.nan] * (len(columns) - 20))
+    untestable = ['short', 'constant', 'constant_small']
+    results = StatisticalAnalyzer.check_assumptions(data, ['normal', 'skewed'] + untestable,
+                                                    test_type='normality', correction=correction)
+    for name in untestable:
+        assert results[name]['normal'] is None
+        assert results[name]['interpretation'] == 'Insufficient data'
+        assert np.isnan(results[name]['p_value'])
+    assert results['skewed']['normal'] is False
+
+
+@pytest.mark.parametrize('method', ['auto', 'shapiro', 'dagostino', 'jarque_bera', 'anderson'])
+def test_constant_columns_are_untestable(method):
+    # 20 rows take the Shapiro-Wilk path under 'auto', 200 rows the Anderson-Darling path
+    data = pd.DataFrame({'short': [0.1] * 20 + [np.nan] * 180, 'long': [0.1] * 200})
+    result = normality_tests(data, method=method)
+    assert result[['statistic', 'p_value', 'skewness', 'kurtosis']].isna().all().all()
@@ -0,0 +1,70 @@
+"""
+Tests for the block-vectorized permutation tests in utils.permutation
+"""
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from utils.permutation import permutation_test
+
+
+@pytest.fixture
+def outcomes():
+    rng = np.random.default_rng(11)
+    codes = np.repeat([0, 1, 2], [30, 25, 20])
+    rng.shuffle(codes)
+    values = rng.normal(size=(codes.size, 3))
+    values[:, 0] += 0.35 * (codes == 1)
+    values[:, 2] = rng.exponential(size=codes.size) + 0.4 * (codes == 2)
+    return values, codes
+
+
+def _absolute(function):
+    return lambda *samples, axis: np.abs(function(*samples, axis=axis))
+
+
+def _mean_difference(first, second, axis):
+    return first.mean(axis=axis) - second.mean(axis=axis)
+
+
+def _welch_t(first, second, axis):
+    return stats.ttest_ind(first, second, equal_var=False, axis=axis).statistic
+
+
+def _f(*samples, axis):
+    return stats.f_oneway(*samples, axis=axis).statistic
+
+
+@pytest.mark.parametrize('statistic, reference, groups', [
+    ('mean_difference', _absolute(_mean_difference), 2),
+    ('welch_t', _absolute(_welch_t), 2),
+    ('f', _f, 3)
+])
+def test_permutation_test_matches_scipy(outcomes, statistic, reference, groups):
+    values, codes = outcomes
+    kept = codes < groups
+    values, codes = values[kept], codes[kept]
+    result = permutation_test(values, codes, statistic=statistic, n_permutations=20000,
+                              alpha=None, block_size=2000, random_state=0)
+    for j in range(values.shape[1]):
+        samples = [values[codes == level, j] for level in range(groups)]
+        expected = stats.permutation_test(samples, reference, permutation_type='independent',
+                                          vectorized=True, n_resamples=20000, alternative='greater',
+                                          random_state=1)
+        assert abs(result['statistic'][j]) == pytest.approx(expected.statistic)
+        assert result['p_value'][j] == pytest.approx(expected.pvalue, abs=0.015)
+        assert result['p_value_ci_low'][j] <= result['p_value'][j] <= result['p_value_ci_high'][j]
+    assert not result['stopped_early'].any()
+
+
+def test_early_stopping_is_seeded_and_decisive(outcomes):
+    values, codes = outcomes
+    values, codes = values[codes < 2], codes[codes < 2]
+    shifted = values.copy()
+    shifted[:, 1] += 3.0 * codes
+    first = permutation_test(shifted, codes, n_permutations=50000, block_size=500, random_state=4)
+    second = permutation_test(shifted, codes, n_permutations=50000, block_size=500, random_state=4)
+    for name in first:
+        np.testing.assert_array_equal(first[name], second[name])
+    assert first['stopped_early'][1] and first['p_value_ci_high'][1] < 0.05
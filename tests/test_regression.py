@@ -0,0 +1,95 @@
+"""
+Tests for the multi-outcome OLS in utils.regression
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+import statsmodels.api as sm
+from statsmodels.stats.outliers_influence import variance_inflation_factor
+
+from utils.data_utils import StatisticalAnalyzer
+from utils.regression import StreamingOLS, ols, streaming_ols
+
+PREDICTORS = ['x1', 'x2', 'x3']
+
+
+@pytest.fixture
+def frame() -> pd.DataFrame:
+    rng = np.random.default_rng(12)
+    n = 500
+    data = pd.DataFrame(rng.normal(size=(n, 3)) + 100.0, columns=PREDICTORS)
+    data['x3'] += 0.8 * data['x1']
+    data['y1'] = 2.0 + data @ np.array([0.5, -1.0, 0.3]) + rng.normal(size=n)
+    data['y2'] = 1e3 - 0.2 * data['x2'] + rng.normal(scale=2.0, size=n)
+    data['y3'] = data['y1'].mask(rng.random(n) < 0.2)
+    data['x2'] = data['x2'].mask(rng.random(n) < 0.05)
+    return data
+
+
+def _check_against_statsmodels(result, data, outcome, add_intercept=True):
+    complete = data[PREDICTORS + [outcome]].dropna()
+    exog = sm.add_constant(complete[PREDICTORS]) if add_intercept else complete[PREDICTORS]
+    reference = sm.OLS(complete[outcome], exog).fit()
+    coefficients = result['coefficients'].query('outcome == @outcome')
+    np.testing.assert_allclose(coefficients['coefficient'], reference.params, rtol=1e-7)
+    np.testing.assert_allclose(coefficients['std_error'], reference.bse, rtol=1e-6)
+    np.testing.assert_allclose(coefficients['p_value'], reference.pvalues, rtol=1e-5, atol=1e-300)
+    np.testing.assert_allclose(coefficients[['ci_low', 'ci_high']], reference.conf_int(), rtol=1e-7)
+
+    model = result['model'].loc[outcome]
+    assert model['n'] == reference.nobs
+    assert model['r_squared'] == pytest.approx(reference.rsquared, rel=1e-8)
+    assert model['adj_r_squared'] == pytest.approx(reference.rsquared_adj, rel=1e-8)
+    assert model['f_statistic'] == pytest.approx(reference.fvalue, rel=1e-6)
+
+
+@pytest.mark.parametrize('add_intercept', [True, False])
+def test_ols_matches_statsmodels(frame, add_intercept):
+    result = ols(frame, ['y1', 'y2', 'y3'], PREDICTORS, add_intercept=add_intercept)
+    for outcome in ['y1', 'y2', 'y3']:
+        _check_against_statsmodels(result, frame, outcome, add_intercept)
+    assert result['coefficients']['outcome'].unique().tolist() == ['y1', 'y2', 'y3']
+
+
+def test_vif_matches_statsmodels(frame):
+    complete = frame[PREDICTORS].dropna()
+    exog = sm.add_constant(complete).to_numpy()
+    expected = [variance_inflation_factor(exog, i + 1) for i in range(len(PREDICTORS))]
+    np.testing.assert_allclose(ols(frame, ['y1'], PREDICTORS)['vif'], expected, rtol=1e-8)
+
+
+def test_streaming_ols_matches_statsmodels(frame):
+    data = frame[PREDICTORS + ['y1', 'y2']]
+    chunks = [data.iloc[start:start + 120] for start in range(0, len(data), 120)]
+    result = streaming_ols(chunks, ['y1', 'y2'], PREDICTORS)
+    for outcome in ['y1', 'y2']:
+        _check_against_statsmodels(result, data, outcome)
+    np.testing.assert_allclose(result['vif'], ols(data, ['y1'], PREDICTORS)['vif'], rtol=1e-8)
+
+    merged = StreamingOLS(PREDICTORS, ['y1', 'y2']).update(chunks[0]).update(chunks[1])
+    merged.merge(StreamingOLS(PREDICTORS, ['y1', 'y2']).update(chunks[2]).update(chunks[3]).update(chunks[4]))
+    for expected, actual in zip(StreamingOLS(PREDICTORS, ['y1', 'y2']).update(data).fit(), merged.fit()):
+        np.testing.assert_allclose(actual, expected, rtol=1e-8)
+
+
+def test_rank_deficient_design(frame):
+    with pytest.raises(ValueError, match='rank deficient'):
+        ols(frame.assign(x4=2 * frame['x1']), ['y1'], PREDICTORS + ['x4'])
+    with pytest.raises(ValueError, match='rank deficient'):
+        streaming_ols([frame.assign(x4=2 * frame['x1'])], ['y1'], PREDICTORS + ['x4'])
+
+
+def test_ols_reports_unfittable_outcomes_as_nan(frame):
+    data = frame.assign(empty=np.nan, sparse=frame['y2'].where(frame.index < 3))
+    result = StatisticalAnalyzer.multiple_regression(data, ['y1', 'empty', 'sparse', 'y2'], PREDICTORS)
+    for outcome in ['empty', 'sparse']:
+        coefficients = result['coefficients'].query('outcome == @outcome')
+        assert len(coefficients) == len(PREDICTORS) + 1
+        assert coefficients[['coefficient', 'std_error', 'p_value']].isna().all().all()
+        assert not coefficients['significant'].any()
+        assert np.isnan(result['model'].loc[outcome, 'r_squared'])
+    assert result['model'].loc['sparse', 'n'] == data[PREDICTORS + ['sparse']].dropna().shape[0]
+    assert result['model'].loc['empty', 'n'] == 0
+    _check_against_statsmodels(result, data, 'y1')
+    _check_against_statsmodels(result, data, 'y2')
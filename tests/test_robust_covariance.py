@@ -0,0 +1,48 @@
+"""
+Tests for FAST-MCD and chunked Mahalanobis distances in utils.robust_covariance
+"""
+
+import numpy as np
+from scipy import stats
+from scipy.spatial.distance import mahalanobis
+
+from utils.robust_covariance import _c_step_until_converged, fast_mcd, mahalanobis_distances
+
+
+def test_mahalanobis_distances_match_scipy():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(50, 3))
+    location = X.mean(axis=0)
+    covariance = np.cov(X, rowvar=False)
+    precision = np.linalg.inv(covariance)
+
+    distances = mahalanobis_distances(X, location, covariance, chunk_size=7)
+    expected = [mahalanobis(row, location, precision) ** 2 for row in X]
+    np.testing.assert_allclose(distances, expected)
+
+
+def test_first_full_data_c_step_is_always_taken():
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(400, 2))
+    # A subsample fit with a tiny determinant must not block the full-data step
+    location, covariance, log_det = _c_step_until_converged(
+        X, X[:3].mean(axis=0), np.eye(2) * 1e-8, h=201, chunk_size=1000)
+
+    assert np.isclose(log_det, np.linalg.slogdet(covariance)[1])
+    assert np.linalg.det(covariance) > 1e-3
+    # Converged: the fit is the mean of its own h closest rows
+    closest = np.argsort(mahalanobis_distances(X, location, covariance))[:201]
+    np.testing.assert_allclose(X[closest].mean(axis=0), location)
+
+
+def test_fast_mcd_ignores_contamination():
+    rng = np.random.default_rng(2)
+    clean = rng.multivariate_normal([0, 0, 0], np.diag([1.0, 2.0, 0.5]), size=900)
+    outliers = rng.normal(8, 0.5, size=(100, 3))
+    X = np.vstack([clean, outliers])
+
+    location, covariance, distances = fast_mcd(X, random_state=0)
+    np.testing.assert_allclose(location, 0, atol=0.15)
+    # The consistency factor uses the median over all rows, so only the shape is exact
+    np.testing.assert_allclose(np.diag(covariance) / covariance[0, 0], [1.0, 2.0, 0.5], rtol=0.15)
+    assert (distances[900:] > stats.chi2.ppf(0.975, 3)).all()
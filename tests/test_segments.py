@@ -0,0 +1,33 @@
+"""
+Tests for the factorized group reductions in utils.segments
+"""
+
+import numpy as np
+import pandas as pd
+
+from utils.segments import factorize_groups, segment_medians
+
+
+def test_factorize_groups_marks_missing_keys():
+    codes, labels = factorize_groups(pd.Series(['b', None, 'a', 'b']))
+    assert codes.tolist() == [1, -1, 0, 1]
+    assert labels.tolist() == ['a', 'b']
+
+
+def test_segment_medians_match_groupby():
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(500, 3))
+    values[rng.random(values.shape) < 0.1] = np.nan
+    keys = pd.Series(rng.integers(0, 7, 500)).where(rng.random(500) > 0.05)
+    codes, labels = factorize_groups(keys)
+
+    medians = segment_medians(values, codes, len(labels))
+    expected = pd.DataFrame(values).groupby(keys).median().reindex(labels)
+    np.testing.assert_allclose(medians, expected.to_numpy(), equal_nan=True)
+    np.testing.assert_allclose(segment_medians(values[:, 2], codes, len(labels)), medians[:, 2],
+                               equal_nan=True)
+
+
+def test_segment_medians_without_groups():
+    assert segment_medians(np.arange(4.0), np.full(4, -1), 0).shape == (0,)
+    assert segment_medians(np.ones((4, 2)), np.full(4, -1), 0).shape == (0, 2)